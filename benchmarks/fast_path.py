@@ -0,0 +1,65 @@
+"""
+Benchmark fast path of getters against zeep, using a running vboxwebsrv.
+
+Each operation is called with the handle of the first machine, and the
+best time per call of several repeats is printed for both paths.
+
+Usage: python benchmarks/fast_path.py [--host HOST] [--port PORT]
+"""
+
+import timeit
+from argparse import ArgumentParser
+from getpass import getpass, getuser
+
+from vbox_api import SOAPInterface, VBoxAPI
+from vbox_api.interface.fastpath import FastOperation
+
+OPERATIONS = ("getState", "getName", "getId")
+
+
+def get_parser() -> ArgumentParser:
+    """Return argument parser instance."""
+    parser = ArgumentParser(description="Benchmark fast path against zeep")
+    parser.add_argument("--host", "-H", type=str, default="127.0.0.1")
+    parser.add_argument("--port", "-p", type=int, default=18083)
+    parser.add_argument(
+        "--number", "-n", type=int, default=200, help="calls per repeat"
+    )
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="repeats")
+    return parser
+
+
+def time_call(func, handle: str, number: int, repeat: int) -> float:
+    """Return best time per call of func in microseconds."""
+    timings = timeit.repeat(lambda: func(handle), number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+def main() -> None:
+    """Print time per call of fast path and zeep for each operation."""
+    args = get_parser().parse_args()
+    interface = SOAPInterface(args.host, args.port, fast_path=True)
+    interface.connect()
+    api = VBoxAPI(interface)
+    if not api.login(getuser(), getpass()):
+        raise SystemExit("Could not log in to the web service")
+    try:
+        handle = api.machines[0].handle
+        print(
+            f"{'Operation':<20}{'Fast path (us)':>16}{'Zeep (us)':>12}{'Speedup':>10}"
+        )
+        for operation_name in OPERATIONS:
+            operation = getattr(interface.IMachine, operation_name)
+            if not isinstance(operation, FastOperation):
+                print(f"{operation_name:<20}{'not supported':>16}")
+                continue
+            assert operation(handle) == operation.fallback(handle)
+            fast = time_call(operation, handle, args.number, args.repeat)
+            zeep = time_call(operation.fallback, handle, args.number, args.repeat)
+            print(f"{operation_name:<20}{fast:>16.1f}{zeep:>12.1f}{zeep / fast:>9.1f}x")
+    finally:
+        api.logout()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark getter dispatch of models, using a running vboxwebsrv.
+
+Properties are accessed through __getattr__ with the dispatch table shared
+per model class and proxy interface, then with the table rebuilt for every
+access, as before it was cached. The getter is replaced by a stub, so that
+only dispatch is timed, without a request to the web service.
+
+Usage: python benchmarks/getter_dispatch.py [--host HOST] [--port PORT]
+"""
+
+import timeit
+from argparse import ArgumentParser
+from getpass import getpass, getuser
+
+from vbox_api import SOAPInterface, VBoxAPI
+from vbox_api.mixins import get_class_method_names
+from vbox_api.models.base import BaseModel
+
+
+def get_parser() -> ArgumentParser:
+    """Return argument parser instance."""
+    parser = ArgumentParser(description="Benchmark getter dispatch of models")
+    parser.add_argument("--host", "-H", type=str, default="127.0.0.1")
+    parser.add_argument("--port", "-p", type=int, default=18083)
+    parser.add_argument(
+        "--number", "-n", type=int, default=1000, help="accesses per repeat"
+    )
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="repeats")
+    return parser
+
+
+def time_call(func, number: int, repeat: int) -> float:
+    """Return best time per call of func in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main() -> None:
+    """Print time per property access with cached and rebuilt dispatch tables."""
+    args = get_parser().parse_args()
+    interface = SOAPInterface(args.host, args.port)
+    interface.connect()
+    api = VBoxAPI(interface)
+    if not api.login(getuser(), getpass()):
+        raise SystemExit("Could not log in to the web service")
+    try:
+        api.ctx.property_cache = None
+        machine = api.machines[0]
+        name = machine.name
+        machine.__dict__["get_name"] = lambda: name
+        proxy_interface = machine._proxy_interface
+
+        def access_cached() -> None:
+            machine.name
+
+        def access_rebuilt() -> None:
+            get_class_method_names.cache_clear()
+            BaseModel._dispatch_tables.pop(proxy_interface, None)
+            machine.name
+
+        cached = time_call(access_cached, args.number, args.repeat)
+        rebuilt = time_call(access_rebuilt, args.number, args.repeat)
+        print(f"Shared dispatch table: {cached:.2f} us per access")
+        print(f"Rebuilt dispatch table: {rebuilt:.2f} us per access")
+        print(f"Speedup: {rebuilt / cached:.1f}x")
+    finally:
+        api.logout()
+
+
+if __name__ == "__main__":
+    main()
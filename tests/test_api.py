@@ -1,4 +1,21 @@
-from vbox_api.api import Context, Handle, VBoxAPI
+import asyncio
+from typing import Optional
+
+from zeep.exceptions import Fault
+
+from vbox_api.api import (
+    AsyncVBoxAPI,
+    Context,
+    Handle,
+    MachineStateCache,
+    MediumIndex,
+    ProgressTracker,
+    ReferenceTracker,
+    SessionPool,
+    TrackedProgress,
+    VBoxAPI,
+)
+from vbox_api.interface import AsyncSOAPInterface
 from vbox_api.models import Machine, VirtualBox
 
 
@@ -33,3 +50,176 @@ def test_get_machines(api: VBoxAPI) -> None:
     """Test getting machines from API."""
     machines = api.get_machines()
     assert all(isinstance(machine, Machine) for machine in machines)
+
+
+def test_interface_name_cache(api: VBoxAPI) -> None:
+    """Test interface names of handles are cached by Context instance."""
+    machines = api.get_machines()
+    assert all(machine.handle in api.ctx.interface_names for machine in machines)
+    assert api.ctx.get_interface_name_for_handle(machines[0].handle) == "Machine"
+
+
+def test_async_api(api: VBoxAPI) -> None:
+    """Test getting properties of models concurrently via asynchronous API."""
+
+    async def get_machine_names() -> list[str]:
+        interface = AsyncSOAPInterface(api.interface.interface.host)
+        interface.connect()
+        async_api = AsyncVBoxAPI(interface)
+        # Share session of synchronous API
+        async_api.handle = async_api.ctx.get_handle(api.handle)
+        try:
+            machines = await async_api.machines
+            return await asyncio.gather(*(machine.get_name() for machine in machines))
+        finally:
+            await interface.close()
+
+    assert asyncio.run(get_machine_names()) == [
+        machine.name for machine in api.machines
+    ]
+
+
+def test_machine_state_cache(api: VBoxAPI, random_machine: Machine) -> None:
+    """Test state of machines is mirrored by state cache."""
+    state_cache = MachineStateCache(api.ctx)
+    state_cache.start()
+    try:
+        assert state_cache.synced
+        assert len(state_cache) == len(api.machines)
+        status = state_cache.get_for_machine(random_machine)
+        assert status.name == random_machine.name
+        assert status.state == random_machine.state
+    finally:
+        state_cache.stop()
+    assert not state_cache.synced
+
+
+def test_session_pool(api: VBoxAPI, random_machine: Machine) -> None:
+    """Test sessions are reused to lock machines."""
+    original_pool = api.ctx.session_pool
+    session_pool = SessionPool(api.ctx, maxsize=1, timeout=60)
+    api.ctx.session_pool = session_pool
+    try:
+        for _ in range(3):
+            with random_machine.with_lock() as locked_machine:
+                assert locked_machine.session.is_locked
+        statistics = session_pool.get_statistics()
+        assert statistics.created == 1
+        assert statistics.reused == 2
+        assert statistics.active == 0
+        assert statistics.idle == 1
+    finally:
+        api.ctx.session_pool = original_pool
+        session_pool.clear()
+
+
+def test_release_scope(api: VBoxAPI, random_machine: Machine) -> None:
+    """Test handles referenced only within release scope are released."""
+    original_tracker = api.ctx.reference_tracker
+    reference_tracker = ReferenceTracker(api.ctx, interval=60)
+    api.ctx.reference_tracker = reference_tracker
+    try:
+        with api.ctx.release_scope() as scope:
+            audio_settings = random_machine.get_audio_settings()
+            scope.keep(random_machine)
+        assert str(audio_settings.handle) in scope.handles
+        assert str(audio_settings.handle) in scope.released
+        assert not scope.released & scope.kept
+        assert reference_tracker.flush() == len(scope.released)
+        assert reference_tracker.get_statistics().pending == 0
+    finally:
+        reference_tracker.stop()
+        api.ctx.reference_tracker = original_tracker
+
+
+def test_medium_index(api: VBoxAPI) -> None:
+    """Test mediums are found by ID, name and location from index."""
+    medium_index = MediumIndex(api.ctx)
+    mediums = api.get_mediums(include_children=True)
+    for medium in mediums:
+        for name_or_id in (medium.id, medium.name, medium.location):
+            found = medium_index.get(name_or_id)
+            assert found is not None
+            assert found.name == medium.name or found.id == medium.id
+    assert medium_index.is_fresh() or not mediums
+    medium_index.invalidate()
+    assert not medium_index.is_fresh()
+
+
+class StubProgress:
+    """Stub of Progress model, completing with result code."""
+
+    def __init__(self, result_code: int = 0) -> None:
+        """Initialise pending progress."""
+        self.percent = 0
+        self.completed = False
+        self.result_code = result_code
+        self.error: Optional[Exception] = None
+
+    def get_percent(self) -> int:
+        """Return percentage of progress, raising error if set."""
+        if self.error is not None:
+            raise self.error
+        return self.percent
+
+    def get_completed(self) -> bool:
+        """Return whether progress completed."""
+        return self.completed
+
+    def get_result_code(self) -> int:
+        """Return result code of progress."""
+        return self.result_code
+
+    def get_error_info(self) -> None:
+        """Raise error, as error info is not stubbed."""
+        raise RuntimeError("Error info not available")
+
+
+def test_progress_tracker() -> None:
+    """Test updating, listing and pruning tracked operations."""
+    tracker = ProgressTracker(retention=60)
+    tracker.stop()
+    results = []
+    progress, failing = StubProgress(), StubProgress(result_code=1)
+    tracked = TrackedProgress("1", "Succeeding", progress, callback=results.append)
+    failed = TrackedProgress("2", "Failing", failing, callback=results.append)
+    tracker._tracked = {tracked.id: tracked, failed.id: failed}
+    progress.percent = 50
+    tracker._update(tracked)
+    assert tracked.percent == 50 and not tracked.completed
+    progress.percent, progress.completed = 100, True
+    failing.completed = True
+    tracker._update(tracked)
+    tracker._update(failed)
+    assert tracked.succeeded and tracked.finished is not None
+    assert not failed.succeeded and failed.error
+    assert [result.id for result in results] == ["1"]
+    assert tracker.get_all(pending=True) == []
+    assert tracker.get_all(pending=True, failed_within=60) == [failed]
+    assert tracker.get("1") == tracked and tracker.get("1") is not tracked
+    tracked.finished -= 120
+    tracker._prune()
+    assert tracker.get_all() == [failed]
+
+
+def test_progress_tracker_failures() -> None:
+    """Test operations remain pending until polling fails repeatedly."""
+    tracker = ProgressTracker(max_failures=2)
+    tracker.stop()
+    progress = StubProgress()
+    tracked = TrackedProgress("1", "Flaky", progress)
+    progress.error = ConnectionError("Connection reset")
+    tracker._update(tracked)
+    assert not tracked.completed and tracked.failures == 1
+    progress.error = None
+    tracker._update(tracked)
+    assert not tracked.completed and tracked.failures == 0
+    progress.error = ConnectionError("Connection reset")
+    tracker._update(tracked)
+    tracker._update(tracked)
+    assert tracked.completed and not tracked.succeeded
+    assert tracked.error == "Connection reset"
+    progress.error = Fault("Invalid managed object reference")
+    invalid = TrackedProgress("2", "Invalid", progress)
+    tracker._update(invalid)
+    assert invalid.completed and invalid.failures == 1
@@ -1,8 +1,56 @@
+import logging
+from pathlib import Path
+
 from flask.testing import FlaskClient
 
+from vbox_api.http.utils import is_log_line_allowed, iter_log_events, read_log_page
+
 
 def test_redirect_to_login(client: FlaskClient) -> None:
     """Test getting endpoint without session redirects to login page."""
     response = client.get("/", follow_redirects=True)
     assert len(response.history) == 1
     assert response.request.path == "/login"
+
+
+def test_read_log_page(tmp_path: Path) -> None:
+    """Test reading pages of log, newest first, filtered by level."""
+    path = tmp_path / "vbox-api.log"
+    lines = [
+        f"2024-01-01 00:00:0{index} | [{level}] Message {index}"
+        for index, level in enumerate(["INFO", "ERROR", "DEBUG", "WARNING", "INFO"])
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    page, before, size = read_log_page(str(path), limit=2)
+    assert page == lines[:2:-1]
+    assert size == path.stat().st_size
+    page, before, _ = read_log_page(str(path), before, limit=2)
+    assert page == lines[2:0:-1]
+    page, before, _ = read_log_page(str(path), before, limit=2)
+    assert page == lines[:1]
+    assert before is None
+    page, _, _ = read_log_page(str(path), level=logging.WARNING)
+    assert page == [lines[3], lines[1]]
+
+
+def test_log_level_filter() -> None:
+    """Test lines of log are filtered by minimum level."""
+    assert not is_log_line_allowed("")
+    assert is_log_line_allowed("Line without level")
+    assert not is_log_line_allowed("Line without level", logging.INFO)
+    assert is_log_line_allowed("[ERROR] Message", logging.WARNING)
+    assert not is_log_line_allowed("[INFO] Message", logging.WARNING)
+    assert not is_log_line_allowed("[UNKNOWN] Message", logging.DEBUG)
+
+
+def test_follow_log_max_duration(tmp_path: Path) -> None:
+    """Test following log ends after maximum duration with offset to resume."""
+    path = tmp_path / "vbox-api.log"
+    path.write_text("[INFO] First\n")
+    size = path.stat().st_size
+    with path.open("a") as fd:
+        fd.write("[INFO] Second\n")
+    events = list(iter_log_events(str(path), size, interval=0.01, max_duration=0))
+    assert events[0].startswith("event: log\n")
+    assert '"[INFO] Second"' in events[0]
+    assert events[-1] == f"id: {path.stat().st_size}\n\n"
@@ -1,4 +1,12 @@
+import json
+import os
+import time
+from pathlib import Path
+
 from vbox_api.api import VBoxAPI
+from vbox_api.interface import PythonicInterface, SOAPInterface, WSDLCache
+from vbox_api.interface.fastpath import FastOperation
+from vbox_api.interface.transport import PooledTransport
 from vbox_api.models import Machine
 
 
@@ -24,3 +32,111 @@ def test_get_interface_by_handle(api: VBoxAPI, random_machine: Machine) -> None:
     """Test getting interface name by handle returns correct string."""
     assert api.interface.get_interface_name_for_handle(api) == "VirtualBox"
     assert api.interface.get_interface_name_for_handle(random_machine) == "Machine"
+
+
+def test_pythonic_method_table_shared(api: VBoxAPI) -> None:
+    """Test Pythonic interfaces of the same interface share a method table."""
+    interface = PythonicInterface(api.interface.interface)
+    assert interface.get_method_table(
+        api.interface.interface
+    ) is api.interface.get_method_table(api.interface.interface)
+    assert interface.VirtualBox.get_machines is api.interface.VirtualBox.get_machines
+
+
+def test_return_types(api: VBoxAPI, random_machine: Machine) -> None:
+    """Test declared return types of methods are used to infer models."""
+    state_type = api.interface.get_return_type("Machine", "get_state")
+    assert state_type is not None and not state_type.may_contain_handles
+    machines_type = api.interface.get_return_type("VirtualBox", "get_machines")
+    assert machines_type is not None and machines_type.is_multiple
+    assert api.machines
+    assert api.interface.get_return_interface_name(machines_type) == "Machine"
+
+
+def test_transport_statistics(api: VBoxAPI) -> None:
+    """Test utilisation statistics of pooled transport are recorded."""
+    assert api.machines is not None
+    statistics = api.interface.interface.get_transport_statistics()
+    assert statistics.requests > 0
+    assert statistics.active == 0
+    assert 0 < statistics.opened_connections <= statistics.pool_maxsize
+
+
+def test_transport_idempotent_operations() -> None:
+    """Test only getters without side effects are retried."""
+    assert PooledTransport.is_idempotent("IMachine_getState")
+    assert not PooledTransport.is_idempotent("IMachine_launchVMProcess")
+    assert not PooledTransport.is_idempotent("IEventSource_getEvent")
+    assert not PooledTransport.is_idempotent("IWebsessionManager_getSessionObject")
+
+
+def test_fast_path(api: VBoxAPI, random_machine: Machine) -> None:
+    """Test fast path returns the same values as zeep."""
+    interface = SOAPInterface(api.interface.interface.host, fast_path=True)
+    interface.connect()
+    for operation in (interface.IMachine.getState, interface.IMachine.getName):
+        assert isinstance(operation, FastOperation)
+        assert operation(random_machine.handle) == operation.fallback(
+            random_machine.handle
+        )
+        prefix, suffix, headers = operation.get_template()
+        response = interface.transport.post_message(
+            interface.url,
+            prefix + random_machine.handle.encode("utf-8") + suffix,
+            headers,
+            operation.operation_name,
+        )
+        binding = operation.binding
+        assert operation.parse(response.content) == binding.process_reply(
+            interface.client, binding.get(operation.operation_name), response
+        )
+
+
+def test_wsdl_cache(tmp_path: Path) -> None:
+    """Test storing and loading documents and metadata of WSDL cache."""
+    url = "http://127.0.0.1:18083/?wsdl"
+    cache = WSDLCache(tmp_path)
+    assert cache.get(url) is None
+    cache.add(url, b"<definitions/>")
+    assert cache.get(url) == b"<definitions/>"
+    assert cache.get_metadata(url, "operations") is None
+    cache.set_metadata(url, "operations", {"IMachine_getName": "string"})
+    cache = WSDLCache(tmp_path)
+    assert cache.get(url) == b"<definitions/>"
+    assert cache.get_metadata(url, "operations") == {"IMachine_getName": "string"}
+
+
+def test_wsdl_cache_eviction(tmp_path: Path) -> None:
+    """Test expiry and eviction of WSDL cache entries."""
+    urls = [f"http://127.0.0.1:{port}/?wsdl" for port in (18083, 18084, 18085)]
+    cache = WSDLCache(tmp_path, max_age=60, max_entries=2)
+    for age, url in enumerate(urls):
+        cache.add(url, b"<definitions/>")
+        entry_path = cache._get_entry_path(url)
+        mtime = time.time() - 10 * (len(urls) - age)
+        os.utime(entry_path, (mtime, mtime))
+    cache.evict()
+    assert cache.get(urls[0]) is None
+    assert cache.get(urls[1]) == cache.get(urls[2]) == b"<definitions/>"
+    index_path = cache._get_entry_path(urls[1]) / WSDLCache.INDEX_NAME
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    index["created"] -= 120
+    index_path.write_text(json.dumps(index), encoding="utf-8")
+    assert cache.get(urls[1]) is None
+    assert not index_path.parent.exists()
+    assert cache.get(urls[2]) == b"<definitions/>"
+
+
+def test_wsdl_cache_validate(tmp_path: Path) -> None:
+    """Test validating WSDL cache entries against API version."""
+    url = "http://127.0.0.1:18083/?wsdl"
+    cache = WSDLCache(tmp_path)
+    assert cache.validate(url, "7_1")
+    cache.add(url, b"<definitions/>")
+    assert cache.get_api_version(url) is None
+    assert cache.validate(url, "7_1")
+    assert cache.get_api_version(url) == "7_1"
+    assert cache.validate(url, "7_1")
+    assert not cache.validate(url, "7_0")
+    assert cache.get(url) is None
+    assert cache.get_api_version(url) is None
@@ -1,6 +1,6 @@
 import pytest
 
-from vbox_api.api import VBoxAPI
+from vbox_api.api import PropertyCache, PropertyScope, VBoxAPI
 from vbox_api.models import Machine
 from vbox_api.models.base import BaseModel
 
@@ -42,3 +42,99 @@ def test_property_mixin(random_machine: Machine) -> None:
     """Test property mixin properties."""
     assert "name" in random_machine._getters
     assert random_machine._getters["name"]() == random_machine.name
+
+
+def test_getter_dispatch_table_cached(api: VBoxAPI, random_machine: Machine) -> None:
+    """Test getter dispatch table is shared per model class and proxy interface."""
+    table = random_machine._get_method_names_with_prefix("get")
+    assert "name" in table
+    assert random_machine._get_method_names_with_prefix("get") is table
+    for machine in api.machines:
+        assert machine._get_method_names_with_prefix("get") is table
+    tables = BaseModel._dispatch_tables[random_machine._proxy_interface]
+    assert tables[(Machine, "get")] is table
+    assert random_machine._get_method_names_with_prefix("set") is not table
+
+
+def test_property_cache(api: VBoxAPI, random_machine: Machine) -> None:
+    """Test property values are cached until invalidated."""
+    api.ctx.property_cache = PropertyCache(PropertyScope.MANUAL)
+    try:
+        name = random_machine.name
+        assert api.ctx.property_cache.get(random_machine.handle, "name") == name
+        random_machine.refresh()
+        assert (
+            api.ctx.property_cache.get(random_machine.handle, "name")
+            is PropertyCache.MISSING
+        )
+    finally:
+        api.ctx.property_cache = None
+
+
+def test_property_cache_request_scope(api: VBoxAPI, random_machine: Machine) -> None:
+    """Test property values are only cached within a request scope."""
+    property_cache = api.ctx.property_cache = PropertyCache(PropertyScope.REQUEST)
+    try:
+        name = random_machine.name
+        assert (
+            property_cache.get(random_machine.handle, "name") is PropertyCache.MISSING
+        )
+        with property_cache.request():
+            assert random_machine.name == name
+            assert property_cache.get(random_machine.handle, "name") == name
+        assert not property_cache.active
+        assert (
+            property_cache.get(random_machine.handle, "name") is PropertyCache.MISSING
+        )
+    finally:
+        api.ctx.property_cache = None
+
+
+def test_to_dict_fields(random_machine: Machine) -> None:
+    """Test projecting and fetching properties of model in parallel."""
+    info = random_machine.to_dict(fields=["name", "id"], parallel=True)
+    assert info == {"name": random_machine.name, "id": random_machine.id}
+    with pytest.raises(AttributeError):
+        random_machine.to_dict(fields=["non_existent_property"])
+
+
+def test_fleet_status(api: VBoxAPI) -> None:
+    """Test columnar status of all machines is fetched and cached."""
+    fleet_status = api.get_fleet_status(["id", "state", "health"])
+    assert len(fleet_status) == len(api.machines)
+    assert fleet_status["id"] == [machine.id for machine in api.machines]
+    assert fleet_status["health"] == [
+        machine.get_health() for machine in fleet_status.machines
+    ]
+    assert sum(fleet_status.count_by("health").values()) == len(fleet_status)
+    assert api.get_fleet_status(["id", "state", "health"]) is fleet_status
+
+
+def test_read_log_range(random_machine: Machine) -> None:
+    """Test reading ranges and tail of machine log."""
+    if not random_machine.log_indexes:
+        pytest.skip("Machine has no logs")
+    data = random_machine.read_log_range(0, 0, 64)
+    assert len(data) <= 64
+    assert random_machine.read_log_range(0, 16, 16) == data[16:32]
+    size = random_machine.get_log_size(0)
+    assert b"".join(random_machine.iter_log_chunks(0, size - 32)) == (
+        random_machine.read_log_range(0, size - 32, 32)
+    )
+    assert len(random_machine.tail(0, 5)) <= 5
+
+
+def test_fleet_operation(api: VBoxAPI, random_machine: Machine) -> None:
+    """Test snapshots of machines are taken concurrently with results."""
+    (result,) = api.snapshot_machines([random_machine], "Fleet", timeout=60)
+    try:
+        assert result.succeeded
+        assert result.machine is random_machine
+        assert result.progress.completed
+        assert result.progress.result_code == 0
+        assert random_machine.current_snapshot.name == "Fleet"
+    finally:
+        if result.progress is not None and result.progress.result_code == 0:
+            snapshot_id = random_machine.current_snapshot.id
+            with random_machine.with_lock() as locked_machine:
+                locked_machine.delete_snapshot(snapshot_id).wait_for_completion(-1)
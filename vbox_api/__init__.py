@@ -1,6 +1,20 @@
 """Object-oriented Python bindings to the VirtualBox SOAP API."""
 
-from vbox_api.api import VBoxAPI
-from vbox_api.interface import PythonicInterface, SOAPInterface
+from vbox_api.api import AsyncVBoxAPI, VBoxAPI
+from vbox_api.interface import (
+    AsyncSOAPInterface,
+    PythonicInterface,
+    SOAPInterface,
+    TransportConfig,
+    WSDLCache,
+)
 
-__all__ = ["PythonicInterface", "SOAPInterface", "VBoxAPI"]
+__all__ = [
+    "AsyncSOAPInterface",
+    "AsyncVBoxAPI",
+    "PythonicInterface",
+    "SOAPInterface",
+    "TransportConfig",
+    "VBoxAPI",
+    "WSDLCache",
+]
@@ -1,8 +1,43 @@
 """General API classes to provide an entry point and store current state."""
 
+from vbox_api.api.cache import LRUCache, PropertyCache, PropertyScope
 from vbox_api.api.context import Context
-from vbox_api.api.core import VBoxAPI
+from vbox_api.api.core import AsyncVBoxAPI, VBoxAPI
 from vbox_api.api.handle import Handle
+from vbox_api.api.medium import MediumIndex
 from vbox_api.api.pool import MachinePool
+from vbox_api.api.progress import ProgressTracker, TrackedProgress
+from vbox_api.api.reference import (
+    ReferenceStatistics,
+    ReferenceTracker,
+    ReleasedHandleError,
+    ReleaseScope,
+)
+from vbox_api.api.session import SessionPool, SessionPoolStatistics
+from vbox_api.api.state import MachineStateCache, MachineStatus, StateChanges
+from vbox_api.api.thumbnail import Thumbnail, ThumbnailCache
 
-__all__ = ["Context", "Handle", "MachinePool", "VBoxAPI"]
+__all__ = [
+    "AsyncVBoxAPI",
+    "Context",
+    "Handle",
+    "LRUCache",
+    "MachinePool",
+    "MachineStateCache",
+    "MachineStatus",
+    "MediumIndex",
+    "ProgressTracker",
+    "PropertyCache",
+    "PropertyScope",
+    "ReferenceStatistics",
+    "ReferenceTracker",
+    "ReleasedHandleError",
+    "ReleaseScope",
+    "SessionPool",
+    "SessionPoolStatistics",
+    "StateChanges",
+    "Thumbnail",
+    "ThumbnailCache",
+    "TrackedProgress",
+    "VBoxAPI",
+]
@@ -0,0 +1,154 @@
+"""Module to provide caches for state shared between operations."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from enum import StrEnum
+from typing import Any, Optional
+
+
+class LRUCache:
+    """Thread-safe mapping, discarding least recently used items beyond maxsize."""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """Initialise empty cache with maximum size."""
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return number of items in cache."""
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return whether key is in cache, without updating its recency."""
+        return key in self._data
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """Add item to cache and discard least recently used items."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return value for key and mark as recently used, else default."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove key from cache and return its value, else default."""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove all items from cache."""
+        with self._lock:
+            self._data.clear()
+
+
+class PropertyScope(StrEnum):
+    """Enumeration for lifetime of cached property values."""
+
+    REQUEST = "request"
+    TTL = "ttl"
+    MANUAL = "manual"
+
+
+class PropertyCache:
+    """
+    Cache property values of models, keyed by handle and property name.
+
+    Values with REQUEST scope are stored per thread, only within a request
+    scope opened by the thread, and discarded when it is closed. Outside of
+    a request scope, such as in background threads, values are not cached.
+    Values with TTL scope expire after ttl seconds.
+    Values with MANUAL scope are kept until invalidated or refreshed.
+    """
+
+    MISSING = object()
+
+    def __init__(
+        self,
+        scope: PropertyScope = PropertyScope.REQUEST,
+        ttl: float = 1.0,
+        maxsize: int = 4096,
+    ) -> None:
+        """Initialise empty cache with scope and maximum number of handles."""
+        self.scope = PropertyScope(scope)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._values = LRUCache(maxsize)
+        self._local = threading.local()
+
+    @property
+    def values(self) -> Optional[LRUCache]:
+        """Return property values by handle for current scope, if any."""
+        if self.scope != PropertyScope.REQUEST:
+            return self._values
+        return getattr(self._local, "values", None)
+
+    @property
+    def active(self) -> bool:
+        """Return whether values are cached in current thread."""
+        return self.values is not None
+
+    def start_request(self) -> None:
+        """Open request scope in current thread, discarding any previous scope."""
+        self._local.values = LRUCache(self.maxsize)
+
+    def end_request(self) -> None:
+        """Close request scope of current thread and discard its values."""
+        self._local.values = None
+
+    @contextmanager
+    def request(self) -> Iterator["PropertyCache"]:
+        """Cache values with REQUEST scope within context manager."""
+        self.start_request()
+        try:
+            yield self
+        finally:
+            self.end_request()
+
+    def get(self, handle: str, name: str) -> Any:
+        """Return cached value of property for handle, else MISSING."""
+        if (values := self.values) is None:
+            return self.MISSING
+        properties = values.get(str(handle))
+        if properties is None or (item := properties.get(name)) is None:
+            return self.MISSING
+        value, timestamp = item
+        if self.scope == PropertyScope.TTL and time.monotonic() - timestamp > self.ttl:
+            properties.pop(name, None)
+            return self.MISSING
+        return value
+
+    def set(self, handle: str, name: str, value: Any) -> None:
+        """Store value of property for handle, if values are cached."""
+        if (values := self.values) is None:
+            return None
+        if (properties := values.get(str(handle))) is None:
+            properties = {}
+            values[str(handle)] = properties
+        properties[name] = (value, time.monotonic())
+
+    def invalidate(self, handle: str, name: Optional[str] = None) -> None:
+        """Remove cached value of property, or all properties, for handle."""
+        if (values := self.values) is None:
+            return None
+        if name is None:
+            values.pop(str(handle))
+        elif (properties := values.get(str(handle))) is not None:
+            properties.pop(name, None)
+
+    def clear(self) -> None:
+        """Remove all cached values of current scope."""
+        if (values := self.values) is not None:
+            values.clear()
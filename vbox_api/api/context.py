@@ -1,9 +1,14 @@
 """Module to assist storing current state of operations and models."""
 
-from dataclasses import dataclass
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import Optional
 
 from vbox_api import api
+from vbox_api.api.cache import LRUCache, PropertyCache
+from vbox_api.api.reference import ReferenceTracker, ReleaseScope
+from vbox_api.api.session import SessionPool
 from vbox_api.interface import PythonicInterface
 from vbox_api.models import Progress, Session
 
@@ -14,16 +19,65 @@ class Context:
 
     api: "api.VBoxAPI"
     interface: PythonicInterface
+    interface_names: LRUCache = field(default_factory=LRUCache)
+    property_cache: Optional[PropertyCache] = None
+    state_cache: Optional["api.MachineStateCache"] = None
+    thumbnail_cache: Optional["api.ThumbnailCache"] = None
+    progress_tracker: Optional["api.ProgressTracker"] = None
+    medium_index: Optional["api.MediumIndex"] = None
+    session_pool: Optional[SessionPool] = None
+    reference_tracker: Optional[ReferenceTracker] = None
+
+    def __post_init__(self) -> None:
+        """Create default pool of sessions and reference tracker, if not specified."""
+        if self.session_pool is None:
+            self.session_pool = SessionPool(self)
+        if self.reference_tracker is None:
+            self.reference_tracker = ReferenceTracker(self)
 
     @property
     def api_handle(self) -> Optional["api.Handle"]:
         """Return handle of API instance."""
         return self.api.handle
 
+    @contextmanager
+    def release_scope(self) -> Iterator[ReleaseScope]:
+        """Release handles referenced only by models within context manager."""
+        with self.reference_tracker.scope() as scope:
+            yield scope
+
     def get_handle(self, handle: str) -> "api.Handle":
         """Get Handle instance with current context and specified handle."""
         return api.Handle(self, handle)
 
+    def get_interface_name_for_handle(self, handle: str) -> Optional[str]:
+        """
+        Return interface name for handle.
+
+        Names are cached until the handle is released or the session ends,
+        as the interface of a managed object reference cannot change.
+        """
+        handle = str(handle)
+        if (interface_name := self.interface_names.get(handle)) is None:
+            if self.interface.is_async:
+                # Names must be resolved beforehand by the asynchronous method
+                return None
+            interface_name = self.interface.get_interface_name_for_handle(handle)
+            if interface_name:
+                self.interface_names[handle] = interface_name
+        return interface_name
+
+    async def get_interface_name_for_handle_async(self, handle: str) -> Optional[str]:
+        """Return interface name for handle from asynchronous interface."""
+        handle = str(handle)
+        if (interface_name := self.interface_names.get(handle)) is None:
+            interface_name = await self.interface.get_interface_name_for_handle_async(
+                handle
+            )
+            if interface_name:
+                self.interface_names[handle] = interface_name
+        return interface_name
+
     def get_session(self) -> Session:
         """Return Session object for Context instance."""
         return Session(self)
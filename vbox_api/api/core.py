@@ -22,3 +22,46 @@ class VBoxAPI(VirtualBox):
     def get_context(self) -> "api.Context":
         """Return instance of current Context for API."""
         return api.Context(api=self, interface=self.interface)
+
+
+class AsyncVBoxAPI(VBoxAPI):
+    """
+    Class to handle API methods via an asynchronous VirtualBox interface.
+
+    Interface methods of models return coroutines, including properties
+    accessed as attributes, such as 'await api.machines'.
+    """
+
+    def __init__(
+        self, interface: BaseInterface, handle: Optional["api.Handle"] = None
+    ) -> None:
+        """Initialise instance of API, ensuring interface is asynchronous."""
+        if not interface.is_async:
+            raise TypeError("Interface must be asynchronous")
+        super().__init__(interface, handle)
+
+    async def login(self, username: str, password: str, force: bool = False) -> bool:
+        """
+        Login with specified username and password.
+
+        If force is specified, attempt authentication even if already logged in.
+        """
+        if self.handle is not None and not force:
+            raise RuntimeError("Already logged in and force not specified")
+        try:
+            handle = await self.ctx.interface.WebsessionManager.logon(
+                username, password
+            )
+            await self.ctx.get_interface_name_for_handle_async(handle)
+            self.handle = self.ctx.get_handle(handle)
+            self.ctx.interface.set_api_version(await self.get_api_version())
+        except Exception:
+            return False
+        self._update_proxy_interface()
+        return True
+
+    async def logout(self) -> None:
+        """Logout current session."""
+        await self.ctx.interface.WebsessionManager.logoff(self.handle)
+        self.ctx.interface_names.clear()
+        self.handle = None
@@ -2,6 +2,8 @@
 
 import re
 
+from zeep.exceptions import Fault
+
 from vbox_api import api
 
 
@@ -24,11 +26,30 @@ class Handle(str):
     def release(self) -> None:
         """Release managed object reference."""
         self.ctx.interface.ManagedObjectRef.release(self)
+        self.ctx.interface_names.pop(self, None)
+        if self.ctx.property_cache is not None:
+            self.ctx.property_cache.invalidate(self)
 
     def is_valid(self) -> bool:
-        """Test handle is a valid managed object reference."""
-        interface = self.ctx.interface.get_interface_for_handle(self)
-        return bool(interface)
+        """
+        Test handle is a valid managed object reference.
+
+        The web service is always queried, as handles may have been released
+        or expired since their interface name was cached. Asynchronous
+        interfaces cannot be queried here, so the cached name is used.
+        Errors other than faults of the web service, such as of the
+        transport, are raised.
+        """
+        if self.ctx.interface.is_async:
+            return bool(self.ctx.interface_names.get(self))
+        try:
+            if self.ctx.interface.get_interface_for_handle(self):
+                return True
+        except Fault:
+            # Web service raises a fault for invalid handles
+            pass
+        self.ctx.interface_names.pop(self, None)
+        return False
 
     @classmethod
     def is_handle(cls, handle: str) -> bool:
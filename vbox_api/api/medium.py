@@ -0,0 +1,171 @@
+"""Module to index mediums by ID, name and location in memory."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from vbox_api import api
+from vbox_api.constants import VBoxEventType
+from vbox_api.models import Event, EventListenerLoop, Medium, PassiveEventListener
+
+logger = logging.getLogger(__name__)
+
+
+class MediumIndex:
+    """
+    Index all mediums, including children, by ID, name and location.
+
+    Properties of all mediums are fetched concurrently when the index is
+    built, and lookups are then served from memory. If started, a passive
+    event listener invalidates the index when mediums are registered or
+    changed; otherwise, the index is rebuilt after ttl seconds. As events
+    may not have been handled yet, the index is also rebuilt when a lookup
+    misses, at most once per min_age seconds.
+    """
+
+    EVENT_TYPES = [
+        VBoxEventType.ON_MEDIUM_REGISTERED,
+        VBoxEventType.ON_MEDIUM_CHANGED,
+        VBoxEventType.ON_MEDIUM_CONFIG_CHANGED,
+    ]
+    FIELDS = ("id", "name", "location")
+
+    def __init__(
+        self,
+        ctx: "api.Context",
+        ttl: float = 30.0,
+        min_age: float = 1.0,
+        max_workers: int = 16,
+        timeout_ms: int = 1000,
+        retry_interval: float = 5.0,
+    ) -> None:
+        """Initialise empty index for context."""
+        self.ctx = ctx
+        self.ttl = ttl
+        self.min_age = min_age
+        self.max_workers = max_workers
+        self.timeout_ms = timeout_ms
+        self.retry_interval = retry_interval
+        self.listener: Optional[PassiveEventListener] = None
+        self.loop: Optional[EventListenerLoop] = None
+        self._mediums: dict[str, Medium] = {}
+        self._timestamp: Optional[float] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return number of indexed keys."""
+        return len(self._mediums)
+
+    @property
+    def running(self) -> bool:
+        """Return whether index is invalidated by events."""
+        return self.loop is not None
+
+    def start(self) -> None:
+        """Register event listener and start thread to invalidate index."""
+        self.listener = PassiveEventListener.from_ctx(self.ctx, self.EVENT_TYPES)
+        self.loop = EventListenerLoop(
+            self.listener,
+            self.handle_event,
+            timeout_ms=self.timeout_ms,
+            error_callback=self.handle_error,
+        )
+        self.loop.start()
+
+    def stop(self) -> None:
+        """Stop thread and unregister event listener."""
+        if self.loop:
+            self.loop.stop()
+        if self.listener:
+            try:
+                self.listener.source.unregister_listener(self.listener)
+            except Exception as e:
+                logger.debug(f"Could not unregister listener of medium index: {e}")
+        self.loop = self.listener = None
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Discard index, so that it is rebuilt on next lookup."""
+        with self._lock:
+            self._timestamp = None
+            self._generation += 1
+
+    def get_age(self) -> Optional[float]:
+        """Return seconds since index was built, or None if invalid."""
+        timestamp = self._timestamp
+        return time.monotonic() - timestamp if timestamp is not None else None
+
+    def is_fresh(self) -> bool:
+        """Return whether index is valid and, if not updated by events, recent."""
+        age = self.get_age()
+        return age is not None and (self.running or age <= self.ttl)
+
+    def rebuild(self) -> None:
+        """Fetch properties of all mediums concurrently and replace index."""
+        generation = self._generation
+        mediums = self.ctx.api.get_mediums(include_children=True)
+        getters = [
+            (medium, name, getattr(medium, f"get_{name}"))
+            for medium in mediums
+            for name in self.FIELDS
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda item: Medium._call_getter(item[1], item[2]), getters
+                )
+            )
+        index: dict[str, Medium] = {}
+        for (medium, _, _), (success, value) in zip(getters, results):
+            if success and value:
+                # Keep first medium for duplicate names
+                index.setdefault(str(value), medium)
+        with self._lock:
+            self._mediums = index
+            # Index remains invalid if invalidated while being built
+            if generation == self._generation:
+                self._timestamp = time.monotonic()
+        logger.debug(f"Indexed {len(mediums)} mediums")
+
+    def get(self, name_or_id: str) -> Optional[Medium]:
+        """Return medium by ID, name or location, rebuilding index if stale."""
+        with self._lock:
+            if self.is_fresh():
+                medium = self._mediums.get(name_or_id)
+                if medium is not None or self.get_age() < self.min_age:
+                    return medium
+        with self._rebuild_lock:
+            # Index may have been rebuilt by another thread in the meantime
+            age = self.get_age()
+            if age is None or age >= self.min_age:
+                self.rebuild()
+        with self._lock:
+            return self._mediums.get(name_or_id)
+
+    def handle_event(self, event: Event) -> None:
+        """Invalidate index when a medium is registered or changed."""
+        self.invalidate()
+
+    def handle_error(self, error: Exception) -> None:
+        """Register event listener again and invalidate index after an error."""
+        logger.warning(f"Medium index listener failed, invalidating: {error}")
+        self.invalidate()
+        # Loop and listener are discarded if stopped in the meantime
+        loop, listener = self.loop, self.listener
+        if loop is None or loop.stopped:
+            return None
+        try:
+            listener.source.unregister_listener(listener)
+        except Exception as e:
+            logger.debug(f"Could not unregister failed listener of medium index: {e}")
+        try:
+            self.listener = PassiveEventListener.from_ctx(self.ctx, self.EVENT_TYPES)
+            loop.listener = self.listener
+        except Exception as e:
+            logger.error(f"Could not register listener of medium index: {e}")
+            # Wait before retrying, unless stopped
+            loop.wait(self.retry_interval)
@@ -0,0 +1,204 @@
+"""Module to track progress of long running operations in the background."""
+
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from typing import Any, Optional
+
+from zeep.exceptions import Fault
+
+from vbox_api.models import Progress
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TrackedProgress:
+    """Dataclass to store status of a tracked operation."""
+
+    id: str
+    description: str
+    progress: Progress = field(compare=False, repr=False)
+    percent: int = 0
+    completed: bool = False
+    result_code: Optional[int] = None
+    error: Optional[str] = None
+    created: float = field(default_factory=time.time)
+    finished: Optional[float] = None
+    failures: int = 0
+    callback: Optional[Callable[["TrackedProgress"], None]] = field(
+        default=None, compare=False, repr=False
+    )
+
+    @property
+    def succeeded(self) -> bool:
+        """Return whether operation completed successfully."""
+        return self.completed and not self.result_code and not self.error
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return status of operation as dictionary."""
+        return {
+            "id": self.id,
+            "description": self.description,
+            "percent": self.percent,
+            "completed": self.completed,
+            "succeeded": self.succeeded,
+            "result_code": self.result_code,
+            "error": self.error,
+            "created": self.created,
+            "finished": self.finished,
+        }
+
+
+class ProgressTracker:
+    """
+    Track progress of operations, polled by a single background thread.
+
+    Operations return immediately after being tracked, and their status can
+    be obtained by ID. When an operation completes, its callback is called
+    from the background thread, such as to register a cloned machine.
+    Completed operations are kept for retention seconds.
+    Operations remain pending if their status cannot be fetched, such as
+    due to a transport error, until max_failures consecutive attempts fail
+    or the web service raises a fault, such as for an invalid handle.
+    The thread stops while no operations are pending.
+    """
+
+    def __init__(
+        self, interval: float = 0.5, retention: float = 300.0, max_failures: int = 10
+    ) -> None:
+        """Initialise tracker without any operations."""
+        self.interval = interval
+        self.retention = retention
+        self.max_failures = max(max_failures, 1)
+        self._tracked: dict[str, TrackedProgress] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def track(
+        self,
+        progress: Progress,
+        description: str = "",
+        callback: Optional[Callable[[TrackedProgress], None]] = None,
+    ) -> TrackedProgress:
+        """Track progress of operation and return its status."""
+        tracked = TrackedProgress(
+            uuid.uuid4().hex, description, progress, callback=callback
+        )
+        self._prune()
+        with self._lock:
+            self._tracked[tracked.id] = tracked
+            if self._thread is None:
+                self._stop_event.clear()
+                self._thread = threading.Thread(target=self.loop, daemon=True)
+                self._thread.start()
+        logger.debug(f"Tracking progress '{tracked.id}' of '{description}'")
+        return replace(tracked)
+
+    def get(self, progress_id: str) -> Optional[TrackedProgress]:
+        """Return copy of status of operation by ID, if tracked."""
+        with self._lock:
+            tracked = self._tracked.get(progress_id)
+            return replace(tracked) if tracked else None
+
+    def get_all(
+        self, pending: bool = False, failed_within: Optional[float] = None
+    ) -> list[TrackedProgress]:
+        """
+        Return copies of statuses of operations, optionally only pending.
+
+        If failed_within is specified, operations which failed within that
+        many seconds are also returned with pending operations.
+        """
+        failed_after = (
+            time.time() - failed_within if failed_within is not None else None
+        )
+        with self._lock:
+            return [
+                replace(tracked)
+                for tracked in self._tracked.values()
+                if not pending
+                or not tracked.completed
+                or (
+                    failed_after is not None
+                    and not tracked.succeeded
+                    and tracked.finished is not None
+                    and tracked.finished >= failed_after
+                )
+            ]
+
+    def stop(self) -> None:
+        """Stop polling operations."""
+        self._stop_event.set()
+
+    def loop(self) -> None:
+        """Poll pending operations until none remain or stopped."""
+        while not self._stop_event.is_set():
+            with self._lock:
+                pending = [t for t in self._tracked.values() if not t.completed]
+                if not pending:
+                    self._thread = None
+                    return None
+            for tracked in pending:
+                self._update(tracked)
+            self._prune()
+            self._stop_event.wait(self.interval)
+        with self._lock:
+            self._thread = None
+
+    def _update(self, tracked: TrackedProgress) -> None:
+        """Fetch status of operation, calling callback if completed."""
+        progress = tracked.progress
+        try:
+            percent = progress.get_percent()
+            completed = progress.get_completed()
+            result_code = progress.get_result_code() if completed else None
+            error = None
+            if result_code:
+                try:
+                    error = progress.get_error_info().get_text()
+                except Exception:
+                    error = f"Operation failed with result code {result_code}"
+            failures = 0
+        except Exception as e:
+            failures = tracked.failures + 1
+            if not isinstance(e, Fault) and failures < self.max_failures:
+                with self._lock:
+                    tracked.failures = failures
+                logger.warning(
+                    f"Could not update progress '{tracked.id}' "
+                    f"({failures}/{self.max_failures}): {e}"
+                )
+                return None
+            logger.error(f"Could not update progress '{tracked.id}': {e}")
+            percent, completed, result_code, error = tracked.percent, True, None, str(e)
+        with self._lock:
+            tracked.failures = failures
+            tracked.percent = percent
+            tracked.result_code = result_code
+            tracked.error = error
+            if not completed:
+                return None
+        if tracked.callback and not error:
+            try:
+                tracked.callback(replace(tracked, completed=True))
+            except Exception as e:
+                logger.error(f"Callback of progress '{tracked.id}' failed: {e}")
+                error = str(e)
+        with self._lock:
+            tracked.error = error
+            tracked.completed = True
+            tracked.finished = time.time()
+        logger.debug(f"Progress '{tracked.id}' of '{tracked.description}' completed")
+
+    def _prune(self) -> None:
+        """Discard operations completed more than retention seconds ago."""
+        expiry = time.time() - self.retention
+        with self._lock:
+            for progress_id, tracked in list(self._tracked.items()):
+                if tracked.finished is not None and tracked.finished < expiry:
+                    del self._tracked[progress_id]
@@ -0,0 +1,326 @@
+"""Module to track managed object references and release them in batches."""
+
+import logging
+import threading
+import weakref
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from vbox_api import api
+
+logger = logging.getLogger(__name__)
+
+
+class ReleasedHandleError(RuntimeError):
+    """Error raised when a handle is released while being referenced."""
+
+
+@dataclass
+class ReferenceStatistics:
+    """Dataclass to store counters of tracked managed object references."""
+
+    tracked: int = 0
+    created: int = 0
+    released: int = 0
+    failed: int = 0
+    conflicts: int = 0
+    pending: int = 0
+
+
+class ReleaseScope:
+    """Set of handles referenced by models within a release scope."""
+
+    def __init__(self) -> None:
+        """Initialise scope without any handles."""
+        self.handles: set[str] = set()
+        self.kept: set[str] = set()
+        self.released: set[str] = set()
+        self._finalizers: list[tuple[str, weakref.finalize]] = []
+
+    def keep(self, *models: Any) -> None:
+        """Exclude handles of models from being released on exit of scope."""
+        self.kept.update(
+            str(model.handle) for model in models if model.handle is not None
+        )
+
+
+class ReferenceTracker:
+    """
+    Count models referencing each managed object reference of the web service.
+
+    Models are tracked when instantiated with a handle, and a finalizer
+    queues their handle when they are collected. If auto_release is True,
+    handles no longer referenced by any model are released in batches of up
+    to batch_size by a background thread, every interval seconds, so that
+    collecting models does not call the web service.
+    References taken within a release scope of the current thread are
+    dropped on exit of the scope, releasing handles no longer referenced by
+    models outside it, regardless of auto_release.
+    Handles are not tracked for asynchronous interfaces.
+    The web service returns the same handle for the same object, so a
+    queued handle is not released if it has been referenced again. If it is
+    referenced while being released, a conflict is counted, and the release
+    is waited for. If the handle was released, ReleasedHandleError is
+    raised, so that it can be requested again from the web service.
+    """
+
+    def __init__(
+        self,
+        ctx: "api.Context",
+        auto_release: bool = False,
+        batch_size: int = 64,
+        interval: float = 1.0,
+    ) -> None:
+        """Initialise tracker for context without any handles."""
+        self.ctx = ctx
+        self.auto_release = auto_release
+        self.batch_size = batch_size
+        self.interval = interval
+        self._counts: dict[str, int] = {}
+        # Appended by finalizers without locking, as they may run at any time
+        self._collected: deque[str] = deque()
+        self._pending: dict[str, None] = {}
+        self._releasing: set[str] = set()
+        self._scopes: set[ReleaseScope] = set()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._statistics = ReferenceStatistics()
+
+    def track(self, model: Any) -> None:
+        """Count reference to handle of model until it is collected."""
+        handle = model.handle
+        if (
+            handle is None
+            or handle == self.ctx.api_handle
+            or self.ctx.interface.is_async
+        ):
+            return None
+        key = str(handle)
+        scopes = getattr(self._local, "scopes", [])
+        while True:
+            with self._lock:
+                self._drain()
+                if not self._wait_for_release(key):
+                    self._count(model, key, scopes)
+                    break
+            self._check_released(model)
+        if self.auto_release:
+            self.start()
+
+    def _count(self, model: Any, key: str, scopes: list[ReleaseScope]) -> None:
+        """Count reference to handle by model, adding it to scopes."""
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        # Handle was returned again before being released
+        self._pending.pop(key, None)
+        if count == 0:
+            self._statistics.created += 1
+        finalizer = weakref.finalize(model, self._collected.append, key)
+        finalizer.atexit = False
+        for scope in scopes:
+            scope.handles.add(key)
+            scope._finalizers.append((key, finalizer))
+
+    def _wait_for_release(self, key: str) -> bool:
+        """Wait for release of handle in progress, returning whether it was."""
+        if key not in self._releasing:
+            return False
+        self._statistics.conflicts += 1
+        logger.warning(f"Handle '{key}' was referenced while being released")
+        self._wake.wait_for(lambda: key not in self._releasing)
+        return True
+
+    def _check_released(self, model: Any) -> None:
+        """Raise error if handle of model was released."""
+        if not model.handle.is_valid():
+            raise ReleasedHandleError(
+                f"Handle '{model.handle}' was released while being referenced"
+            )
+
+    def retain(self, model: Any) -> None:
+        """
+        Keep handle of model returned again from being released by scopes.
+
+        Models are shared between threads, so a model referenced by a scope
+        of another thread must outlive the scope. If the handle is being
+        released, the release is waited for, as for tracked models.
+        """
+        if model.handle is None or not (self._scopes or self._releasing):
+            return None
+        key = str(model.handle)
+        scopes = getattr(self._local, "scopes", [])
+        with self._lock:
+            waited = self._wait_for_release(key)
+            for scope in self._scopes:
+                if key in scope.handles and scope not in scopes:
+                    scope.kept.add(key)
+        if waited:
+            self._check_released(model)
+
+    def _drain(self) -> None:
+        """Decrement counts of collected models, queueing unreferenced handles."""
+        while self._collected:
+            key = self._collected.popleft()
+            if (count := self._counts.get(key)) is None:
+                # Handle was forgotten by clearing the tracker
+                continue
+            if count > 1:
+                self._counts[key] = count - 1
+                continue
+            del self._counts[key]
+            if self.auto_release:
+                self._queue(key)
+
+    def _queue(self, key: str) -> None:
+        """Queue handle to be released."""
+        self._pending[key] = None
+
+    def _exit_scope(self, scope: ReleaseScope) -> None:
+        """
+        Drop references taken within scope, queueing unreferenced handles.
+
+        Finalizers of dropped references are detached, so that collecting
+        their models does not decrement the count again.
+        """
+        self._drain()
+        self._scopes.discard(scope)
+        for key, finalizer in scope._finalizers:
+            # Finalizer was already called if model has been collected
+            if key in scope.kept or finalizer.detach() is None:
+                continue
+            if (count := self._counts.get(key)) is None:
+                continue
+            if count > 1:
+                self._counts[key] = count - 1
+                continue
+            del self._counts[key]
+            scope.released.add(key)
+            self._queue(key)
+        scope._finalizers.clear()
+
+    @contextmanager
+    def scope(self) -> Iterator[ReleaseScope]:
+        """
+        Release handles referenced within context manager on exit.
+
+        Handles also referenced by models outside the scope are kept.
+        Models created within the scope must not be used after it exits,
+        unless kept by passing them to the keep method of the scope.
+        """
+        scope = ReleaseScope()
+        if not hasattr(self._local, "scopes"):
+            self._local.scopes = []
+        self._local.scopes.append(scope)
+        with self._lock:
+            self._scopes.add(scope)
+        try:
+            yield scope
+        finally:
+            self._local.scopes.remove(scope)
+            with self._wake:
+                self._exit_scope(scope)
+                self._wake.notify()
+            if scope.released:
+                self.start()
+
+    def start(self) -> None:
+        """Start releasing queued handles in a background thread."""
+        with self._lock:
+            if self._thread is not None:
+                return None
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self.loop, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop releasing queued handles in the background."""
+        with self._wake:
+            self._stop_event.set()
+            self._wake.notify()
+
+    def loop(self) -> None:
+        """
+        Release batches of queued handles until stopped.
+
+        If auto_release is False, stop once no handles are queued.
+        """
+        while not self._stop_event.is_set():
+            with self._wake:
+                self._wake.wait_for(
+                    lambda: len(self._pending) >= self.batch_size
+                    or self._stop_event.is_set(),
+                    self.interval,
+                )
+                self._drain()
+                batch = list(self._pending)[: self.batch_size]
+                for key in batch:
+                    del self._pending[key]
+                if not batch and not self.auto_release:
+                    self._thread = None
+                    return None
+            if batch and not self._stop_event.is_set():
+                self._release(batch)
+        with self._lock:
+            self._thread = None
+
+    def flush(self) -> int:
+        """Release all queued handles and return number released."""
+        with self._lock:
+            self._drain()
+            batch = list(self._pending)
+            self._pending.clear()
+        return self._release(batch)
+
+    def _release(self, batch: list[str]) -> int:
+        """Release batch of handles, returning number released."""
+        released = failed = 0
+        for key in batch:
+            with self._lock:
+                self._drain()
+                # Handle was referenced again since being queued
+                if key in self._counts:
+                    continue
+                self._releasing.add(key)
+            try:
+                self.ctx.get_handle(key).release()
+                released += 1
+            except Exception as e:
+                failed += 1
+                logger.debug(f"Could not release handle '{key}': {e}")
+            finally:
+                with self._wake:
+                    self._releasing.discard(key)
+                    self._wake.notify_all()
+        with self._lock:
+            self._statistics.released += released
+            self._statistics.failed += failed
+        logger.debug(f"Released {released} of {len(batch)} handles")
+        return released
+
+    def clear(self) -> None:
+        """Forget all handles, such as when released by logging off."""
+        with self._lock:
+            self._collected.clear()
+            self._counts.clear()
+            self._pending.clear()
+            for scope in self._scopes:
+                scope.handles.clear()
+                scope._finalizers.clear()
+
+    def get_statistics(self) -> ReferenceStatistics:
+        """Return snapshot of counters of tracked handles."""
+        with self._lock:
+            self._drain()
+            return ReferenceStatistics(
+                **{
+                    **vars(self._statistics),
+                    "tracked": len(self._counts),
+                    "pending": len(self._pending),
+                }
+            )
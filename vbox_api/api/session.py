@@ -0,0 +1,163 @@
+"""Module to provide a pool of reusable sessions for locking machines."""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+from vbox_api import api
+from vbox_api.models import Session
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionPoolStatistics:
+    """Dataclass to store utilisation statistics of session pool."""
+
+    created: int = 0
+    reused: int = 0
+    discarded: int = 0
+    waits: int = 0
+    active: int = 0
+    peak_active: int = 0
+    idle: int = 0
+    maxsize: int = 0
+
+
+class SessionPool:
+    """
+    Bounded pool of sessions, checked out to lock machines.
+
+    Session objects are obtained from the web service once and reused,
+    rather than per machine model. At most maxsize sessions are created,
+    after which checking out waits for a session to be checked in.
+    Sessions are unlocked when checked in, and discarded if that fails.
+    """
+
+    def __init__(
+        self, ctx: "api.Context", maxsize: int = 16, timeout: Optional[float] = None
+    ) -> None:
+        """Initialise empty pool for context."""
+        self.ctx = ctx
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._idle: list[Session] = []
+        self._size = 0
+        self._available = threading.Condition()
+        self._statistics = SessionPoolStatistics(maxsize=maxsize)
+
+    def checkout(self, timeout: Optional[float] = None) -> Session:
+        """
+        Return idle session, or open a new session if pool is not full.
+
+        If the pool is full, wait up to timeout seconds, else the timeout
+        of the pool, for a session to be checked in.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._available:
+            if not self._idle and self._size >= self.maxsize:
+                self._statistics.waits += 1
+            while not self._idle and self._size >= self.maxsize:
+                remaining = deadline - time.monotonic() if deadline else None
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("Timed out waiting for session from pool")
+                self._available.wait(remaining)
+            session = self._idle.pop() if self._idle else None
+            if session is None:
+                self._size += 1
+            else:
+                self._statistics.reused += 1
+            self._update_active(1)
+        if session is not None:
+            return session
+        try:
+            session = self.ctx.get_session()
+            session.open()
+        except Exception:
+            with self._available:
+                self._size -= 1
+                self._update_active(-1)
+                self._available.notify()
+            raise
+        with self._available:
+            self._statistics.created += 1
+        logger.debug(f"Opened session '{session.handle}' for pool")
+        return session
+
+    def checkin(self, session: Session, locked: Optional[bool] = None) -> None:
+        """
+        Unlock session and return it to pool.
+
+        If locked is not specified, the state of the session is fetched to
+        determine whether to unlock it. If unlocking fails, the session
+        is discarded.
+        """
+        discard = False
+        try:
+            if locked or (locked is None and session.is_locked):
+                session.unlock_machine()
+        except Exception as e:
+            logger.debug(f"Discarding session '{session.handle}' of pool: {e}")
+            discard = True
+        with self._available:
+            self._update_active(-1)
+            if discard:
+                self._size -= 1
+                self._statistics.discarded += 1
+            else:
+                self._idle.append(session)
+            self._available.notify()
+        if discard:
+            self._release(session)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[Session]:
+        """Check out session in a context manager and check in on exit."""
+        session = self.checkout(timeout)
+        try:
+            yield session
+        finally:
+            self.checkin(session)
+
+    def clear(self, release: bool = True) -> None:
+        """
+        Discard idle sessions, optionally releasing their handles.
+
+        Handles need not be released if the web session has ended.
+        """
+        with self._available:
+            sessions, self._idle = self._idle, []
+            self._size -= len(sessions)
+            self._statistics.discarded += len(sessions)
+            self._available.notify_all()
+        if release:
+            for session in sessions:
+                self._release(session)
+
+    def get_statistics(self) -> SessionPoolStatistics:
+        """Return snapshot of utilisation statistics of pool."""
+        with self._available:
+            return SessionPoolStatistics(
+                **{**vars(self._statistics), "idle": len(self._idle)}
+            )
+
+    def _update_active(self, delta: int) -> None:
+        """Update number of checked out sessions and peak utilisation."""
+        statistics = self._statistics
+        statistics.active += delta
+        statistics.peak_active = max(statistics.peak_active, statistics.active)
+
+    @staticmethod
+    def _release(session: Session) -> None:
+        """Release handle of session, ignoring errors."""
+        try:
+            if session.handle is not None:
+                session.handle.release()
+        except Exception as e:
+            logger.debug(f"Could not release session '{session.handle}': {e}")
+        session.handle = None
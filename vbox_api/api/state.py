@@ -0,0 +1,311 @@
+"""Module to mirror state of machines in memory, updated by events."""
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Optional
+
+from vbox_api import api
+from vbox_api.constants import VBoxEventType
+from vbox_api.models import Event, EventListenerLoop, Machine, PassiveEventListener
+from vbox_api.models.machine import MachineHealth
+from vbox_api.models.virtualbox import FleetStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MachineStatus:
+    """Dataclass to store mirrored status of a machine."""
+
+    id: str
+    name: Optional[str]
+    groups: Optional[list[str]]
+    state: Optional[str]
+    session_state: Optional[str]
+    machine: Optional[Machine] = field(default=None, compare=False, repr=False)
+
+    @property
+    def health(self) -> MachineHealth:
+        """Return health of machine for state."""
+        return MachineHealth.from_state(self.state)
+
+
+@dataclass
+class StateChanges:
+    """Dataclass to store changes of mirrored statuses since a version."""
+
+    version: int
+    statuses: list[MachineStatus]
+    removed: list[str] = field(default_factory=list)
+    full: bool = False
+
+
+class MachineStateCache:
+    """
+    Mirror state, name, groups and session state of all machines in memory.
+
+    A passive event listener is registered once, and a thread updates
+    statuses as events are received. If getting events fails, such as when
+    events were lost or the listener expired, the listener is registered
+    again and all statuses are resynchronised.
+    """
+
+    EVENT_TYPES = [
+        VBoxEventType.ON_MACHINE_STATE_CHANGED,
+        VBoxEventType.ON_MACHINE_REGISTERED,
+        VBoxEventType.ON_MACHINE_DATA_CHANGED,
+        VBoxEventType.ON_SESSION_STATE_CHANGED,
+    ]
+    FIELDS = ("id", "name", "groups", "state", "session_state")
+
+    def __init__(
+        self,
+        ctx: "api.Context",
+        timeout_ms: int = 1000,
+        retry_interval: float = 5.0,
+        max_changes: int = 1024,
+    ) -> None:
+        """
+        Initialise empty cache for context.
+
+        Each change increments the version of the cache, and the IDs of up
+        to max_changes recently changed machines are kept for get_changes.
+        """
+        self.ctx = ctx
+        self.timeout_ms = timeout_ms
+        self.retry_interval = retry_interval
+        self.listener: Optional[PassiveEventListener] = None
+        self.loop: Optional[EventListenerLoop] = None
+        self.version = 0
+        self._statuses: dict[str, MachineStatus] = {}
+        self._ids: dict[str, str] = {}
+        self._changes: deque[tuple[int, str]] = deque(maxlen=max_changes)
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        self._synced = threading.Event()
+
+    def __len__(self) -> int:
+        """Return number of mirrored machines."""
+        return len(self._statuses)
+
+    @property
+    def synced(self) -> bool:
+        """Return whether statuses are synchronised with the web service."""
+        return self._synced.is_set()
+
+    @property
+    def running(self) -> bool:
+        """Return whether statuses are being updated by events."""
+        return self.loop is not None
+
+    def start(self) -> None:
+        """Register event listener, synchronise statuses and start thread."""
+        self.listener = PassiveEventListener.from_ctx(self.ctx, self.EVENT_TYPES)
+        self.resync()
+        self.loop = EventListenerLoop(
+            self.listener,
+            self.handle_event,
+            timeout_ms=self.timeout_ms,
+            error_callback=self.handle_error,
+        )
+        self.loop.start()
+
+    def stop(self) -> None:
+        """Stop thread and unregister event listener."""
+        self._synced.clear()
+        if self.loop:
+            self.loop.stop()
+        if self.listener:
+            try:
+                self.listener.source.unregister_listener(self.listener)
+            except Exception as e:
+                logger.debug(f"Could not unregister listener of state cache: {e}")
+        with self._changed:
+            self.loop = self.listener = None
+            self._changed.notify_all()
+
+    def resync(self) -> None:
+        """Replace all statuses with those fetched from the web service."""
+        self._synced.clear()
+        fleet_status = self.ctx.api.get_fleet_status(self.FIELDS, max_age=0)
+        statuses = {}
+        ids = {}
+        for row in fleet_status.rows():
+            if row["id"] is None:
+                continue
+            statuses[row["id"]] = MachineStatus(
+                row["id"],
+                row["name"],
+                row["groups"],
+                row["state"],
+                row["session_state"],
+                row["machine"],
+            )
+            ids[str(row["machine"].handle)] = row["id"]
+        with self._lock:
+            self._statuses = statuses
+            self._ids = ids
+            # Discard changes, as any change may have been missed
+            self._changes.clear()
+            self._notify()
+        self._synced.set()
+        logger.debug(f"Synchronised state cache of {len(statuses)} machines")
+
+    def get(self, machine_id: str) -> Optional[MachineStatus]:
+        """Return copy of status of machine by ID, if synchronised."""
+        if not self.synced:
+            return None
+        with self._lock:
+            status = self._statuses.get(machine_id)
+            return replace(status) if status else None
+
+    def get_for_machine(self, machine: Machine) -> Optional[MachineStatus]:
+        """Return copy of status of machine model, if synchronised."""
+        if not self.synced:
+            return None
+        with self._lock:
+            machine_id = self._ids.get(str(machine.handle))
+        if machine_id is None:
+            machine_id = machine.get_id()
+        return self.get(machine_id)
+
+    def get_statuses(self) -> list[MachineStatus]:
+        """Return copies of statuses of all machines."""
+        with self._lock:
+            return [replace(status) for status in self._statuses.values()]
+
+    def get_fleet_status(self, fields: tuple[str, ...]) -> FleetStatus:
+        """Return columnar status of all machines from mirrored statuses."""
+        statuses = self.get_statuses()
+        return FleetStatus(
+            [status.machine for status in statuses],
+            {name: [getattr(status, name) for status in statuses] for name in fields},
+        )
+
+    def _notify(self, machine_id: Optional[str] = None) -> None:
+        """Increment version, recording changed machine, and wake waiters."""
+        with self._changed:
+            self.version += 1
+            if machine_id is not None:
+                self._changes.append((self.version, machine_id))
+            self._changed.notify_all()
+
+    def wait_for_changes(self, version: int, timeout: Optional[float] = None) -> bool:
+        """Block until version of cache differs from version or timeout elapses."""
+        with self._changed:
+            return self._changed.wait_for(
+                lambda: self.version != version or not self.running, timeout
+            )
+
+    def get_changes(self, version: Optional[int] = None) -> Optional[StateChanges]:
+        """
+        Return statuses changed and IDs removed since version, if any.
+
+        If the changes since version are unknown, such as after statuses
+        were resynchronised, all statuses are returned.
+        """
+        with self._lock:
+            if version == self.version:
+                return None
+            oldest = self._changes[0][0] if self._changes else self.version + 1
+            if version is None or version > self.version or version < oldest - 1:
+                return StateChanges(self.version, self.get_statuses(), full=True)
+            changed_ids = dict.fromkeys(
+                machine_id for change, machine_id in self._changes if change > version
+            )
+            return StateChanges(
+                self.version,
+                [
+                    replace(self._statuses[machine_id])
+                    for machine_id in changed_ids
+                    if machine_id in self._statuses
+                ],
+                [
+                    machine_id
+                    for machine_id in changed_ids
+                    if machine_id not in self._statuses
+                ],
+            )
+
+    def _refresh_machine(self, machine_id: str) -> None:
+        """Fetch status of a single machine and store it."""
+        machine = self.ctx.api.find_machine(machine_id)
+        status = MachineStatus(
+            machine_id,
+            machine.get_name(),
+            machine.get_groups(),
+            machine.get_state(),
+            machine.get_session_state(),
+            machine,
+        )
+        with self._lock:
+            self._statuses[machine_id] = status
+            self._ids[str(machine.handle)] = machine_id
+            self._notify(machine_id)
+
+    def _remove_machine(self, machine_id: str) -> None:
+        """Remove status of a single machine."""
+        with self._lock:
+            status = self._statuses.pop(machine_id, None)
+            if status and status.machine:
+                self._ids.pop(str(status.machine.handle), None)
+            self._notify(machine_id)
+
+    def handle_event(self, event: Event) -> None:
+        """Update status of machine from received event."""
+        event_type = event.get_type()
+        model = event.get_model(event_type)
+        machine_id = model.get_machine_id()
+        with self._lock:
+            status = self._statuses.get(machine_id)
+        match event_type:
+            case VBoxEventType.ON_MACHINE_REGISTERED:
+                if model.get_registered():
+                    self._refresh_machine(machine_id)
+                else:
+                    self._remove_machine(machine_id)
+            case _ if status is None:
+                # Machine is not registered, such as while being created
+                logger.debug(f"Ignoring event of unknown machine '{machine_id}'")
+            case VBoxEventType.ON_MACHINE_STATE_CHANGED:
+                state = model.get_state()
+                with self._lock:
+                    status.state = state
+                    self._notify(machine_id)
+            case VBoxEventType.ON_SESSION_STATE_CHANGED:
+                session_state = model.get_state()
+                with self._lock:
+                    status.session_state = session_state
+                    self._notify(machine_id)
+            case VBoxEventType.ON_MACHINE_DATA_CHANGED:
+                if status.machine:
+                    name, groups = (
+                        status.machine.get_name(),
+                        status.machine.get_groups(),
+                    )
+                    with self._lock:
+                        status.name, status.groups = name, groups
+                        self._notify(machine_id)
+
+    def handle_error(self, error: Exception) -> None:
+        """Register event listener again and resynchronise after an error."""
+        logger.warning(f"State cache listener failed, resynchronising: {error}")
+        self._synced.clear()
+        # Loop and listener are discarded if stopped in the meantime
+        loop, listener = self.loop, self.listener
+        if loop is None or loop.stopped:
+            return None
+        try:
+            listener.source.unregister_listener(listener)
+        except Exception as e:
+            logger.debug(f"Could not unregister failed listener of state cache: {e}")
+        try:
+            self.listener = PassiveEventListener.from_ctx(self.ctx, self.EVENT_TYPES)
+            loop.listener = self.listener
+            self.resync()
+        except Exception as e:
+            logger.error(f"Could not resynchronise state cache: {e}")
+            # Wait before retrying, unless stopped
+            loop.wait(self.retry_interval)
@@ -0,0 +1,104 @@
+"""Module to cache downscaled thumbnails of machines."""
+
+import hashlib
+import io
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from vbox_api.api.cache import LRUCache
+from vbox_api.constants import MachineState
+from vbox_api.models import Machine
+
+
+@dataclass
+class Thumbnail:
+    """Dataclass to store encoded thumbnail of a machine."""
+
+    data: bytes
+    mimetype: str
+    etag: str
+    max_age: Optional[float] = None
+
+
+class ThumbnailCache:
+    """
+    Cache encoded thumbnails of machines, keyed by ID and state change time.
+
+    Screens of running machines can change without their state changing,
+    so their thumbnails expire after ttl seconds. Other thumbnails are kept
+    until the state of the machine changes, or are discarded when the cache
+    exceeds maxsize.
+    """
+
+    FORMATS = {"png": "image/png", "webp": "image/webp"}
+
+    def __init__(
+        self,
+        width: int = 320,
+        height: int = 240,
+        ttl: float = 10.0,
+        maxsize: int = 256,
+    ) -> None:
+        """Initialise empty cache for thumbnails of size."""
+        self.width = width
+        self.height = height
+        self.ttl = ttl
+        self._thumbnails = LRUCache(maxsize)
+        self._locks = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def get_etag(
+        self, machine: Machine, format_: str = "png"
+    ) -> tuple[str, Optional[float]]:
+        """Return entity tag of current thumbnail, with seconds until it expires."""
+        running = machine.get_state() == MachineState.RUNNING
+        # Running machines are keyed by period of ttl, so they expire
+        period = int(time.time() // self.ttl) if running else 0
+        key = (
+            f"{machine.get_id()}:{machine.get_last_state_change()}:{period}:"
+            f"{self.width}x{self.height}.{format_}"
+        )
+        etag = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return etag, self.ttl - time.time() % self.ttl if running else None
+
+    def _get_lock(self, etag: str) -> threading.Lock:
+        """Return lock for thumbnail, so it is only created once."""
+        with self._lock:
+            if (lock := self._locks.get(etag)) is None:
+                lock = self._locks[etag] = threading.Lock()
+            return lock
+
+    def get(
+        self,
+        machine: Machine,
+        format_: str = "png",
+        etag: Optional[str] = None,
+        max_age: Optional[float] = None,
+    ) -> Thumbnail:
+        """
+        Return thumbnail of machine, creating it if not cached.
+
+        The entity tag and expiry of get_etag can be passed, if known.
+        """
+        if format_ not in self.FORMATS:
+            raise ValueError(f"Unsupported thumbnail format '{format_}'")
+        if etag is None:
+            etag, max_age = self.get_etag(machine, format_)
+        with self._get_lock(etag):
+            if (thumbnail := self._thumbnails.get(etag)) is None:
+                thumbnail = self._thumbnails[etag] = self.create(machine, format_, etag)
+        return replace(thumbnail, max_age=max_age)
+
+    def create(self, machine: Machine, format_: str, etag: str) -> Thumbnail:
+        """Return new thumbnail of machine, downscaled and encoded."""
+        image = machine.get_thumbnail(width=self.width, height=self.height)
+        with io.BytesIO() as buffer:
+            image.save(buffer, format=format_.upper())
+            data = buffer.getvalue()
+        return Thumbnail(data, self.FORMATS[format_], etag)
+
+    def clear(self) -> None:
+        """Remove all thumbnails from cache."""
+        self._thumbnails.clear()
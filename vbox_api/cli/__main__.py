@@ -5,6 +5,7 @@ Available objects:
  - built-ins
  - api: VBoxAPI
  - interface: SOAPInterface
+ - cache: WSDLCache or None
 """
 
 import code
@@ -16,7 +17,7 @@ from getpass import getpass, getuser
 
 import requests.exceptions
 
-from vbox_api import SOAPInterface, VBoxAPI
+from vbox_api import SOAPInterface, VBoxAPI, WSDLCache
 from vbox_api.cli.args import get_parser
 from vbox_api.helpers import start_vboxwebsrv
 
@@ -32,7 +33,8 @@ def main() -> None:
     if args.vboxwebsrv:
         start_vboxwebsrv()
 
-    interface = SOAPInterface(args.host, args.port)
+    cache = WSDLCache() if not args.no_cache else None
+    interface = SOAPInterface(args.host, args.port, cache=cache)
     for _ in range(args.attempts):
         try:
             interface.connect()
@@ -20,6 +20,9 @@ def get_parser() -> ArgumentParser:
     parser.add_argument(
         "--vboxwebsrv", action="store_true", help="start vboxwebsrv in the background"
     )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="do not cache WSDL documents on disk"
+    )
     parser.add_argument(
         "--interval",
         "-i",
@@ -1,9 +1,20 @@
 """Flask application for VirtualBox API web interface."""
 
 import logging
+import os
+from typing import Optional
 
 import requests.exceptions
-from flask import Flask, abort, flash, g, redirect, render_template, request, url_for
+from flask import (
+    Flask,
+    abort,
+    flash,
+    g,
+    redirect,
+    render_template,
+    request,
+    url_for,
+)
 from werkzeug.exceptions import HTTPException
 from werkzeug.wrappers.response import Response
 
@@ -12,8 +23,16 @@ from vbox_api.helpers import start_vboxwebsrv
 from vbox_api.http import config
 from vbox_api.http.constants import UserPermission
 from vbox_api.http.session import SessionManager, requires_session
-from vbox_api.http.utils import is_allowed
+from vbox_api.http.utils import (
+    LOG_LEVELS,
+    get_log_level,
+    is_allowed,
+    iter_log_events,
+    iter_state_events,
+    read_log_page,
+)
 from vbox_api.http.views import blueprints
+from vbox_api.models.machine import MachineHealth
 
 logger = logging.getLogger(__name__)
 file_handler = logging.FileHandler(config.LOG_FILE, encoding="utf-8")
@@ -46,6 +65,16 @@ def load_session() -> None:
     g.constants = constants
     g.permissions = UserPermission
     g.is_allowed = is_allowed
+    if g.api is not None and g.api.ctx.property_cache is not None:
+        g.api.ctx.property_cache.start_request()
+
+
+@app.teardown_request
+def clear_property_cache(error: Optional[BaseException]) -> None:
+    """Discard property values cached during request."""
+    api = g.get("api")
+    if api is not None and api.ctx.property_cache is not None:
+        api.ctx.property_cache.end_request()
 
 
 @app.errorhandler(HTTPException)
@@ -58,7 +87,9 @@ def handle_exception(error: HTTPException) -> tuple[str, int]:
 @requires_session
 def dashboard() -> Response | str:
     """Endpoint for dashboard."""
-    return render_template("dashboard.html", machines=g.api.machines, utils=utils)
+    return render_template(
+        "dashboard.html", machines=g.api.machines, utils=utils, health=MachineHealth
+    )
 
 
 @app.route("/login", methods=["GET", "POST"])
@@ -97,17 +128,80 @@ def logout() -> Response:
 @app.route("/events", methods=["GET"])
 @requires_session
 def events() -> Response:
-    """Endpoint to display events."""
+    """Endpoint to display a page of events, newest first."""
+    if not is_allowed(UserPermission.READ_EVENTS):
+        abort(403, "Reading events is not allowed by the server.")
+    before = request.args.get("before", type=int)
+    limit = min(
+        max(request.args.get("limit", app.config["EVENTS_PAGE_SIZE"], type=int), 1),
+        app.config["EVENTS_MAX_PAGE_SIZE"],
+    )
+    level = get_log_level()
+    try:
+        events, next_before, size = read_log_page(config.LOG_FILE, before, limit, level)
+    except FileNotFoundError:
+        abort(404, "Log file not found.")
+    return render_template(
+        "events.html",
+        events=events,
+        before=next_before,
+        limit=limit,
+        level=logging.getLevelName(level) if level is not None else None,
+        levels=LOG_LEVELS,
+        size=size,
+    )
+
+
+@app.route("/events/follow", methods=["GET"])
+@requires_session
+def follow_events() -> Response:
+    """Endpoint to stream events appended to log as server-sent events."""
     if not is_allowed(UserPermission.READ_EVENTS):
         abort(403, "Reading events is not allowed by the server.")
+    offset = request.headers.get("Last-Event-ID", request.args.get("offset"))
     try:
-        with open(config.LOG_FILE, "r") as fd:
-            data = fd.read()
+        offset = (
+            int(offset)
+            if offset and offset.isdigit()
+            else os.path.getsize(config.LOG_FILE)
+        )
     except FileNotFoundError:
         abort(404, "Log file not found.")
-    # Strip ANSI escape codes in case log includes console output
-    events = list(filter(bool, map(utils.strip_ansi, reversed(data.split("\n")))))
-    return render_template("events.html", events=events)
+    response = app.response_class(
+        iter_log_events(
+            config.LOG_FILE,
+            offset,
+            get_log_level(),
+            interval=app.config["EVENTS_FOLLOW_INTERVAL"],
+            heartbeat=app.config["EVENT_STREAM_HEARTBEAT"],
+            max_duration=app.config["EVENTS_FOLLOW_DURATION"],
+        ),
+        mimetype="text/event-stream",
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+@app.route("/events/stream", methods=["GET"])
+@requires_session
+def event_stream() -> Response:
+    """Endpoint to stream changes of machine states as server-sent events."""
+    state_cache = g.api.ctx.state_cache
+    if not app.config["EVENT_STREAM"] or state_cache is None:
+        abort(404, "Streaming machine states is not enabled.")
+    version = request.headers.get("Last-Event-ID", request.args.get("version"))
+    response = app.response_class(
+        iter_state_events(
+            state_cache,
+            int(version) if version and version.isdigit() else None,
+            heartbeat=app.config["EVENT_STREAM_HEARTBEAT"],
+        ),
+        mimetype="text/event-stream",
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
 
 
 @app.route("/vboxwebsrv", methods=["GET"])
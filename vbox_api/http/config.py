@@ -5,11 +5,70 @@ import logging
 from vbox_api.http.constants import UserPermission
 
 SECRET_KEY = "development"
-OPERATION_TIMEOUT_MS = 1000
+
+# Seconds between polls of operations, and to keep completed operations
+PROGRESS_POLL_INTERVAL = 0.5
+PROGRESS_RETENTION = 300.0
+# Seconds to show failed operations after they finish, if not seen while pending
+PROGRESS_FAILURE_DISPLAY = 60.0
+# Consecutive errors polling an operation before it is shown as failed
+PROGRESS_MAX_FAILURES = 10
+# Number of machines operated on concurrently by group actions
+FLEET_CONCURRENCY = 8
+
+# Cache WSDL documents on disk, in user cache directory if not specified
+WSDL_CACHE = True
+WSDL_CACHE_DIR = None
+# Size of connection pool and retries of getters of HTTP transport per session
+TRANSPORT_POOL_MAXSIZE = 16
+TRANSPORT_RETRIES = 2
+# Default timeout of operations in seconds, or None to wait indefinitely
+TRANSPORT_TIMEOUT = None
+# Number of sessions reused to lock machines per session, and seconds to wait
+# for a session when all are in use, or None to wait indefinitely
+SESSION_POOL_SIZE = 16
+SESSION_POOL_TIMEOUT = 60.0
+# Release managed objects of the web service once models are collected
+RELEASE_REFERENCES = True
+
+# Mirror state of machines per session, updated by events
+MACHINE_STATE_CACHE = True
+# Index mediums per session, invalidated by events, else after TTL in seconds
+MEDIUM_INDEX = True
+MEDIUM_INDEX_TTL = 30.0
+
+# Size and format of machine thumbnails, cached per session unless disabled
+THUMBNAIL_CACHE = True
+THUMBNAIL_WIDTH = 320
+THUMBNAIL_HEIGHT = 240
+THUMBNAIL_FORMAT = "webp"
+
+# Stream machine state changes to the dashboard and machine overview
+# Each open page holds a worker thread until its stream is closed, which is
+# only detected by the next heartbeat, so only enable with enough threads
+# per worker, or an asynchronous worker class, e.g. gunicorn -k gevent
+EVENT_STREAM = False
+# Seconds between keep-alive comments of idle event streams
+EVENT_STREAM_HEARTBEAT = 15
+
+# Cache model properties for the duration of a request, or None to disable
+PROPERTY_CACHE = "request"
+PROPERTY_CACHE_TTL = 1.0
 
 LOG_FILE = "/tmp/vbox-api.log"
 # Setting log level to logging.DEBUG will include handles
 LOG_LEVEL = logging.INFO
+# Number of events per page of log, and seconds between polls when following
+EVENTS_PAGE_SIZE = 200
+EVENTS_MAX_PAGE_SIZE = 1000
+EVENTS_FOLLOW_INTERVAL = 1.0
+# Seconds after which following streams end, or None to follow indefinitely
+# Each following page holds a worker thread, released when its stream ends,
+# before browsers reconnect from the last offset
+EVENTS_FOLLOW_DURATION = 300.0
+# Number of lines of machine logs loaded at once, by default and at most
+MACHINE_LOG_PAGE_SIZE = 500
+MACHINE_LOG_MAX_PAGE_SIZE = 5000
 
 USER_PERMISSIONS = UserPermission.START_VBOXWEBSRV | UserPermission.READ_EVENTS
 
@@ -1,12 +1,23 @@
 """Handle HTTP session and retrieval of associated API instance."""
 
 import functools
+import logging
 from typing import Callable, Optional
 
-from flask import g, redirect, request, session, url_for
+from flask import current_app, g, redirect, request, session, url_for
 from werkzeug.wrappers.response import Response
 
-from vbox_api import SOAPInterface, VBoxAPI
+from vbox_api import SOAPInterface, TransportConfig, VBoxAPI, WSDLCache
+from vbox_api.api import (
+    MachineStateCache,
+    MediumIndex,
+    ProgressTracker,
+    PropertyCache,
+    SessionPool,
+    ThumbnailCache,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def requires_session(func: Callable) -> Callable:
@@ -41,16 +52,91 @@ class SessionManager(dict):
         self, username: str, password: str, host: Optional[tuple[str, int]] = None
     ) -> bool:
         """Log in user and return status."""
-        interface = SOAPInterface() if not host else SOAPInterface(*host)
+        cache = (
+            WSDLCache(current_app.config["WSDL_CACHE_DIR"])
+            if current_app.config["WSDL_CACHE"]
+            else None
+        )
+        transport_config = TransportConfig(
+            pool_maxsize=current_app.config["TRANSPORT_POOL_MAXSIZE"],
+            retries=current_app.config["TRANSPORT_RETRIES"],
+            timeout=current_app.config["TRANSPORT_TIMEOUT"],
+        )
+        interface = (
+            SOAPInterface(cache=cache, transport_config=transport_config)
+            if not host
+            else SOAPInterface(*host, cache=cache, transport_config=transport_config)
+        )
         interface.connect()
         api = VBoxAPI(interface)
+        api.ctx.session_pool = SessionPool(
+            api.ctx,
+            current_app.config["SESSION_POOL_SIZE"],
+            current_app.config["SESSION_POOL_TIMEOUT"],
+        )
+        api.ctx.reference_tracker.auto_release = current_app.config[
+            "RELEASE_REFERENCES"
+        ]
+        if current_app.config["PROPERTY_CACHE"]:
+            api.ctx.property_cache = PropertyCache(
+                current_app.config["PROPERTY_CACHE"],
+                ttl=current_app.config["PROPERTY_CACHE_TTL"],
+            )
         if not api.login(username, password):
             return False
+        api.ctx.progress_tracker = ProgressTracker(
+            current_app.config["PROGRESS_POLL_INTERVAL"],
+            current_app.config["PROGRESS_RETENTION"],
+            current_app.config["PROGRESS_MAX_FAILURES"],
+        )
+        if current_app.config["MACHINE_STATE_CACHE"]:
+            self.start_state_cache(api)
+        if current_app.config["MEDIUM_INDEX"]:
+            self.start_medium_index(api)
+        if current_app.config["THUMBNAIL_CACHE"]:
+            api.ctx.thumbnail_cache = ThumbnailCache(
+                current_app.config["THUMBNAIL_WIDTH"],
+                current_app.config["THUMBNAIL_HEIGHT"],
+            )
         session["username"] = username
         self[username] = api
         return True
 
+    @staticmethod
+    def start_state_cache(api: VBoxAPI) -> None:
+        """Start mirroring state of machines for API instance."""
+        state_cache = MachineStateCache(api.ctx)
+        try:
+            state_cache.start()
+        except Exception as e:
+            logger.warning(f"Could not start machine state cache: {e}")
+            state_cache.stop()
+            return None
+        api.ctx.state_cache = state_cache
+
+    @staticmethod
+    def start_medium_index(api: VBoxAPI) -> None:
+        """Index mediums for API instance, falling back to TTL without events."""
+        medium_index = MediumIndex(api.ctx, current_app.config["MEDIUM_INDEX_TTL"])
+        try:
+            medium_index.start()
+        except Exception as e:
+            logger.warning(f"Could not listen for medium events: {e}")
+            medium_index.stop()
+        api.ctx.medium_index = medium_index
+
     def logout(self) -> None:
         """Log out current user."""
         username = session.pop("username", None)
-        self.pop(username, None)
+        api = self.pop(username, None)
+        if api is None:
+            return None
+        if api.ctx.state_cache is not None:
+            api.ctx.state_cache.stop()
+            api.ctx.state_cache = None
+        if api.ctx.medium_index is not None:
+            api.ctx.medium_index.stop()
+            api.ctx.medium_index = None
+        if api.ctx.progress_tracker is not None:
+            api.ctx.progress_tracker.stop()
+        api.ctx.reference_tracker.stop()
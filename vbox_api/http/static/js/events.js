@@ -0,0 +1,23 @@
+/* Prepend events appended to log while following is enabled. */
+(() => {
+  const follow = document.getElementById("follow");
+  const events = document.getElementById("events");
+  let source = null;
+
+  follow?.addEventListener("change", () => {
+    if (!follow.checked) {
+      source?.close();
+      source = null;
+      return;
+    }
+    source = new EventSource(follow.dataset.stream);
+    source.addEventListener("log", (message) => {
+      const data = JSON.parse(message.data);
+      events.prepend(data.lines.reverse().join("\n") + "\n");
+      // Resume from last event when following is enabled again
+      const url = new URL(follow.dataset.stream, window.location.href);
+      url.searchParams.set("offset", message.lastEventId);
+      follow.dataset.stream = url.toString();
+    });
+  });
+})();
@@ -0,0 +1,24 @@
+/* Prepend earlier lines of machine log on request. */
+(() => {
+  const button = document.getElementById("load-log");
+  const log = document.getElementById("log");
+
+  button?.addEventListener("click", async () => {
+    button.disabled = true;
+    const url = new URL(button.dataset.url, window.location.href);
+    url.searchParams.set("before", button.dataset.before);
+    const response = await fetch(url);
+    if (!response.ok) {
+      button.disabled = false;
+      return;
+    }
+    const data = await response.json();
+    log.prepend(data.lines.join("\n") + "\n");
+    if (data.before === null) {
+      button.remove();
+    } else {
+      button.dataset.before = data.before;
+      button.disabled = false;
+    }
+  });
+})();
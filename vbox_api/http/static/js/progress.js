@@ -0,0 +1,31 @@
+/* Poll tracked operations and update their progress bars until completed. */
+(() => {
+  const interval = 1000;
+
+  async function poll(card) {
+    const bar = card.querySelector(".progress-bar");
+    const response = await fetch(card.dataset.progressUrl);
+    if (!response.ok) {
+      card.remove();
+      return;
+    }
+    const data = await response.json();
+    bar.style.width = `${data.percent}%`;
+    bar.textContent = `${data.percent}%`;
+    if (!data.completed) {
+      setTimeout(() => poll(card), interval);
+      return;
+    }
+    bar.classList.remove("progress-bar-striped", "progress-bar-animated");
+    if (data.succeeded) {
+      bar.classList.add("bg-success");
+      setTimeout(() => card.remove(), 3 * interval);
+    } else {
+      bar.classList.add("bg-danger");
+      bar.style.width = "100%";
+      bar.textContent = data.error || "Failed";
+    }
+  }
+
+  document.querySelectorAll("[data-progress-url]").forEach((card) => poll(card));
+})();
@@ -0,0 +1,56 @@
+/* Update machine states in place from server-sent events of the state cache. */
+(() => {
+  const script = document.currentScript;
+  const colours = ["secondary", "success", "warning", "danger"];
+  const source = new EventSource(script.dataset.stream);
+
+  function updateMachine(element, machine, version) {
+    element.querySelectorAll("img[data-thumbnail]").forEach((image) => {
+      const url = new URL(image.src);
+      url.searchParams.set("v", version);
+      image.src = url.toString();
+    });
+    element.querySelectorAll("[data-field]").forEach((field) => {
+      const value = machine[field.dataset.field];
+      field.textContent = value ?? "";
+      if (field.dataset.field === "state") {
+        colours.forEach((colour) => field.classList.remove(`text-bg-${colour}`));
+        field.classList.add(`text-bg-${colours[machine.health]}`);
+      }
+    });
+  }
+
+  source.addEventListener("state", (message) => {
+    const data = JSON.parse(message.data);
+    const list = document.querySelector("[data-machine-list]");
+    const ids = new Set(data.machines.map((machine) => machine.id));
+    if (list && data.full) {
+      // Reload if machines were added or removed while disconnected
+      const elements = list.querySelectorAll("[data-machine-id]");
+      if (elements.length !== ids.size || [...elements].some((element) => !ids.has(element.dataset.machineId))) {
+        window.location.reload();
+        return;
+      }
+    }
+    for (const machine of data.machines) {
+      const element = document.querySelector(`[data-machine-id="${CSS.escape(machine.id)}"]`);
+      if (element) {
+        updateMachine(element, machine, message.lastEventId);
+      } else if (list) {
+        window.location.reload();
+        return;
+      }
+    }
+    for (const id of data.removed) {
+      document.querySelector(`[data-machine-id="${CSS.escape(id)}"]`)?.remove();
+    }
+    document.querySelectorAll("[data-machine-count]").forEach((element) => {
+      element.textContent = data.count;
+    });
+    document.querySelectorAll("[data-health-count]").forEach((element) => {
+      const count = data.health[element.dataset.healthCount] ?? 0;
+      element.textContent = count;
+      element.closest("li").classList.toggle("d-none", count === 0);
+    });
+  });
+})();
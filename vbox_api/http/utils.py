@@ -1,11 +1,20 @@
 """Collection of useful functions for HTTP interface."""
 
 import functools
+import json
+import logging
+import os
+import re
+import time
+from collections.abc import Iterator
 from typing import Any, Callable, Optional
 
 from flask import abort, current_app, g, request
 
+from vbox_api import utils
+from vbox_api.api import MachineStateCache, MachineStatus, TrackedProgress
 from vbox_api.http.constants import UserPermission
+from vbox_api.models import Progress
 from vbox_api.models.base import BaseModel
 
 
@@ -31,6 +40,15 @@ def get_model_from_name_or_id(
     return model
 
 
+def track_progress(
+    progress: Progress,
+    description: str,
+    callback: Optional[Callable[[TrackedProgress], None]] = None,
+) -> TrackedProgress:
+    """Track progress of operation of current session in the background."""
+    return g.api.ctx.progress_tracker.track(progress, description, callback)
+
+
 def convert_id_to_model(model_name: str, url_parameter: str = "id") -> Callable:
     """Decorate a function to convert model ID or name to object."""
 
@@ -43,3 +61,174 @@ def convert_id_to_model(model_name: str, url_parameter: str = "id") -> Callable:
         return inner
 
     return decorator
+
+
+def format_server_sent_event(
+    data: Any, event: Optional[str] = None, id_: Optional[int] = None
+) -> str:
+    """Return data serialised as JSON in a server-sent event message."""
+    message = f"data: {json.dumps(data, separators=(',', ':'))}\n\n"
+    if id_ is not None:
+        message = f"id: {id_}\n{message}"
+    if event is not None:
+        message = f"event: {event}\n{message}"
+    return message
+
+
+def status_to_dict(status: MachineStatus) -> dict[str, Any]:
+    """Return compact representation of machine status for browsers."""
+    return {
+        "id": status.id,
+        "name": status.name,
+        "state": utils.split_pascal_case(status.state or ""),
+        "health": int(status.health),
+        "group": status.groups[0] if status.groups else None,
+    }
+
+
+def iter_state_events(
+    state_cache: MachineStateCache,
+    version: Optional[int] = None,
+    heartbeat: float = 15.0,
+) -> Iterator[str]:
+    """
+    Yield server-sent events of changed machine statuses since version.
+
+    Each event contains the statuses of changed machines, the IDs of removed
+    machines and the number of machines by health. If the changes since
+    version are unknown, all statuses are sent and full is true. A comment
+    is sent every heartbeat seconds without changes, so that closed
+    connections are detected.
+    """
+    while state_cache.running:
+        if version == state_cache.version and not state_cache.wait_for_changes(
+            version, heartbeat
+        ):
+            yield ": heartbeat\n\n"
+            continue
+        if (changes := state_cache.get_changes(version)) is None:
+            continue
+        version = changes.version
+        counts = state_cache.get_fleet_status(("health",)).count_by("health")
+        data = {
+            "full": changes.full,
+            "machines": [status_to_dict(status) for status in changes.statuses],
+            "removed": changes.removed,
+            "count": sum(counts.values()),
+            "health": {int(health): count for health, count in counts.items()},
+        }
+        yield format_server_sent_event(data, event="state", id_=version)
+
+
+LOG_LEVEL_PATTERN = re.compile(r"\[([A-Z]+)\]")
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+def get_log_level() -> Optional[int]:
+    """Return minimum log level from request arguments or abort request."""
+    if not (name := request.args.get("level")):
+        return None
+    if name.upper() not in LOG_LEVELS:
+        abort(400, f"Unknown log level '{name}'.")
+    return logging.getLevelName(name.upper())
+
+
+def is_log_line_allowed(line: str, level: Optional[int] = None) -> bool:
+    """Return whether line of log is not empty and has at least level."""
+    if not line:
+        return False
+    if level is None:
+        return True
+    match = LOG_LEVEL_PATTERN.search(line)
+    if not match:
+        return False
+    line_level = logging.getLevelName(match.group(1))
+    return isinstance(line_level, int) and line_level >= level
+
+
+def decode_log_line(line: bytes) -> str:
+    """Return line of log as text, stripping ANSI escape codes."""
+    # Strip ANSI escape codes in case log includes console output
+    return utils.strip_ansi(line.decode("utf-8", errors="replace")).rstrip("\r")
+
+
+def read_log_page(
+    path: str,
+    before: Optional[int] = None,
+    limit: int = 200,
+    level: Optional[int] = None,
+) -> tuple[list[str], Optional[int], int]:
+    """
+    Return lines of log before offset, newest first, with at least level.
+
+    The offset of the next page is returned, or None if there are no older
+    lines, along with the size of the log for following new lines.
+    Only the lines of the requested page are read into memory.
+    """
+    lines = []
+    with open(path, "rb") as fd:
+        size = os.fstat(fd.fileno()).st_size
+        for offset, line in utils.iter_lines_reversed(fd, before):
+            if len(lines) == limit:
+                return lines, offset + len(line) + 1, size
+            text = decode_log_line(line)
+            if is_log_line_allowed(text, level):
+                lines.append(text)
+    return lines, None, size
+
+
+def iter_log_events(
+    path: str,
+    offset: int,
+    level: Optional[int] = None,
+    interval: float = 1.0,
+    heartbeat: float = 15.0,
+    block_size: int = 65536,
+    max_duration: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    Yield server-sent events of lines appended to log after offset.
+
+    The log is polled every interval seconds and read in blocks of
+    block_size bytes. If the log is truncated or replaced, such as when
+    rotated, it is followed from its start.
+    If max_duration is specified, the stream ends once idle after that many
+    seconds, setting the offset to resume from when clients reconnect.
+    """
+    fd = open(path, "rb")
+    buffer = b""
+    idle = 0.0
+    deadline = time.monotonic() + max_duration if max_duration is not None else None
+    try:
+        while True:
+            try:
+                replaced = os.stat(path).st_ino != os.fstat(fd.fileno()).st_ino
+            except FileNotFoundError:
+                replaced = False
+            if replaced:
+                fd.close()
+                fd = open(path, "rb")
+            if replaced or os.fstat(fd.fileno()).st_size < offset:
+                offset, buffer = 0, b""
+            fd.seek(offset)
+            if data := fd.read(block_size):
+                offset += len(data)
+                *lines, buffer = (buffer + data).split(b"\n")
+                texts = [decode_log_line(line) for line in lines]
+                texts = [text for text in texts if is_log_line_allowed(text, level)]
+                if texts:
+                    idle = 0.0
+                    yield format_server_sent_event(
+                        {"lines": texts}, event="log", id_=offset - len(buffer)
+                    )
+                continue
+            if deadline is not None and time.monotonic() >= deadline:
+                yield f"id: {offset - len(buffer)}\n\n"
+                return None
+            time.sleep(interval)
+            idle += interval
+            if idle >= heartbeat:
+                idle = 0.0
+                yield ": heartbeat\n\n"
+    finally:
+        fd.close()
@@ -2,10 +2,12 @@
 
 from vbox_api.http.views.machine import machine_blueprint
 from vbox_api.http.views.medium import medium_blueprint
+from vbox_api.http.views.progress import progress_blueprint
 
-__all__ = ["machine_blueprint", "medium_blueprint"]
+__all__ = ["machine_blueprint", "medium_blueprint", "progress_blueprint"]
 
 blueprints = {
     f"/{machine_blueprint.name}": machine_blueprint,
     f"/{medium_blueprint.name}": medium_blueprint,
+    f"/{progress_blueprint.name}": progress_blueprint,
 }
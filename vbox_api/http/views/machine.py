@@ -1,31 +1,57 @@
 """Blueprint for machine endpoints."""
 
+from datetime import datetime
+from typing import Optional
+
 from flask import (
     Blueprint,
     abort,
     current_app,
     flash,
     g,
+    jsonify,
     redirect,
     render_template,
     request,
     url_for,
 )
+from werkzeug.datastructures import ContentRange
 from werkzeug.wrappers.response import Response
 
+from vbox_api import utils
+from vbox_api.api import ThumbnailCache
+from vbox_api.constants import MachineState
 from vbox_api.helpers import WebSocketProxyProcess
 from vbox_api.http.session import requires_session
-from vbox_api.http.utils import convert_id_to_model
+from vbox_api.http.utils import convert_id_to_model, track_progress
 from vbox_api.models import Machine
 
 machine_blueprint = Blueprint("machine", __name__)
 
+# Description of each group action, with states of machines it applies to
+GROUP_ACTIONS: dict[str, tuple[str, Optional[tuple[MachineState, ...]]]] = {
+    "start": (
+        "Starting",
+        (
+            MachineState.POWERED_OFF,
+            MachineState.SAVED,
+            MachineState.ABORTED,
+            MachineState.ABORTED_SAVED,
+            MachineState.TELEPORTED,
+        ),
+    ),
+    "stop": ("Stopping", (MachineState.RUNNING, MachineState.PAUSED)),
+    "pause": ("Pausing", (MachineState.RUNNING,)),
+    "resume": ("Resuming", (MachineState.PAUSED,)),
+    "snapshot": ("Taking snapshot of", None),
+}
+
 
 @machine_blueprint.route("/", methods=["GET"])
 @requires_session
 def overview() -> Response | str:
     """Endpoint to view all machines."""
-    return render_template("machine/overview.html")
+    return render_template("machine/overview.html", utils=utils)
 
 
 @machine_blueprint.route("/view", methods=["GET"])
@@ -48,8 +74,8 @@ def start(machine: Machine) -> Response | str:
     else:
         front_end = request.args.get("front_end", "headless")
         progress = machine.start(front_end)
+        track_progress(progress, f"Starting machine '{machine.name}'")
         flash("Starting machine...", "info")
-        progress.wait_for_completion(current_app.config["OPERATION_TIMEOUT_MS"])
     return redirect(url_for("machine.view", id=machine.id))
 
 
@@ -68,8 +94,8 @@ def stop(machine: Machine) -> Response | str:
     else:
         save_state = request.args.get("save_state", False)
         progress = machine.stop(save_state=save_state)
+        track_progress(progress, f"Stopping machine '{machine.name}'")
         flash("Stopping machine...", "info")
-        progress.wait_for_completion(current_app.config["OPERATION_TIMEOUT_MS"])
     return redirect(url_for("machine.view", id=machine.id))
 
 
@@ -173,9 +199,10 @@ def detach_medium(machine: Machine) -> Response | str:
 @convert_id_to_model("machine")
 def delete(machine: Machine) -> Response | str:
     """Endpoint to delete a specified machine."""
+    name = machine.name
     progress = machine.delete(delete_config=True)
+    track_progress(progress, f"Deleting machine '{name}'")
     flash("Deleting machine...", "warning")
-    progress.wait_for_completion(current_app.config["OPERATION_TIMEOUT_MS"])
     return redirect(url_for("machine.overview"))
 
 
@@ -185,9 +212,60 @@ def delete(machine: Machine) -> Response | str:
 @convert_id_to_model("machine")
 def clone(machine: Machine) -> Response | str:
     """Endpoint to clone a specified machine."""
-    cloned_machine = machine.clone(f"{machine.name} - Clone")
-    flash("Cloned machine.", "info")
-    return redirect(url_for("machine.view", id=cloned_machine.id))
+    cloned_machine, progress = machine.start_clone(f"{machine.name} - Clone")
+    track_progress(
+        progress,
+        f"Cloning machine '{machine.name}'",
+        callback=lambda _: machine.finish_clone(cloned_machine),
+    )
+    flash("Cloning machine...", "info")
+    return redirect(url_for("machine.overview"))
+
+
+@machine_blueprint.route("/group/<string:action>", methods=["GET"])
+@requires_session
+def group_action(action: str) -> Response | str:
+    """Endpoint to start, stop, pause, resume or snapshot machines in a group."""
+    if action not in GROUP_ACTIONS:
+        abort(404, f"Group action '{action}' not found.")
+    description, states = GROUP_ACTIONS[action]
+    group = request.args.get("group", "/")
+    statuses = [
+        status
+        for status in g.api.get_fleet_status(["name", "id", "state", "groups"]).rows()
+        if group in (status["groups"] or [])
+        and (states is None or status["state"] in states)
+    ]
+    if not statuses:
+        flash(f"No machines in group '{group}' to {action}.", "warning")
+        return redirect(url_for("machine.overview"))
+    machines = [status["machine"] for status in statuses]
+    options = {"concurrency": current_app.config["FLEET_CONCURRENCY"], "wait": False}
+    match action:
+        case "start":
+            front_end = request.args.get("front_end", "headless")
+            results = g.api.start_machines(machines, front_end, **options)
+        case "stop":
+            save_state = request.args.get("save_state", False)
+            results = g.api.stop_machines(machines, save_state, **options)
+        case "pause":
+            results = g.api.pause_machines(machines, **options)
+        case "resume":
+            results = g.api.resume_machines(machines, **options)
+        case "snapshot":
+            name = request.args.get("name") or f"Snapshot {datetime.now():%c}"
+            results = g.api.snapshot_machines(machines, name, **options)
+    for status, result in zip(statuses, results):
+        if result.error:
+            flash(
+                f"Could not {action} machine '{status['name']}': {result.error}",
+                "danger",
+            )
+        elif result.progress:
+            track_progress(result.progress, f"{description} machine '{status['name']}'")
+    launched = sum(1 for result in results if not result.error)
+    flash(f"{description} {launched} machines in group '{group}'...", "info")
+    return redirect(url_for("machine.overview"))
 
 
 @machine_blueprint.route("/create", methods=["GET", "POST"])
@@ -226,16 +304,116 @@ def disable_secure_boot(machine: Machine) -> Response | str:
     return redirect(url_for("machine.edit", id=machine.id))
 
 
-@machine_blueprint.route("/logs", methods=["GET"])
-@machine_blueprint.route("/<string:name_or_id>/logs", methods=["GET"])
-@requires_session
-@convert_id_to_model("machine")
-def logs(machine: Machine) -> Response | str:
-    """Endpoint to view logs for a specified machine."""
+def get_log_index(machine: Machine) -> int:
+    """Return index of log from request arguments or abort request."""
     try:
         index = int(request.args.get("index", 0))
         if index not in machine.log_indexes:
             raise ValueError("Log index does not exist")
     except ValueError:
         abort(400, "Invalid log index.")
-    return render_template("machine/logs.html", machine=machine, index=index)
+    return index
+
+
+def get_log_lines(
+    machine: Machine, index: int, before: Optional[int], limit: int
+) -> tuple[list[str], Optional[int]]:
+    """Return lines of log before offset, oldest first, with offset of first line."""
+    lines = []
+    for offset, line in machine.iter_log_lines_reversed(index, before):
+        if len(lines) == limit:
+            return lines[::-1], before
+        # Log ends with a newline, so ignore empty last line
+        if before is not None or lines or line:
+            lines.append(line)
+            before = offset
+    return lines[::-1], None
+
+
+@machine_blueprint.route("/logs", methods=["GET"])
+@machine_blueprint.route("/<string:name_or_id>/logs", methods=["GET"])
+@requires_session
+@convert_id_to_model("machine")
+def logs(machine: Machine) -> Response | str:
+    """Endpoint to view logs for a specified machine, loading older lines later."""
+    index = get_log_index(machine)
+    lines, before = get_log_lines(
+        machine, index, None, current_app.config["MACHINE_LOG_PAGE_SIZE"]
+    )
+    return render_template(
+        "machine/logs.html", machine=machine, index=index, lines=lines, before=before
+    )
+
+
+@machine_blueprint.route("/logs/lines", methods=["GET"])
+@machine_blueprint.route("/<string:name_or_id>/logs/lines", methods=["GET"])
+@requires_session
+@convert_id_to_model("machine")
+def log_lines(machine: Machine) -> Response:
+    """Endpoint to return lines of log before offset as JSON."""
+    index = get_log_index(machine)
+    limit = min(
+        max(
+            request.args.get(
+                "limit", current_app.config["MACHINE_LOG_PAGE_SIZE"], type=int
+            ),
+            1,
+        ),
+        current_app.config["MACHINE_LOG_MAX_PAGE_SIZE"],
+    )
+    lines, before = get_log_lines(
+        machine, index, request.args.get("before", type=int), limit
+    )
+    return jsonify(lines=lines, before=before)
+
+
+@machine_blueprint.route("/logs/raw", methods=["GET"])
+@machine_blueprint.route("/<string:name_or_id>/logs/raw", methods=["GET"])
+@requires_session
+@convert_id_to_model("machine")
+def log_raw(machine: Machine) -> Response:
+    """Endpoint to stream log as plain text, supporting byte ranges."""
+    index = get_log_index(machine)
+    size = machine.get_log_size(index)
+    start, stop, status = 0, size, 200
+    if request.range is not None:
+        if (byte_range := request.range.range_for_length(size)) is None:
+            response = Response(status=416)
+            response.headers["Content-Range"] = f"bytes */{size}"
+            return response
+        (start, stop), status = byte_range, 206
+    response = current_app.response_class(
+        machine.iter_log_chunks(index, start, stop),
+        status=status,
+        mimetype="text/plain",
+    )
+    response.content_length = stop - start
+    response.accept_ranges = "bytes"
+    if status == 206:
+        response.content_range = ContentRange("bytes", start, stop, size)
+    return response
+
+
+@machine_blueprint.route("/<string:name_or_id>/thumbnail.<string:format_>")
+@requires_session
+@convert_id_to_model("machine")
+def thumbnail(machine: Machine, format_: str) -> Response:
+    """Endpoint to return downscaled thumbnail image of machine."""
+    thumbnail_cache = g.api.ctx.thumbnail_cache or ThumbnailCache(
+        current_app.config["THUMBNAIL_WIDTH"], current_app.config["THUMBNAIL_HEIGHT"]
+    )
+    if format_ not in thumbnail_cache.FORMATS:
+        abort(404, "Unsupported thumbnail format.")
+    etag, max_age = thumbnail_cache.get_etag(machine, format_)
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        image = thumbnail_cache.get(machine, format_, etag, max_age)
+        response = current_app.response_class(image.data, mimetype=image.mimetype)
+    response.set_etag(etag)
+    response.cache_control.private = True
+    if max_age is None:
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.max_age = int(max_age)
+    return response
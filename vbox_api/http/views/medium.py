@@ -20,7 +20,7 @@ from werkzeug.wrappers.response import Response
 from vbox_api import utils
 from vbox_api.constants import AccessMode, MediumState
 from vbox_api.http.session import requires_session
-from vbox_api.http.utils import convert_id_to_model
+from vbox_api.http.utils import convert_id_to_model, track_progress
 from vbox_api.models import Medium
 
 logger = logging.getLogger(__name__)
@@ -103,6 +103,6 @@ def delete(medium: Medium) -> Response | str:
     """Endpoint to delete a medium."""
     logger.warning(f"Deleting medium '{medium.name}'")
     progress = medium.delete_storage()
+    track_progress(progress, f"Deleting medium '{medium.name}'")
     flash("Deleting medium...", "warning")
-    progress.wait_for_completion(current_app.config["OPERATION_TIMEOUT_MS"])
     return redirect(url_for("medium.overview"))
@@ -0,0 +1,35 @@
+"""Blueprint for progress endpoints."""
+
+from flask import Blueprint, abort, g, jsonify
+from werkzeug.wrappers.response import Response
+
+from vbox_api.http.session import requires_session
+
+progress_blueprint = Blueprint("progress", __name__)
+
+
+@progress_blueprint.route("/", methods=["GET"])
+@requires_session
+def overview() -> Response:
+    """Endpoint to return status of all tracked operations."""
+    return jsonify(
+        [tracked.to_dict() for tracked in g.api.ctx.progress_tracker.get_all()]
+    )
+
+
+@progress_blueprint.route("/<string:progress_id>", methods=["GET"])
+@requires_session
+def view(progress_id: str) -> Response:
+    """Endpoint to return status of a tracked operation."""
+    if (tracked := g.api.ctx.progress_tracker.get(progress_id)) is None:
+        abort(404, "Operation is not tracked.")
+    return jsonify(tracked.to_dict())
+
+
+@progress_blueprint.route("/<string:progress_id>/percent", methods=["GET"])
+@requires_session
+def percent(progress_id: str) -> Response:
+    """Endpoint to return percentage of a tracked operation as plain text."""
+    if (tracked := g.api.ctx.progress_tracker.get(progress_id)) is None:
+        abort(404, "Operation is not tracked.")
+    return Response(str(tracked.percent), mimetype="text/plain")
@@ -1,6 +1,16 @@
 """Interface classes to communicate with the VirtualBox API."""
 
-from vbox_api.interface.base import PythonicInterface
+from vbox_api.interface.asynchronous import AsyncSOAPInterface
+from vbox_api.interface.base import PythonicInterface, ReturnType
+from vbox_api.interface.cache import WSDLCache
 from vbox_api.interface.soap import SOAPInterface
+from vbox_api.interface.transport import TransportConfig
 
-__all__ = ["PythonicInterface", "SOAPInterface"]
+__all__ = [
+    "AsyncSOAPInterface",
+    "PythonicInterface",
+    "ReturnType",
+    "SOAPInterface",
+    "TransportConfig",
+    "WSDLCache",
+]
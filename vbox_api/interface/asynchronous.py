@@ -0,0 +1,43 @@
+"""Asynchronous interface to the VirtualBox SOAP API, using httpx via zeep."""
+
+from typing import Optional
+
+import zeep
+from zeep.proxy import AsyncServiceProxy
+from zeep.transports import AsyncTransport
+
+from vbox_api.interface.soap import SOAPInterface
+from vbox_api.interface.transport import TransportStatistics
+
+
+class AsyncSOAPInterface(SOAPInterface):
+    """
+    Class to handle asynchronous SOAP interface to VirtualBox API.
+
+    Methods return coroutines, which must be awaited in an event loop.
+    The WSDL document is still loaded synchronously on connect.
+    Requires the async extras of zeep, which install httpx.
+    """
+
+    CLIENT_CLASS = zeep.AsyncClient
+    is_async = True
+
+    def _create_transport(self) -> AsyncTransport:
+        """Return new asynchronous transport for client."""
+        return AsyncTransport(
+            cache=self.cache, operation_timeout=self.transport_config.timeout
+        )
+
+    def _create_service(self) -> AsyncServiceProxy:
+        """Return asynchronous service proxy of client for binding."""
+        binding = self.client.wsdl.bindings[self.BINDING_QNAME]
+        return AsyncServiceProxy(self.client, binding, address=self.url)
+
+    def get_transport_statistics(self) -> Optional[TransportStatistics]:
+        """Return None, as statistics are not recorded by asynchronous transport."""
+        return None
+
+    async def close(self) -> None:
+        """Close connections of asynchronous transport."""
+        if self.transport:
+            await self.transport.aclose()
@@ -1,8 +1,13 @@
 """Base interface classes to be used by an interface implementation."""
 
 import logging
+import threading
 from abc import ABC
-from typing import Callable, Optional
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Optional
+from weakref import WeakKeyDictionary
 
 from vbox_api.mixins import PropertyMixin
 from vbox_api.utils import camel_to_snake
@@ -10,12 +15,33 @@ from vbox_api.utils import camel_to_snake
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ReturnType:
+    """Dataclass to store declared return type of an interface method."""
+
+    operation: str
+    type_name: Optional[str] = None
+    is_builtin: bool = False
+    is_complex: bool = False
+    is_multiple: bool = False
+    interface_name: Optional[str] = None
+
+    @property
+    def may_contain_handles(self) -> bool:
+        """Return whether returned values may contain managed object references."""
+        return self.is_complex or (self.is_builtin and self.type_name == "string")
+
+
 class BaseInterface(ABC):
     """Define abstract base class for interface."""
 
     _INTERFACE_NAME_PREFIXES = ["get", "set", "find", "current", "create", "on", "i"]
     _INTERFACE_NAME_SUFFIXES = ["byid", "byname", "bygroups"]
 
+    api_version: Optional[str] = None
+    # Methods of asynchronous interfaces return awaitables
+    is_async: bool = False
+
     def _register_interface(
         self, interface_name: str, proxy_interface: "ProxyInterface"
     ) -> None:
@@ -63,6 +89,10 @@ class BaseInterface(ABC):
         """Return interface name for specified handle."""
         return self.IManagedObjectRef.getInterfaceName(handle)
 
+    async def get_interface_name_for_handle_async(self, handle: str) -> Optional[str]:
+        """Return interface name for specified handle from asynchronous interface."""
+        return await self.IManagedObjectRef.getInterfaceName(handle)
+
     def get_interface_for_handle(self, handle: str) -> Optional["ProxyInterface"]:
         """Return interface object for specified handle or None."""
         interface_name = self.get_interface_name_for_handle(handle)
@@ -74,6 +104,34 @@ class BaseInterface(ABC):
         """Get interface instance from interface_name."""
         return getattr(self, interface_name)
 
+    def set_api_version(self, api_version: str) -> None:
+        """Set API version reported by the VirtualBox instance."""
+        self.api_version = api_version
+
+    def get_return_type(
+        self, interface_name: str, method_name: str
+    ) -> Optional[ReturnType]:
+        """Return declared return type of method, if known."""
+        return None
+
+    def get_return_interface_name(self, return_type: ReturnType) -> Optional[str]:
+        """Return interface name of handles returned by method, if known."""
+        return return_type.interface_name
+
+    def set_return_interface_name(
+        self, return_type: ReturnType, interface_name: str
+    ) -> None:
+        """Set interface name of handles returned by method."""
+        return_type.interface_name = interface_name
+
+    def get_method_table_key(self) -> Any:
+        """
+        Return object identifying the interfaces and methods of instance.
+
+        Instances returning the same key share a method table in wrappers.
+        """
+        return self
+
 
 class ProxyInterface(PropertyMixin):
     """Class to represent a proxy interface."""
@@ -86,11 +144,49 @@ class ProxyInterface(PropertyMixin):
         setattr(self, method_name, method)
 
 
+class PythonicProxyInterface(ProxyInterface):
+    """Proxy interface to resolve Pythonic method names from a shared table."""
+
+    def __init__(
+        self, interface: ProxyInterface, method_names: Mapping[str, str]
+    ) -> None:
+        """Initialise proxy of interface with mapping of method names."""
+        self._interface = interface
+        self._method_names = method_names
+
+    def __getattr__(self, name: str) -> Callable:
+        """Resolve method of wrapped interface on first access."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            method = getattr(self._interface, self._method_names[name])
+        except KeyError:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            ) from None
+        self.__dict__[name] = method
+        return method
+
+    def _get_method_names(self) -> Iterable[str]:
+        """Return names of all methods of wrapped interface."""
+        return self._method_names.keys()
+
+
+# Mapping of interface name to wrapped interface name and method names
+MethodTable = Mapping[str, tuple[str, Mapping[str, str]]]
+
+
 class PythonicInterface(BaseInterface):
     """Wrapper to convert methods to Python naming conventions."""
 
     _METHOD_NAME_EXCLUSIONS = ["2D", "3D", "DnD", "IPv4", "IPv6", "LEDs"]
 
+    # Method tables shared between instances, keyed by wrapped interface
+    _method_tables: WeakKeyDictionary[Any, dict[bool, MethodTable]] = (
+        WeakKeyDictionary()
+    )
+    _method_tables_lock = threading.Lock()
+
     def __init__(self, interface: BaseInterface, remove_prefix: bool = True) -> None:
         """
         Initialise wrapper interface instance.
@@ -99,18 +195,114 @@ class PythonicInterface(BaseInterface):
         """
         self.interface = interface
         self._remove_prefix = remove_prefix
-        for interface_name, interface_obj in self.interface.__dict__.items():
-            if not interface_name.startswith("I"):
-                continue
-            if self._remove_prefix:
-                interface_name = interface_name.removeprefix("I")
-            proxy_interface = ProxyInterface()
+        self._register_interfaces()
+
+    def _register_interfaces(self) -> None:
+        """Register Pythonic proxy of each interface of wrapped interface."""
+        self._method_table = self.get_method_table(self.interface, self._remove_prefix)
+        for interface_name, (source_name, method_names) in self._method_table.items():
+            proxy_interface = PythonicProxyInterface(
+                self.interface.get_interface(source_name), method_names
+            )
             self._register_interface(interface_name, proxy_interface)
-            for method_name, method_callable in interface_obj.__dict__.items():
-                method_name = camel_to_snake(
-                    method_name, exclusions=self._METHOD_NAME_EXCLUSIONS
+
+    @classmethod
+    def get_method_table(
+        cls, interface: BaseInterface, remove_prefix: bool = True
+    ) -> MethodTable:
+        """
+        Return immutable table of Pythonic names for interface.
+
+        The table is generated once and shared by all wrappers of interfaces
+        with the same method table key, e.g. connections to the same web service.
+        """
+        key = interface.get_method_table_key()
+        with cls._method_tables_lock:
+            tables = cls._method_tables.setdefault(key, {})
+            if (method_table := tables.get(remove_prefix)) is None:
+                method_table = tables[remove_prefix] = cls._create_method_table(
+                    interface, remove_prefix
                 )
-                proxy_interface._register_method(method_name, method_callable)
+        return method_table
+
+    @classmethod
+    def _create_method_table(
+        cls, interface: BaseInterface, remove_prefix: bool = True
+    ) -> MethodTable:
+        """Return new table of Pythonic names for interface."""
+        logger.debug("Creating Pythonic method table")
+        method_table = {}
+        for source_name, interface_obj in interface.__dict__.items():
+            if not source_name.startswith("I"):
+                continue
+            interface_name = (
+                source_name.removeprefix("I") if remove_prefix else source_name
+            )
+            method_names = {
+                camel_to_snake(
+                    method_name, exclusions=cls._METHOD_NAME_EXCLUSIONS
+                ): method_name
+                for method_name in interface_obj.__dict__.keys()
+            }
+            method_table[interface_name] = (
+                source_name,
+                MappingProxyType(method_names),
+            )
+        return MappingProxyType(method_table)
+
+    def get_return_type(
+        self, interface_name: str, method_name: str
+    ) -> Optional[ReturnType]:
+        """Return declared return type of method from wrapped interface."""
+        try:
+            source_name, method_names = self._method_table[interface_name]
+            return self.interface.get_return_type(
+                source_name, method_names[method_name]
+            )
+        except KeyError:
+            return None
+
+    def get_return_interface_name(self, return_type: ReturnType) -> Optional[str]:
+        """Return Pythonic interface name of handles returned by method."""
+        interface_name = self.interface.get_return_interface_name(return_type)
+        if interface_name and self._remove_prefix:
+            return interface_name.removeprefix("I")
+        return interface_name
+
+    def set_return_interface_name(
+        self, return_type: ReturnType, interface_name: str
+    ) -> None:
+        """Set interface name of handles returned by method in wrapped interface."""
+        if self._remove_prefix:
+            interface_name = f"I{interface_name}"
+        self.interface.set_return_interface_name(return_type, interface_name)
+
+    def set_api_version(self, api_version: str) -> None:
+        """
+        Set API version of wrapper and wrapped interface.
+
+        If the wrapped interface was reconnected with a different WSDL,
+        proxies of its interfaces are registered again.
+        """
+        super().set_api_version(api_version)
+        key = self.interface.get_method_table_key()
+        self.interface.set_api_version(api_version)
+        if self.interface.get_method_table_key() is not key:
+            self._register_interfaces()
+
+    @property
+    def is_async(self) -> bool:
+        """Return whether wrapped interface is asynchronous."""
+        return self.interface.is_async
+
+    async def get_interface_name_for_handle_async(self, handle: str) -> Optional[str]:
+        """Return interface name for specified handle from asynchronous interface."""
+        interface_name = await self.interface.get_interface_name_for_handle_async(
+            handle
+        )
+        if interface_name and self._remove_prefix:
+            return interface_name.removeprefix("I")
+        return interface_name
 
     def get_interface_name_for_handle(self, handle: str) -> Optional[str]:
         """Return interface name for specified handle."""
@@ -0,0 +1,189 @@
+"""Persistent on-disk cache of WSDL documents and derived metadata."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import platformdirs
+from zeep.cache import Base
+
+logger = logging.getLogger(__name__)
+
+
+class WSDLCache(Base):
+    """
+    Cache WSDL documents on disk, versioned per web service host and port.
+
+    Each entry stores the raw documents fetched by zeep, alongside any
+    metadata derived from them, such as the operation table.
+    Entries are validated against a checksum on read, expire after max_age
+    seconds and the least recently updated entries are evicted beyond max_entries.
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(
+        self,
+        directory: Optional[str | Path] = None,
+        max_age: Optional[int] = 7 * 24 * 60 * 60,
+        max_entries: int = 16,
+    ) -> None:
+        """Initialise cache in specified directory or user cache directory."""
+        self.directory = (
+            Path(directory or platformdirs.user_cache_dir("vbox-api", False)) / "wsdl"
+        )
+        self.max_age = max_age
+        self.max_entries = max_entries
+
+    def _get_entry_path(self, url: str) -> Path:
+        """Return path of entry directory for host and port of url."""
+        netloc = urlparse(url).netloc or "localhost"
+        return self.directory / netloc.replace(":", "_")
+
+    def _read_index(self, entry_path: Path) -> Optional[dict[str, Any]]:
+        """Return index of entry or None if missing, invalid or expired."""
+        try:
+            with open(entry_path / self.INDEX_NAME, "r", encoding="utf-8") as fd:
+                index = json.load(fd)
+        except (OSError, ValueError):
+            return None
+        if self.max_age is not None and time.time() - index["created"] > self.max_age:
+            logger.debug(f"WSDL cache entry '{entry_path.name}' has expired")
+            self._remove_entry(entry_path)
+            return None
+        return index
+
+    def _write_index(self, entry_path: Path, index: dict[str, Any]) -> None:
+        """Atomically write index of entry."""
+        self._write_file(
+            entry_path / self.INDEX_NAME, json.dumps(index).encode("utf-8")
+        )
+
+    @staticmethod
+    def _write_file(path: Path, content: bytes) -> None:
+        """Write content to a temporary file and move into place."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(temp_path, path)
+        except OSError:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _remove_entry(entry_path: Path) -> None:
+        """Remove entry directory and all of its contents."""
+        shutil.rmtree(entry_path, ignore_errors=True)
+
+    @staticmethod
+    def _new_index() -> dict[str, Any]:
+        """Return empty index for a new entry."""
+        return {
+            "created": time.time(),
+            "api_version": None,
+            "documents": {},
+            "metadata": {},
+        }
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return cached document for url, if valid."""
+        entry_path = self._get_entry_path(url)
+        if not (index := self._read_index(entry_path)):
+            return None
+        if not (checksum := index["documents"].get(url)):
+            return None
+        try:
+            content = (entry_path / checksum).read_bytes()
+        except OSError:
+            return None
+        if hashlib.sha256(content).hexdigest() != checksum:
+            logger.warning(f"WSDL cache entry '{entry_path.name}' is corrupt")
+            self._remove_entry(entry_path)
+            return None
+        logger.debug(f"Loaded '{url}' from WSDL cache")
+        return content
+
+    def add(self, url: str, content: bytes) -> None:
+        """Store document for url and evict old entries."""
+        entry_path = self._get_entry_path(url)
+        index = self._read_index(entry_path) or self._new_index()
+        checksum = hashlib.sha256(content).hexdigest()
+        try:
+            self._write_file(entry_path / checksum, content)
+            index["documents"][url] = checksum
+            self._write_index(entry_path, index)
+        except OSError as e:
+            logger.warning(f"Could not write WSDL cache entry: {e}")
+            return None
+        logger.debug(f"Stored '{url}' in WSDL cache")
+        self.evict()
+
+    def get_api_version(self, url: str) -> Optional[str]:
+        """Return API version recorded for cache entry of url."""
+        index = self._read_index(self._get_entry_path(url))
+        return index["api_version"] if index else None
+
+    def validate(self, url: str, api_version: str) -> bool:
+        """
+        Validate cache entry of url against API version of web service.
+
+        The version is recorded for new entries. If a different version
+        was recorded, the entry is removed and False is returned.
+        """
+        entry_path = self._get_entry_path(url)
+        if not (index := self._read_index(entry_path)):
+            return True
+        if index["api_version"] is None:
+            index["api_version"] = api_version
+            self._write_index(entry_path, index)
+        elif index["api_version"] != api_version:
+            logger.warning(
+                f"WSDL cache entry '{entry_path.name}' is for API version "
+                f"'{index['api_version']}', not '{api_version}'"
+            )
+            self._remove_entry(entry_path)
+            return False
+        return True
+
+    def get_metadata(self, url: str, key: str) -> Any:
+        """Return metadata stored with cache entry of url or None."""
+        index = self._read_index(self._get_entry_path(url))
+        return index["metadata"].get(key) if index else None
+
+    def set_metadata(self, url: str, key: str, value: Any) -> None:
+        """Store JSON-serialisable metadata with cache entry of url."""
+        entry_path = self._get_entry_path(url)
+        if not (index := self._read_index(entry_path)):
+            return None
+        index["metadata"][key] = value
+        try:
+            self._write_index(entry_path, index)
+        except OSError as e:
+            logger.warning(f"Could not write WSDL cache metadata: {e}")
+
+    def evict(self) -> None:
+        """Remove least recently modified entries beyond max_entries."""
+        try:
+            entries = sorted(
+                (path for path in self.directory.iterdir() if path.is_dir()),
+                key=lambda path: path.stat().st_mtime,
+                reverse=True,
+            )
+        except OSError:
+            return None
+        for entry_path in entries[self.max_entries :]:
+            logger.debug(f"Evicting WSDL cache entry '{entry_path.name}'")
+            self._remove_entry(entry_path)
+
+    def clear(self) -> None:
+        """Remove all entries from cache."""
+        self._remove_entry(self.directory)
@@ -0,0 +1,120 @@
+"""Fast path for scalar getters, bypassing zeep serialisation and parsing."""
+
+import base64
+import io
+import logging
+from typing import Any, Callable, Optional
+from xml.sax.saxutils import escape
+
+import zeep
+from lxml import etree
+
+from vbox_api.interface.base import ReturnType
+from vbox_api.interface.transport import PooledTransport
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_boolean(text: str) -> bool:
+    """Return boolean value of XML schema boolean."""
+    return text in ("true", "1")
+
+
+class FastOperation:
+    """
+    Callable to post an operation using a precompiled envelope template.
+
+    The template is serialised once by zeep, with a placeholder for the
+    managed object reference, and the response is parsed using lxml.
+    Calls with other arguments, and faults, are handled by zeep.
+    """
+
+    PLACEHOLDER = "__vbox_api_this__"
+    CONVERTERS: dict[str, Callable[[str], Any]] = {
+        "string": str,
+        "boolean": _parse_boolean,
+        "byte": int,
+        "short": int,
+        "int": int,
+        "long": int,
+        "unsignedByte": int,
+        "unsignedShort": int,
+        "unsignedInt": int,
+        "unsignedLong": int,
+        "float": float,
+        "double": float,
+        "base64Binary": base64.b64decode,
+    }
+
+    def __init__(
+        self,
+        client: zeep.Client,
+        transport: PooledTransport,
+        address: str,
+        binding: Any,
+        operation_name: str,
+        return_type: ReturnType,
+        fallback: Callable,
+    ) -> None:
+        """Initialise operation, compiling its envelope template on first call."""
+        self.client = client
+        self.transport = transport
+        self.address = address
+        self.binding = binding
+        self.operation_name = operation_name
+        self.fallback = fallback
+        self.multiple = return_type.is_multiple
+        self.converter = (
+            self.CONVERTERS[return_type.type_name] if return_type.is_builtin else str
+        )
+        self._template: Optional[tuple[bytes, bytes, dict[str, str]]] = None
+
+    def get_template(self) -> tuple[bytes, bytes, dict[str, str]]:
+        """Return envelope before and after handle, with headers, on first call."""
+        if self._template is None:
+            envelope, headers = self.binding._create(
+                self.operation_name, (self.PLACEHOLDER,), {}, client=self.client
+            )
+            prefix, suffix = zeep.wsdl.utils.etree_to_string(envelope).split(
+                self.PLACEHOLDER.encode("utf-8")
+            )
+            self._template = (prefix, suffix, dict(headers))
+        return self._template
+
+    @classmethod
+    def is_supported(cls, operation: Any, return_type: ReturnType) -> bool:
+        """Return whether operation only takes a handle and returns scalars."""
+        input_names = [name for name, _ in operation.input.body.type.elements]
+        if input_names != ["_this"]:
+            return False
+        if return_type.type_name is None or return_type.is_complex:
+            return False
+        return not return_type.is_builtin or return_type.type_name in cls.CONVERTERS
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """Call operation with handle, else fall back to zeep."""
+        if len(args) != 1 or kwargs:
+            return self.fallback(*args, **kwargs)
+        prefix, suffix, headers = self.get_template()
+        message = prefix + escape(str(args[0])).encode("utf-8") + suffix
+        response = self.transport.post_message(
+            self.address, message, headers, self.operation_name
+        )
+        if response.status_code != 200:
+            # Raise fault or transport error as zeep would
+            operation = self.binding.get(self.operation_name)
+            return self.binding.process_reply(self.client, operation, response)
+        return self.parse(response.content)
+
+    def parse(self, content: bytes) -> Any:
+        """Parse return values from response content."""
+        values = []
+        for _, element in etree.iterparse(
+            io.BytesIO(content), events=("end",), tag="{*}returnval"
+        ):
+            text = element.text
+            values.append(self.converter(text) if text is not None else None)
+            element.clear()
+        if self.multiple:
+            return values
+        return values[0] if values else None
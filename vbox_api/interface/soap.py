@@ -1,51 +1,240 @@
 """SOAP interface implementation to VirtualBox API."""
 
+import logging
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
+from weakref import WeakKeyDictionary
 
 import requests
 import zeep
 from lxml import etree
 
-from vbox_api.interface.base import BaseInterface, ProxyInterface
+from vbox_api.interface.base import BaseInterface, ProxyInterface, ReturnType
+from vbox_api.interface.cache import WSDLCache
+from vbox_api.interface.fastpath import FastOperation
+from vbox_api.interface.transport import (
+    PooledTransport,
+    TransportConfig,
+    TransportStatistics,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class SOAPInterface(BaseInterface):
     """Define interface class for SOAP methods."""
 
     BINDING_QNAME = "{http://www.virtualbox.org/}vboxBinding"
+    CLIENT_CLASS = zeep.Client
     TYPES_QNAME = "{http://schemas.xmlsoap.org/wsdl/}types"
     SCHEMA_QNAME = "{http://www.w3.org/2001/XMLSchema}schema"
     SIMPLETYPE_QNAME = "{http://www.w3.org/2001/XMLSchema}simpleType"
     RESTRICTION_QNAME = "{http://www.w3.org/2001/XMLSchema}restriction"
     ENUMERATION_QNAME = "{http://www.w3.org/2001/XMLSchema}enumeration"
+    XSD_NAMESPACE = "http://www.w3.org/2001/XMLSchema"
+
+    # Parsed documents shared between instances, with API version if known
+    _documents: dict[str, tuple[zeep.wsdl.Document, Optional[str]]] = {}
+    _documents_lock = threading.Lock()
+    # Return types of operations shared between instances, keyed by document
+    _return_types: WeakKeyDictionary[zeep.wsdl.Document, dict[str, ReturnType]] = (
+        WeakKeyDictionary()
+    )
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 18083,
+        cache: Optional[WSDLCache] = None,
+        transport_config: Optional[TransportConfig] = None,
+        fast_path: bool = False,
+    ) -> None:
+        """
+        Initialise instance of interface.
 
-    def __init__(self, host: str = "localhost", port: int = 18083) -> None:
-        """Initialise instance of interface."""
+        If cache is specified, WSDL documents will be stored on disk
+        and reused by subsequent connections to the same web service.
+        The transport_config specifies the connection pool, timeouts and
+        retries of the HTTP transport.
+        If fast_path is True, getters of scalar values are called using
+        precompiled envelopes and parsed using lxml, bypassing zeep.
+        """
         self.host = host
         self.port = port
         self.url = f"http://{self.host}:{self.port}"
         self.wsdl = f"{self.url}/?wsdl"
+        self.cache = cache
+        self.transport_config = transport_config or TransportConfig()
+        self.fast_path = fast_path
+        self.transport: Optional[zeep.Transport] = None
         self.client: Optional[zeep.Client] = None
         self.service: Optional[zeep.proxy.ServiceProxy] = None
+        self.return_types: dict[str, ReturnType] = {}
+
+    def _create_transport(self) -> zeep.Transport:
+        """Return new pooled transport for client."""
+        return PooledTransport(self.transport_config, cache=self.cache)
+
+    def get_transport_statistics(self) -> Optional[TransportStatistics]:
+        """Return utilisation statistics of transport, if connected."""
+        return self.transport.get_statistics() if self.transport else None
+
+    def _get_document(self, transport: zeep.Transport) -> zeep.wsdl.Document:
+        """
+        Return parsed WSDL document for web service.
+
+        Documents are parsed once per process and shared between instances
+        connected to the same web service.
+        """
+        with self._documents_lock:
+            if (entry := self._documents.get(self.wsdl)) is None:
+                logger.debug(f"Parsing WSDL from '{self.wsdl}'")
+                api_version = (
+                    self.cache.get_api_version(self.wsdl) if self.cache else None
+                )
+                entry = (zeep.wsdl.Document(self.wsdl, transport), api_version)
+                self._documents[self.wsdl] = entry
+        return entry[0]
 
     def connect(self) -> None:
         """Connect to VirtualBox web service."""
-        self.client = zeep.Client(self.wsdl)
-        self.service = self.client.create_service(self.BINDING_QNAME, self.url)
+        transport = self.transport = self._create_transport()
+        self.client = self.CLIENT_CLASS(
+            self._get_document(transport), transport=transport
+        )
+        self.service = self._create_service()
+        self.return_types = self._get_return_types()
         self._register_methods()
 
+    def _create_service(self) -> zeep.proxy.ServiceProxy:
+        """Return service proxy of client for binding at URL of web service."""
+        return self.client.create_service(self.BINDING_QNAME, self.url)
+
+    def _get_return_types(self) -> dict[str, ReturnType]:
+        """Return types of operations, extracted once per parsed document."""
+        document = self.client.wsdl
+        with self._documents_lock:
+            if (return_types := self._return_types.get(document)) is None:
+                return_types = self._create_return_types()
+                self._return_types[document] = return_types
+        return return_types
+
+    def _create_return_types(self) -> dict[str, ReturnType]:
+        """
+        Extract declared return types of operations from parsed document.
+
+        Interface names of returned handles are not declared by the WSDL,
+        so any previously learnt names are loaded from the cache.
+        """
+        binding = self.client.wsdl.bindings[self.BINDING_QNAME]
+        interface_names = (
+            self.cache.get_metadata(self.wsdl, "return_interfaces")
+            if self.cache
+            else None
+        ) or {}
+        return_types = {}
+        for operation_name, operation in binding._operations.items():
+            return_type = ReturnType(
+                operation_name, interface_name=interface_names.get(operation_name)
+            )
+            body = operation.output.body if operation.output else None
+            elements = body.type.elements if body is not None else []
+            if len(elements) > 1:
+                # Output parameters are returned as a mapping
+                return_type.is_complex = True
+            elif elements:
+                _, element = elements[0]
+                qname = etree.QName(element.type.qname) if element.type.qname else None
+                return_type.type_name = qname.localname if qname else None
+                return_type.is_builtin = bool(
+                    qname and qname.namespace == self.XSD_NAMESPACE
+                )
+                return_type.is_complex = (
+                    isinstance(element.type, zeep.xsd.ComplexType) or not qname
+                )
+                return_type.is_multiple = element.accepts_multiple
+            return_types[operation_name] = return_type
+        return return_types
+
+    def get_return_type(
+        self, interface_name: str, method_name: str
+    ) -> Optional[ReturnType]:
+        """Return declared return type of operation."""
+        return self.return_types.get(f"{interface_name}_{method_name}")
+
+    def set_return_interface_name(
+        self, return_type: ReturnType, interface_name: str
+    ) -> None:
+        """Set interface name of handles returned by operation and store in cache."""
+        super().set_return_interface_name(return_type, interface_name)
+        if not self.cache:
+            return None
+        interface_names = {
+            operation_name: return_type.interface_name
+            for operation_name, return_type in self.return_types.items()
+            if return_type.interface_name
+        }
+        self.cache.set_metadata(self.wsdl, "return_interfaces", interface_names)
+
+    def get_method_table_key(self) -> Any:
+        """Return parsed WSDL document, shared by connections to web service."""
+        return self.client.wsdl if self.client else self
+
+    def set_api_version(self, api_version: str) -> None:
+        """
+        Set API version of web service and validate parsed WSDL.
+
+        If the WSDL was parsed for a different version, discard it and
+        reconnect, so that the current version is fetched and used.
+        """
+        super().set_api_version(api_version)
+        valid = self.cache.validate(self.wsdl, api_version) if self.cache else True
+        with self._documents_lock:
+            if (entry := self._documents.get(self.wsdl)) is None:
+                return None
+            document, parsed_version = entry
+            if valid and parsed_version in (None, api_version):
+                self._documents[self.wsdl] = (document, api_version)
+                return None
+            logger.warning(f"WSDL for '{self.url}' is stale, reconnecting")
+            self._documents.pop(self.wsdl)
+        self.connect()
+        self.set_api_version(api_version)
+
     def _register_methods(self) -> None:
         """Add methods from SOAP service to instance."""
         if not self.service:
             raise RuntimeError("Service has not yet been created")
         for operation, method_callable in self.service._operations.items():
+            if self.fast_path and isinstance(self.transport, PooledTransport):
+                method_callable = self._create_fast_operation(
+                    operation, method_callable
+                )
             interface_name, method_name = operation.split("_")
             if (proxy_interface := getattr(self, interface_name, None)) is None:
                 proxy_interface = ProxyInterface()
                 self._register_interface(interface_name, proxy_interface)
             proxy_interface._register_method(method_name, method_callable)
 
+    def _create_fast_operation(
+        self, operation_name: str, method_callable: Callable
+    ) -> Callable:
+        """Return fast path for operation if supported, else method_callable."""
+        binding = self.service._binding
+        return_type = self.return_types[operation_name]
+        if not FastOperation.is_supported(binding.get(operation_name), return_type):
+            return method_callable
+        return FastOperation(
+            self.client,
+            self.transport,
+            self.url,
+            binding,
+            operation_name,
+            return_type,
+            fallback=method_callable,
+        )
+
     def get_enums(self, path: Optional[str | Path] = None) -> dict[str, list[str]]:
         """Return dictionary of enums in WSDL document."""
         if path:
@@ -0,0 +1,244 @@
+"""HTTP transport to web service with connection pooling and retries."""
+
+import logging
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import requests
+import zeep
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from zeep.cache import Base
+from zeep.wsdl.utils import etree_to_string
+
+logger = logging.getLogger(__name__)
+
+# Getters which change state or create managed objects, so must not be retried
+NON_IDEMPOTENT_GETTERS = frozenset(
+    {
+        "IEventSource_getEvent",
+        "IWebsessionManager_getSessionObject",
+    }
+)
+
+
+@dataclass
+class TransportConfig:
+    """
+    Dataclass to store configuration of HTTP transport.
+
+    Timeouts are specified in seconds, where None waits indefinitely.
+    Operation timeouts override the default timeout by operation name,
+    such as 'IProgress_waitForCompletion'.
+    Getters, except those in NON_IDEMPOTENT_GETTERS, are retried on
+    connection errors and timeouts, waiting
+    backoff_factor * 2 ** attempt seconds between attempts.
+    """
+
+    pool_connections: int = 1
+    pool_maxsize: int = 16
+    pool_block: bool = True
+    timeout: Optional[float] = None
+    operation_timeouts: dict[str, Optional[float]] = field(default_factory=dict)
+    keepalive: bool = True
+    keepalive_idle: int = 60
+    keepalive_interval: int = 10
+    keepalive_count: int = 6
+    retries: int = 2
+    backoff_factor: float = 0.1
+
+    def get_socket_options(self) -> list[tuple[int, int, int]]:
+        """Return socket options of connections, enabling TCP keep-alive."""
+        options = list(HTTPConnection.default_socket_options)
+        if not self.keepalive:
+            return options
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        for name, value in (
+            ("TCP_KEEPIDLE", self.keepalive_idle),
+            ("TCP_KEEPINTVL", self.keepalive_interval),
+            ("TCP_KEEPCNT", self.keepalive_count),
+        ):
+            # Not all options are available on all platforms
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        return options
+
+
+@dataclass
+class TransportStatistics:
+    """Dataclass to store utilisation statistics of transport."""
+
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    active: int = 0
+    peak_active: int = 0
+    opened_connections: int = 0
+    idle_connections: int = 0
+    pool_maxsize: int = 0
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter subclass to set socket options of pooled connections."""
+
+    def __init__(self, config: TransportConfig) -> None:
+        """Initialise adapter with pool sizes of configuration."""
+        self.transport_config = config
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        """Initialise pool manager with socket options of configuration."""
+        kwargs["socket_options"] = self.transport_config.get_socket_options()
+        super().init_poolmanager(*args, **kwargs)
+
+    def get_pools(self) -> list[Any]:
+        """Return connection pools of pool manager."""
+        return [
+            self.poolmanager.pools[key] for key in list(self.poolmanager.pools.keys())
+        ]
+
+
+class PooledTransport(zeep.Transport):
+    """
+    Transport subclass to post operations over a pool of connections.
+
+    The timeout of the current operation is stored per thread,
+    so concurrent operations can use different timeouts.
+    A timeout set by the settings context manager applies to operations of
+    the current thread, instead of the timeouts of the configuration.
+    """
+
+    UNSET = object()
+
+    def __init__(
+        self, config: Optional[TransportConfig] = None, cache: Optional[Base] = None
+    ) -> None:
+        """Initialise transport with configuration and pooled session."""
+        self.config = config or TransportConfig()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._statistics = TransportStatistics(pool_maxsize=self.config.pool_maxsize)
+        self.adapter = PooledHTTPAdapter(self.config)
+        session = requests.Session()
+        session.mount("http://", self.adapter)
+        session.mount("https://", self.adapter)
+        super().__init__(
+            cache=cache, operation_timeout=self.config.timeout, session=session
+        )
+        # Session is owned by transport, so close it with transport
+        self._close_session = True
+
+    @property
+    def operation_timeout(self) -> Optional[float]:
+        """Return timeout of current operation, else default timeout."""
+        return getattr(self._local, "timeout", self._default_timeout)
+
+    @operation_timeout.setter
+    def operation_timeout(self, timeout: Optional[float]) -> None:
+        """Set default timeout of operations."""
+        self._default_timeout = timeout
+
+    @contextmanager
+    def settings(self, timeout: Optional[float] = None) -> Iterator[None]:
+        """Set timeout of operations of current thread within context manager."""
+        previous = getattr(self._local, "settings_timeout", self.UNSET)
+        self._local.settings_timeout = timeout
+        try:
+            yield
+        finally:
+            self._local.settings_timeout = previous
+
+    @staticmethod
+    def get_operation_name(envelope: etree._Element) -> Optional[str]:
+        """Return name of operation from body of envelope."""
+        for body in envelope.iter("{*}Body"):
+            for element in body:
+                return etree.QName(element).localname
+        return None
+
+    @staticmethod
+    def is_idempotent(operation_name: Optional[str]) -> bool:
+        """Return whether operation only gets a value, so can be retried."""
+        if not operation_name or operation_name in NON_IDEMPOTENT_GETTERS:
+            return False
+        _, _, method_name = operation_name.rpartition("_")
+        return method_name.startswith("get")
+
+    def post_xml(
+        self, address: str, envelope: etree._Element, headers: dict[str, str]
+    ) -> requests.Response:
+        """Post envelope with timeout of operation, retrying idempotent getters."""
+        return self.post_message(
+            address,
+            etree_to_string(envelope),
+            headers,
+            self.get_operation_name(envelope),
+        )
+
+    def post_message(
+        self,
+        address: str,
+        message: bytes,
+        headers: dict[str, str],
+        operation_name: Optional[str],
+    ) -> requests.Response:
+        """Post serialised message of operation, retrying idempotent getters."""
+        retries = self.config.retries if self.is_idempotent(operation_name) else 0
+        timeout = getattr(self._local, "settings_timeout", self.UNSET)
+        if timeout is self.UNSET:
+            timeout = self.config.operation_timeouts.get(
+                operation_name, self._default_timeout
+            )
+        self._local.timeout = timeout
+        self._update_active(1)
+        try:
+            for attempt in range(retries + 1):
+                try:
+                    return self.post(address, message, headers)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    if attempt == retries:
+                        with self._lock:
+                            self._statistics.failures += 1
+                        raise
+                    delay = self.config.backoff_factor * 2**attempt
+                    logger.warning(
+                        f"Retrying '{operation_name}' in {delay:.2f} seconds: {e}"
+                    )
+                    with self._lock:
+                        self._statistics.retries += 1
+                    time.sleep(delay)
+        finally:
+            self._update_active(-1)
+            del self._local.timeout
+
+    def _update_active(self, delta: int) -> None:
+        """Update number of active operations and peak utilisation."""
+        with self._lock:
+            statistics = self._statistics
+            statistics.active += delta
+            if delta > 0:
+                statistics.requests += 1
+                statistics.peak_active = max(statistics.peak_active, statistics.active)
+
+    def get_statistics(self) -> TransportStatistics:
+        """Return snapshot of utilisation statistics of transport."""
+        with self._lock:
+            statistics = TransportStatistics(**vars(self._statistics))
+        for pool in self.adapter.get_pools():
+            statistics.opened_connections += pool.num_connections
+            if pool.pool is not None:
+                # Queue of pool is filled with None for connections not yet opened
+                statistics.idle_connections += sum(
+                    1 for connection in list(pool.pool.queue) if connection
+                )
+        return statistics
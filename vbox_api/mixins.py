@@ -1,42 +1,45 @@
 """Class mixins to provide shared functionality across independent classes."""
 
 import functools
-from typing import Any, Callable
+from collections.abc import Iterable
+from typing import Callable
+
+
+@functools.cache
+def get_class_method_names(cls: type) -> tuple[str, ...]:
+    """Return names of public methods of class and its bases, computed once."""
+    method_names: dict[str, None] = {}
+    for base in reversed(cls.__mro__):
+        for name, value in base.__dict__.items():
+            if callable(value) and not name.startswith("_"):
+                method_names[name] = None
+    return tuple(method_names)
 
 
 class PropertyMixin:
     """Mixin to add properties to get getter/setter methods."""
 
-    @property
-    def _bound_methods(self) -> dict[str, Callable]:
-        """Return dict of bound methods."""
-        methods: dict[str, Callable[..., Any]] = {}
-        for cls in (self.__class__, *self.__class__.__bases__):
-            for name, method in filter(
-                lambda item: callable(item[1]), cls.__dict__.items()
-            ):
-                try:
-                    methods[name] = functools.partial(
-                        method, getattr(self, name).__self__
-                    )
-                except AttributeError:
-                    # Function does not have __self__ attribute, i.e. staticmethod
-                    methods[name] = method
-        return methods
+    def _get_method_names(self) -> Iterable[str]:
+        """Return names of all public methods of instance and its class."""
+        instance_method_names = [
+            name
+            for name, value in self.__dict__.items()
+            if callable(value) and not name.startswith("_")
+        ]
+        return dict.fromkeys(
+            [*instance_method_names, *get_class_method_names(self.__class__)]
+        )
 
     @property
     def _methods(self) -> dict[str, Callable]:
         """
         Return dict of all callable methods.
 
-        If the method is bound, return a partial function implicitly passing
-        the bound object.
+        Methods defined by the class are returned bound to the instance.
         """
-        d = {**self.__dict__, **self._bound_methods}
         return {
-            method_name: method
-            for method_name, method in d.items()
-            if callable(method) and not method_name.startswith("_")
+            method_name: getattr(self, method_name)
+            for method_name in self._get_method_names()
         }
 
     @property
@@ -49,10 +52,23 @@ class PropertyMixin:
         """Return dict of set methods and their associated property."""
         return self._get_methods_with_prefix("set")
 
+    def _get_method_names_with_prefix(self, prefix: str) -> dict[str, str]:
+        """Return dict of method names with specified prefix by property."""
+        return {
+            method_name.removeprefix(prefix).lstrip("_"): method_name
+            for method_name in self._get_method_names()
+            if method_name.startswith(prefix)
+        }
+
+    def _get_method_with_prefix(self, prefix: str, property_name: str) -> Callable:
+        """Return method with specified prefix for property, binding only it."""
+        return getattr(self, self._get_method_names_with_prefix(prefix)[property_name])
+
     def _get_methods_with_prefix(self, prefix: str) -> dict[str, Callable]:
         """Return dict of methods with specified prefix."""
         return {
-            method_name.removeprefix(prefix).lstrip("_"): method
-            for method_name, method in self._methods.items()
-            if method_name.startswith(prefix)
+            property_name: getattr(self, method_name)
+            for property_name, method_name in self._get_method_names_with_prefix(
+                prefix
+            ).items()
         }
@@ -10,8 +10,12 @@ from vbox_api.models.event import (
     Event,
     EventListener,
     EventListenerLoop,
+    EventLoopStatistics,
     EventSource,
+    EventStream,
     PassiveEventListener,
+    Subscription,
+    SubscriptionRegistry,
 )
 from vbox_api.models.machine import Machine
 from vbox_api.models.medium import Medium
@@ -20,7 +24,12 @@ from vbox_api.models.platform import PlatformProperties
 from vbox_api.models.progress import Progress
 from vbox_api.models.session import Session
 from vbox_api.models.unattended import Unattended
-from vbox_api.models.virtualbox import VirtualBox
+from vbox_api.models.virtualbox import (
+    FleetOperation,
+    FleetResult,
+    FleetStatus,
+    VirtualBox,
+)
 from vbox_api.models.vrde import VRDEServer
 
 __all__ = [
@@ -28,7 +37,12 @@ __all__ = [
     "Event",
     "EventListener",
     "EventListenerLoop",
+    "EventLoopStatistics",
     "EventSource",
+    "EventStream",
+    "FleetOperation",
+    "FleetResult",
+    "FleetStatus",
     "Machine",
     "Medium",
     "NetworkAdapter",
@@ -36,6 +50,8 @@ __all__ = [
     "PlatformProperties",
     "Progress",
     "Session",
+    "Subscription",
+    "SubscriptionRegistry",
     "Unattended",
     "VirtualBox",
     "VRDEServer",
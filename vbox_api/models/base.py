@@ -1,13 +1,18 @@
+import asyncio
 import functools
 import logging
+import threading
 import types
 from abc import ABC, ABCMeta
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Optional, Type
-from weakref import WeakValueDictionary
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from vbox_api import api
-from vbox_api.mixins import PropertyMixin
+from vbox_api.interface.base import ProxyInterface, ReturnType
+from vbox_api.mixins import PropertyMixin, get_class_method_names
 
 logger = logging.getLogger(__name__)
 
@@ -18,23 +23,44 @@ class BaseModelRegister(ABCMeta, type):
     _handles: defaultdict[
         Type["BaseModel"], WeakValueDictionary["api.Handle", "BaseModel"]
     ] = defaultdict(WeakValueDictionary)
+    _lock = threading.Lock()
 
     def __call__(
         cls, ctx: "api.Context", handle: Optional["api.Handle"] = None, *args, **kwargs
     ) -> "BaseModel":
         """Return instance for given handle if exists, else create instance."""
-        instance = cls._handles[cls].get(handle) if handle else None
+        instance = cls._handles[cls].get(handle) if handle is not None else None
         if instance is None:
             instance = super(BaseModelRegister, cls).__call__(
                 ctx, handle, *args, **kwargs
             )
-            if instance.handle:
+            if instance.handle is not None:
                 logger.debug(
                     f"Instantiating model '{cls.__name__}' for handle '{handle}'"
                 )
-                cls._handles[cls][instance.handle] = instance
+                # Return instance registered by another thread in the meantime
+                with BaseModelRegister._lock:
+                    registered = cls._handles[cls].setdefault(instance.handle, instance)
+                if registered is instance and ctx.reference_tracker is not None:
+                    cls._track(ctx.reference_tracker.track, instance)
+                    return instance
+                instance = registered
+        if instance.handle is not None and ctx.reference_tracker is not None:
+            cls._track(ctx.reference_tracker.retain, instance)
         return instance
 
+    def _track(
+        cls, track: Callable[["BaseModel"], None], instance: "BaseModel"
+    ) -> None:
+        """Track instance, unregistering it if its handle was released."""
+        try:
+            track(instance)
+        except api.ReleasedHandleError:
+            with BaseModelRegister._lock:
+                if cls._handles[cls].get(instance.handle) is instance:
+                    del cls._handles[cls][instance.handle]
+            raise
+
 
 class ModelRegister(BaseModelRegister):
     """Metaclass for derived classes of BaseModel."""
@@ -45,17 +71,23 @@ class ModelRegister(BaseModelRegister):
         cls, name: str, bases: tuple[Type["BaseModel"]], namespace: dict[str, Any]
     ) -> Type["BaseModel"]:
         """Return class for given name if exists, else create class."""
-        model = cls._models.get(name)
-        if model is None:
-            logger.debug(f"Dynamically creating model '{name}'")
-            model = super().__new__(cls, name, bases, namespace)
-            cls._models[name] = model
+        with BaseModelRegister._lock:
+            model = cls._models.get(name)
+            if model is None:
+                logger.debug(f"Dynamically creating model '{name}'")
+                model = super().__new__(cls, name, bases, namespace)
+                cls._models[name] = model
         return model
 
 
 class BaseModel(ABC, PropertyMixin, metaclass=BaseModelRegister):
     """Base class to handle model attributes and methods."""
 
+    # Method names by property name, per model class and prefix
+    _dispatch_tables: WeakKeyDictionary[
+        ProxyInterface, dict[tuple[Type["BaseModel"], str], dict[str, str]]
+    ] = WeakKeyDictionary()
+
     def __init__(
         self,
         ctx: "api.Context",
@@ -65,14 +97,12 @@ class BaseModel(ABC, PropertyMixin, metaclass=BaseModelRegister):
         """Initialise instance of model with information."""
         self.ctx = ctx
         self._handle = handle
-        self._proxy_interface = self.ctx.interface.get_interface(
-            model_name or self.__class__.__name__
-        )
-        self._bind_interface_methods()
+        self._interface_name = model_name or self.__class__.__name__
+        self._proxy_interface = self.ctx.interface.get_interface(self._interface_name)
 
     def __str__(self) -> str:
         """Return handle for string representation of instance if set."""
-        return str(self.handle) if self.handle else repr(self)
+        return str(self.handle) if self.handle is not None else repr(self)
 
     def __bool__(self) -> bool:
         """Return whether handle is valid."""
@@ -80,19 +110,62 @@ class BaseModel(ABC, PropertyMixin, metaclass=BaseModelRegister):
 
     def __getattr__(self, name: str) -> Any:
         """Handle getting model attributes at runtime."""
-        try:
-            return self._getters[name]()
-        except KeyError:
+        if (method := self._bind_interface_method(name)) is not None:
+            return method
+        method_name = self._get_method_names_with_prefix("get").get(name)
+        if method_name is None:
             raise AttributeError(
                 f"'{self.__class__.__name__}' model has no attribute '{name}'"
-            ) from None
+            )
+        property_cache = self.ctx.property_cache
+        if (
+            property_cache is None
+            or not property_cache.active
+            or self.handle is None
+            or self.ctx.interface.is_async
+        ):
+            return getattr(self, method_name)()
+        value = property_cache.get(self.handle, name)
+        if value is property_cache.MISSING:
+            value = getattr(self, method_name)()
+            property_cache.set(self.handle, name, value)
+        return value
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Handle setting model attributes at runtime."""
-        try:
-            self._setters[name](value)
-        except KeyError:
+        method_name = self._get_method_names_with_prefix("set").get(name)
+        if method_name is None:
             super().__setattr__(name, value)
+        elif self.ctx.interface.is_async:
+            raise TypeError(
+                f"Properties of asynchronous models must be set using "
+                f"'await model.{method_name}(value)'"
+            )
+        else:
+            getattr(self, method_name)(value)
+            self.invalidate(name)
+
+    def _get_method_names(self) -> Iterable[str]:
+        """Return names of methods of model class and proxy interface."""
+        method_names = dict.fromkeys(get_class_method_names(self.__class__))
+        if (proxy_interface := self.__dict__.get("_proxy_interface")) is not None:
+            method_names.update(dict.fromkeys(proxy_interface._get_method_names()))
+        return method_names
+
+    def _get_method_names_with_prefix(self, prefix: str) -> dict[str, str]:
+        """
+        Return dict of method names with specified prefix by property.
+
+        The dispatch table is computed once per model class and proxy interface.
+        """
+        proxy_interface = self.__dict__.get("_proxy_interface")
+        if proxy_interface is None:
+            return super()._get_method_names_with_prefix(prefix)
+        tables = self._dispatch_tables.setdefault(proxy_interface, {})
+        key = (self.__class__, prefix)
+        if (table := tables.get(key)) is None:
+            table = tables[key] = super()._get_method_names_with_prefix(prefix)
+        return table
 
     def _get_model_class_for_value(
         self, value: str, base_model: Optional[Type["BaseModel"]] = None
@@ -105,7 +178,7 @@ class BaseModel(ABC, PropertyMixin, metaclass=BaseModelRegister):
         if not api.Handle.is_handle(value):
             match = self.ctx.interface.match_interface_name(value)
         else:
-            match = self.ctx.interface.get_interface_name_for_handle(value)
+            match = self.ctx.get_interface_name_for_handle(value)
         if not match:
             return None
         if not base_model:
@@ -135,12 +208,122 @@ class BaseModel(ABC, PropertyMixin, metaclass=BaseModelRegister):
             return value
         return model(self.ctx, self.ctx.get_handle(value))
 
-    def _parse_property(self, value: Any) -> Any:
-        """Parse value of a property and return model instance if possible."""
+    def _register_returned_handles(self, value: Any, return_type: ReturnType) -> None:
+        """
+        Cache interface name of handles returned by a method.
+
+        Returned handles have the interface declared by the method, so it is
+        only requested from the server once per method, then inferred.
+        Handles of methods returning subinterfaces, such as events, are
+        resolved individually instead.
+        """
+        elements = value if isinstance(value, list) else [value]
+        handles = [element for element in elements if api.Handle.is_handle(element)]
+        if not handles:
+            return None
+        interface_name = self.ctx.interface.get_return_interface_name(return_type)
+        if interface_name is None:
+            interface_name = self.ctx.get_interface_name_for_handle(handles[0])
+            if not self._is_declared_interface(return_type, interface_name):
+                return None
+            self.ctx.interface.set_return_interface_name(return_type, interface_name)
+        for handle in handles:
+            self.ctx.interface_names[handle] = interface_name
+
+    def _is_declared_interface(
+        self, return_type: ReturnType, interface_name: Optional[str]
+    ) -> bool:
+        """
+        Return whether interface name is the one declared by method name.
+
+        Methods such as get_machines return handles of a single interface,
+        which can be inferred for all handles. Methods returning a base
+        interface, such as get_event, return handles of many subinterfaces.
+        """
+        if not interface_name:
+            return False
+        _, _, method_name = return_type.operation.rpartition("_")
+        return self.ctx.interface.match_interface_name(method_name) == interface_name
+
+    @staticmethod
+    def _iter_handles(value: Any) -> Iterator[str]:
+        """Yield handles in value, or list or mappings in list of value."""
+        for element in value if isinstance(value, list) else [value]:
+            if isinstance(element, str):
+                if api.Handle.is_handle(element):
+                    yield element
+                continue
+            try:
+                for key in element:
+                    if isinstance(element[key], str) and api.Handle.is_handle(
+                        element[key]
+                    ):
+                        yield element[key]
+            except TypeError:
+                pass
+
+    async def _resolve_interface_names(
+        self, value: Any, return_type: Optional[ReturnType] = None
+    ) -> None:
+        """
+        Request interface names of handles in value concurrently.
+
+        Names are cached in the context, so returned handles can then be
+        parsed without blocking the event loop.
+        """
+        if return_type is not None and not return_type.may_contain_handles:
+            return None
+        handles = list(dict.fromkeys(self._iter_handles(value)))
+        if not handles:
+            return None
+        if return_type is not None and not return_type.is_complex:
+            interface_name = self.ctx.interface.get_return_interface_name(return_type)
+            if interface_name is None:
+                interface_name = await self.ctx.get_interface_name_for_handle_async(
+                    handles[0]
+                )
+                if self._is_declared_interface(return_type, interface_name):
+                    self.ctx.interface.set_return_interface_name(
+                        return_type, interface_name
+                    )
+                else:
+                    interface_name = None
+            if interface_name is not None:
+                for handle in handles:
+                    self.ctx.interface_names[handle] = interface_name
+                return None
+        await asyncio.gather(
+            *(
+                self.ctx.get_interface_name_for_handle_async(handle)
+                for handle in handles
+                if handle not in self.ctx.interface_names
+            )
+        )
+
+    def _parse_property(
+        self, value: Any, return_type: Optional[ReturnType] = None
+    ) -> Any:
+        """
+        Parse value of a property and return model instance if possible.
+
+        If the declared return type of the method is specified, values which
+        cannot be handles are returned as is, and the interface of returned
+        handles is inferred from the method.
+        Interface names of handles are resolved individually, unless cached
+        for all handles returned by a method declaring their interface.
+        """
+        if return_type is not None:
+            if not return_type.may_contain_handles:
+                return value
+            if not return_type.is_complex:
+                self._register_returned_handles(value, return_type)
         if not isinstance(value, list):
             return self._get_model_from_value(value)
         models = []
         for element in value:
+            if api.Handle.is_handle(element):
+                models.append(self._get_model_from_value(element))
+                continue
             try:
                 # Forcefully test if element is a mapping
                 for key in element:
@@ -150,22 +333,71 @@ class BaseModel(ABC, PropertyMixin, metaclass=BaseModelRegister):
                 models.append(self._get_model_from_value(element))
         return models
 
-    def _wrap_property(self, func: Callable) -> Callable:
+    def _wrap_property(
+        self, func: Callable, return_type: Optional[ReturnType] = None
+    ) -> Callable:
         """Wrap a property method to parse results."""
+        if self.ctx.interface.is_async:
+
+            @functools.wraps(func)
+            async def inner_async(*args, **kwargs) -> Any:
+                value = await func(*args, **kwargs)
+                await self._resolve_interface_names(value, return_type)
+                return self._parse_property(value, return_type)
+
+            return inner_async
+
+        @functools.wraps(func)
+        def inner(*args, **kwargs) -> Any:
+            try:
+                return self._parse_property(func(*args, **kwargs), return_type)
+            except api.ReleasedHandleError as e:
+                # Web service returns a new handle once the previous is released
+                logger.debug(f"Calling method again for new handle: {e}")
+                return self._parse_property(func(*args, **kwargs), return_type)
+
+        return inner
+
+    def _wrap_invalidate(self, func: Callable) -> Callable:
+        """Wrap a method which may modify the model to invalidate cached properties."""
 
         @functools.wraps(func)
         def inner(*args, **kwargs) -> Any:
-            return self._parse_property(func(*args, **kwargs))
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.invalidate()
 
         return inner
 
-    def _bind_interface_methods(self) -> None:
-        """Bind methods of interface to instance of model, passing handle."""
-        for method_name, method in self._proxy_interface._methods.items():
-            bound_method = functools.partial(method, self.handle)
-            bound_method = functools.update_wrapper(bound_method, method)
-            wrapped_method = self._wrap_property(bound_method)
-            setattr(self, method_name, wrapped_method)
+    def _bind_interface_method(self, method_name: str) -> Optional[Callable]:
+        """
+        Bind method of interface to instance of model, passing handle.
+
+        Methods are bound on first access and stored on the instance,
+        so subsequent lookups do not reach __getattr__.
+        """
+        proxy_interface = self.__dict__.get("_proxy_interface")
+        if proxy_interface is None or method_name.startswith("_"):
+            return None
+        method = getattr(proxy_interface, method_name, None)
+        if not callable(method):
+            return None
+        bound_method = functools.partial(method, self.handle)
+        bound_method = functools.update_wrapper(bound_method, method)
+        return_type = self.ctx.interface.get_return_type(
+            self._interface_name, method_name
+        )
+        wrapped_method = self._wrap_property(bound_method, return_type)
+        if not method_name.startswith("get_") and not self.ctx.interface.is_async:
+            wrapped_method = self._wrap_invalidate(wrapped_method)
+        self.__dict__[method_name] = wrapped_method
+        return wrapped_method
+
+    def _unbind_interface_methods(self) -> None:
+        """Remove bound methods of interface from instance of model."""
+        for method_name in self._proxy_interface._get_method_names():
+            self.__dict__.pop(method_name, None)
 
     @property
     def handle(self) -> Optional["api.Handle"]:
@@ -174,21 +406,71 @@ class BaseModel(ABC, PropertyMixin, metaclass=BaseModelRegister):
 
     @handle.setter
     def handle(self, handle: Optional["api.Handle"]) -> None:
-        """Set new handle and bind methods."""
-        if handle:
+        """Set new handle and unbind methods bound to previous handle."""
+        if handle is not None:
             logger.debug(f"Setting handle of '{self.__class__.__name__}' to '{handle}'")
         self._handle = handle
-        self._bind_interface_methods()
+        self._unbind_interface_methods()
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Remove cached value of property, or all properties, of model."""
+        if self.ctx.property_cache is not None and self.handle is not None:
+            self.ctx.property_cache.invalidate(self.handle, name)
+
+    def refresh(self) -> None:
+        """Remove all cached property values, so they are fetched on next access."""
+        self.invalidate()
+
+    @staticmethod
+    def _call_getter(property_name: str, method: Callable) -> tuple[bool, Any]:
+        """Call getter of property and return whether it succeeded with result."""
+        try:
+            return True, method()
+        except Exception as e:
+            logger.debug(f"Could not get property '{property_name}': {e}")
+            return False, None
 
-    def to_dict(self) -> dict:
-        """Return dict to represent current state of model."""
-        info = {}
-        for property_name, method in self._getters.items():
+    def to_dict(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> dict:
+        """
+        Return dict to represent current state of model.
+
+        If fields is specified, only the named properties are fetched.
+        If parallel is True, properties are fetched concurrently using
+        a pool of max_workers threads.
+        Properties which cannot be fetched are omitted.
+        """
+        if fields is None:
+            getters = self._getters
+        else:
             try:
-                info[property_name] = method()
-            except Exception:
-                pass
-        return info
+                getters = {
+                    field: self._get_method_with_prefix("get", field)
+                    for field in fields
+                }
+            except KeyError as e:
+                raise AttributeError(
+                    f"'{self.__class__.__name__}' model has no property {e}"
+                ) from None
+        if parallel and len(getters) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(self._call_getter, getters.keys(), getters.values())
+                )
+        else:
+            results = [
+                self._call_getter(property_name, method)
+                for property_name, method in getters.items()
+            ]
+        return {
+            property_name: value
+            for property_name, (success, value) in zip(getters.keys(), results)
+            if success
+        }
 
     def from_dict(self, info: dict[str, Any]) -> None:
         """
@@ -201,16 +483,16 @@ class BaseModel(ABC, PropertyMixin, metaclass=BaseModelRegister):
             model = self
             property_path = property_name.split(".")
             for part in property_path[:-1]:
-                model = model._getters[part]()
+                model = model._get_method_with_prefix("get", part)()
                 property_path.pop(0)
             property_name = property_path.pop()  # Last remaining element
             if not isinstance(model, BaseModel):
                 raise TypeError("Model must be an instance of 'BaseModel'")
             if isinstance(property_value, dict):
-                model = model._getters[property_name]()
+                model = model._get_method_with_prefix("get", property_name)()
                 model.from_dict(property_value)
             else:
-                model._setters[property_name](property_value)
+                model._get_method_with_prefix("set", property_name)(property_value)
 
     @classmethod
     def from_name(cls, model_name: str) -> Type["BaseModel"]:
@@ -1,9 +1,14 @@
+import asyncio
 import logging
+import queue
 import threading
-from collections.abc import Callable
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pprint import pformat
-from typing import Optional
+from typing import Any, Optional
 
 from vbox_api import api
 from vbox_api.constants import VBoxEventType
@@ -15,10 +20,10 @@ logger = logging.getLogger(__name__)
 class Event(BaseModel, metaclass=ModelRegister):
     """Class to handle Event attributes and methods."""
 
-    def get_model(self) -> "Event":
-        """Convert Event instance to object of class for type."""
+    def get_model(self, event_type: Optional[str] = None) -> "Event":
+        """Convert Event instance to object of class for type, if already known."""
         return self._get_model_from_value(
-            self.handle, interface_name=self.type, base_model=Event
+            self.handle, interface_name=event_type or self.type, base_model=Event
         )
 
 
@@ -29,6 +34,8 @@ class EventSource(BaseModel, metaclass=ModelRegister):
         """Intialise parent class and add attributes for event source."""
         super().__init__(*args, **kwargs)
         self._debugger: Optional[EventSourceGroup] = None
+        self._subscriptions: Optional[SubscriptionRegistry] = None
+        self._subscriptions_lock = threading.Lock()
 
     @property
     def debug(self) -> bool:
@@ -47,20 +54,105 @@ class EventSource(BaseModel, metaclass=ModelRegister):
             loop.start()
             self._debugger = EventSourceGroup(source=self, listener=listener, loop=loop)
 
+    @property
+    def subscriptions(self) -> "SubscriptionRegistry":
+        """Return registry of subscriptions to events of source."""
+        with self._subscriptions_lock:
+            if self._subscriptions is None:
+                self._subscriptions = SubscriptionRegistry(self)
+            return self._subscriptions
+
+    def subscribe(
+        self,
+        event_types: Iterable[VBoxEventType],
+        callback: Optional[Callable[[Event], None]] = None,
+        machine_id: Optional[str] = None,
+        once: bool = False,
+        **predicates,
+    ) -> "Subscription":
+        """Subscribe to events of types, matching machine ID and predicates."""
+        return self.subscriptions.subscribe(
+            event_types, callback, machine_id, once, **predicates
+        )
+
+    def wait_for(
+        self,
+        event_types: Iterable[VBoxEventType],
+        timeout: Optional[float] = None,
+        machine_id: Optional[str] = None,
+        **predicates,
+    ) -> Event:
+        """
+        Block until event of specified type is received, matching predicates.
+
+        Unlike PassiveEventListener.wait_for, events are not consumed,
+        so several threads can wait for events of the same source.
+        To avoid missing an event caused by an action, subscribe with
+        once=True before the action, then wait for its result instead.
+        """
+        subscription = self.subscribe(
+            event_types, machine_id=machine_id, once=True, **predicates
+        )
+        try:
+            return subscription.result(timeout)
+        finally:
+            subscription.cancel()
+
+    def stream(
+        self,
+        types: Iterable[VBoxEventType] = (VBoxEventType.ANY,),
+        buffer_size: int = 64,
+        timeout: Optional[float] = None,
+        timeout_ms: int = 1000,
+    ) -> "EventStream":
+        """Return asynchronous iterator of events of types from source."""
+        return EventStream(self, types, buffer_size, timeout, timeout_ms)
+
 
 class EventListener(BaseModel, metaclass=ModelRegister):
     """Class to handle EventListener attributes and methods."""
 
 
 class PassiveEventListener(EventListener):
-    """Class to passively handle events, implicitly passing the EventSource."""
+    """
+    Class to passively handle events, implicitly passing the EventSource.
+
+    If the event types registered for the listener are known, waitable
+    events are only expected for the types in WAITABLE_EVENT_TYPES.
+    """
+
+    WAITABLE_EVENT_TYPES = frozenset(
+        {
+            VBoxEventType.ANY,
+            VBoxEventType.VETOABLE,
+            VBoxEventType.ON_EXTRA_DATA_CAN_CHANGE,
+            VBoxEventType.ON_CAN_SHOW_WINDOW,
+            VBoxEventType.ON_SHOW_WINDOW,
+        }
+    )
 
     def __init__(
-        self, ctx: "api.Context", handle: "api.Handle", source: EventSource
+        self,
+        ctx: "api.Context",
+        handle: "api.Handle",
+        source: EventSource,
+        event_types: Optional[Iterable[VBoxEventType]] = None,
     ) -> None:
         """Initialise base instance and add session attribute."""
         super().__init__(ctx, handle, model_name="EventListener")
         self.source = source
+        self.event_types = (
+            frozenset(VBoxEventType(event_type) for event_type in event_types)
+            if event_types is not None
+            else None
+        )
+
+    @property
+    def may_receive_waitable(self) -> bool:
+        """Return whether listener may receive waitable events."""
+        return self.event_types is None or bool(
+            self.event_types & self.WAITABLE_EVENT_TYPES
+        )
 
     def get_event(self, timeout_ms: int = -1) -> Optional[Event]:
         """Return event from event source."""
@@ -74,21 +166,12 @@ class PassiveEventListener(EventListener):
         Passed key-word arguments will be compared to attributes of the event
         model. If all of them match, it will be returned.
         """
-        event = None
-        while not event or event.type not in event_types:
+        while True:
             event = self.get_event(-1)
-            if not event:
+            if not event or (event_type := event.get_type()) not in event_types:
                 continue
-            for key, value in kwargs.items():
-                try:
-                    event_value = getattr(event.model, key)
-                except AttributeError:
-                    event = None
-                    continue
-                if event_value != value:
-                    event = None
-                    continue
-        return event
+            if Subscription.match_predicates(event.get_model(event_type), kwargs):
+                return event
 
     @classmethod
     def from_source(
@@ -97,7 +180,7 @@ class PassiveEventListener(EventListener):
         """Return instance of passive event listener from source."""
         listener = source.create_listener()
         source.register_listener(listener, event_types, False)
-        return cls(source.ctx, listener.handle, source)
+        return cls(source.ctx, listener.handle, source, event_types)
 
     @classmethod
     def from_ctx(
@@ -108,26 +191,114 @@ class PassiveEventListener(EventListener):
         return cls.from_source(source, event_types)
 
 
+@dataclass
+class EventLoopStatistics:
+    """Dataclass to store throughput and lag statistics of event loop."""
+
+    received: int = 0
+    processed: int = 0
+    failed: int = 0
+    batches: int = 0
+    queue_depth: int = 0
+    queue_maxsize: int = 0
+    oldest_event_age: float = 0.0
+    max_lag: float = 0.0
+
+
 class EventListenerLoop(threading.Thread):
-    """Class to listen and handle events in a separate thread."""
+    """
+    Class to listen and handle events in a separate thread.
+
+    Events are drained from the event source in batches of up to
+    batch_size, waiting up to timeout_ms for the first event of each batch.
+    If workers is greater than zero, events are handed to a pool of worker
+    threads via a queue of queue_size events. When the queue is full,
+    draining blocks until workers catch up. Otherwise, events are handled
+    by the loop thread itself.
+    """
 
     def __init__(
         self,
         listener: PassiveEventListener,
         callback: Callable[[Event], None],
         daemon: bool = True,
+        timeout_ms: int = -1,
+        error_callback: Optional[Callable[[Exception], None]] = None,
+        batch_size: int = 64,
+        workers: int = 0,
+        queue_size: int = 256,
     ) -> None:
-        """Initialise event listener thread."""
+        """
+        Initialise event listener thread.
+
+        If timeout_ms is not negative, the loop can be stopped between
+        requests for events. If error_callback is specified, it is called
+        with exceptions raised while getting or handling events, instead of
+        stopping the loop.
+        """
         self.listener = listener
         self.callback = callback
+        self.timeout_ms = timeout_ms
+        self.error_callback = error_callback
+        self.batch_size = max(batch_size, 1)
         self.count = 0
         self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._statistics = EventLoopStatistics(
+            queue_maxsize=queue_size if workers > 0 else 0
+        )
+        self._queue: Optional[queue.Queue[Optional[tuple[float, Event]]]] = (
+            queue.Queue(maxsize=queue_size) if workers > 0 else None
+        )
+        self._workers = [
+            threading.Thread(target=self.work, daemon=daemon) for _ in range(workers)
+        ]
         super().__init__(target=self.loop, daemon=daemon)
 
     def _callback(self, event: Event) -> None:
         """Handle processing a passed event from event loop."""
-        self.callback(event)
-        self.count += 1
+        try:
+            self.callback(event)
+        finally:
+            self._acknowledge(event)
+        with self._lock:
+            self.count += 1
+
+    def _acknowledge(self, event: Event) -> None:
+        """Mark event as processed if waitable."""
+        # Producers of waitable events block until they are processed
+        if self.listener.may_receive_waitable and event.get_waitable():
+            self.listener.source.event_processed(self.listener, event)
+
+    def _discard(self, event: Event) -> None:
+        """Acknowledge event which will not be processed, as loop is stopped."""
+        try:
+            self._acknowledge(event)
+        except Exception as e:
+            # Listener may have been unregistered when stopping
+            logger.debug(f"Could not acknowledge discarded event: {e}")
+
+    def _process(self, received: float, event: Event) -> None:
+        """Process event received at time, recording lag and failures."""
+        with self._lock:
+            self._statistics.max_lag = max(
+                self._statistics.max_lag, time.monotonic() - received
+            )
+        try:
+            self._callback(event)
+        except Exception:
+            with self._lock:
+                self._statistics.failed += 1
+            raise
+
+    def _process_or_report(self, received: float, event: Event) -> None:
+        """Process event, passing any exception to error callback if specified."""
+        try:
+            self._process(received, event)
+        except Exception as e:
+            if self.error_callback is None:
+                raise
+            self.error_callback(e)
 
     def stop(self) -> None:
         """Set stop event to prevent additional events being processed."""
@@ -138,13 +309,101 @@ class EventListenerLoop(threading.Thread):
         """Return whether stop event has been set."""
         return self._stop_event.is_set()
 
+    @property
+    def queue_depth(self) -> int:
+        """Return number of events waiting to be handled by workers."""
+        return self._queue.qsize() if self._queue else 0
+
+    @property
+    def oldest_event_age(self) -> float:
+        """Return seconds since oldest event waiting for workers was received."""
+        if not self._queue:
+            return 0.0
+        with self._queue.mutex:
+            item = self._queue.queue[0] if self._queue.queue else None
+        return time.monotonic() - item[0] if item else 0.0
+
+    def get_statistics(self) -> EventLoopStatistics:
+        """Return snapshot of throughput and lag statistics of loop."""
+        with self._lock:
+            statistics = EventLoopStatistics(**vars(self._statistics))
+            statistics.processed = self.count
+        statistics.queue_depth = self.queue_depth
+        statistics.oldest_event_age = self.oldest_event_age
+        return statistics
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until stop event is set or timeout elapses, returning stopped."""
+        return self._stop_event.wait(timeout)
+
+    def get_events(self) -> list[Event]:
+        """Return batch of events, waiting for the first event only."""
+        events = []
+        timeout_ms = self.timeout_ms
+        while len(events) < self.batch_size and not self.stopped:
+            if not (event := self.listener.get_event(timeout_ms)):
+                break
+            events.append(event)
+            # Only drain events which are already queued by event source
+            timeout_ms = 0
+        return events
+
+    def _put(self, item: tuple[float, Event]) -> bool:
+        """Put item in queue, blocking while full unless stopped."""
+        while not self.stopped:
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
     def loop(self) -> None:
         """Handle main event loop."""
-        while not self.stopped:
-            event = self.listener.get_event(-1)
-            if not event:
+        for worker in self._workers:
+            worker.start()
+        try:
+            while not self.stopped:
+                try:
+                    events = self.get_events()
+                    if not events:
+                        continue
+                    received = time.monotonic()
+                    with self._lock:
+                        self._statistics.received += len(events)
+                        self._statistics.batches += 1
+                    for index, event in enumerate(events):
+                        if self._queue is None:
+                            self._process_or_report(received, event)
+                        elif not self._put((received, event)):
+                            for discarded in events[index:]:
+                                self._discard(discarded)
+                            break
+                except Exception as e:
+                    if self.stopped:
+                        # Listener may have been unregistered while waiting
+                        logger.debug(f"Event loop stopped: {e}")
+                        return None
+                    if self.error_callback is None:
+                        raise
+                    self.error_callback(e)
+        finally:
+            for _ in self._workers:
+                self._queue.put(None)
+
+    def work(self) -> None:
+        """Handle events from queue in worker thread until sentinel is received."""
+        while (item := self._queue.get()) is not None:
+            if self.stopped:
+                self._discard(item[1])
                 continue
-            self._callback(event)
+            try:
+                self._process(*item)
+            except Exception as e:
+                if self.error_callback is None:
+                    logger.exception(f"Failed to handle event: {e}")
+                else:
+                    self.error_callback(e)
 
 
 class DebugEventListenerLoop(EventListenerLoop):
@@ -159,10 +418,138 @@ class DebugEventListenerLoop(EventListenerLoop):
     @staticmethod
     def display_event(event: Event) -> None:
         """Output event information to standard output."""
-        data = {"event": event.to_dict(), "model": event.model.to_dict()}
+        if not logger.isEnabledFor(logging.DEBUG):
+            return None
+        data = {
+            "event": event.to_dict(parallel=True),
+            "model": event.model.to_dict(parallel=True),
+        }
         logger.debug(f"Received event of type '{event.type}':\n{pformat(data)}")
 
 
+class EventStream:
+    """
+    Asynchronous iterator of events, received by a passive event listener.
+
+    No thread is started per stream. Events are long polled for
+    timeout_ms: using an asynchronous interface, many streams can wait
+    concurrently on a single event loop; otherwise, each waiting stream
+    occupies a thread of the default executor for up to timeout_ms.
+    Up to buffer_size queued events are fetched at once and buffered,
+    while other events remain queued by the event source until requested.
+    Waitable events are marked as processed when the next event is
+    requested or the stream is closed.
+    If timeout is specified, TimeoutError is raised when no event is
+    received for that many seconds.
+    """
+
+    def __init__(
+        self,
+        source: EventSource,
+        types: Iterable[VBoxEventType] = (VBoxEventType.ANY,),
+        buffer_size: int = 64,
+        timeout: Optional[float] = None,
+        timeout_ms: int = 1000,
+    ) -> None:
+        """Initialise stream, registering its listener on first iteration."""
+        self.source = source
+        self.event_types = list(types)
+        self.buffer_size = max(buffer_size, 1)
+        self.timeout = timeout
+        self.timeout_ms = timeout_ms
+        self.listener: Optional[PassiveEventListener] = None
+        self.closed = False
+        self._buffer: deque[Event] = deque()
+        self._pending: Optional[Event] = None
+
+    @property
+    def is_async(self) -> bool:
+        """Return whether interface of source is asynchronous."""
+        return self.source.ctx.interface.is_async
+
+    async def _call(self, func: Callable, *args) -> Any:
+        """Call interface method, without blocking the event loop."""
+        if self.is_async:
+            return await func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    async def open(self) -> None:
+        """Create and register passive listener for event types."""
+        if self.closed:
+            raise RuntimeError("Event stream has been closed")
+        if self.listener is not None:
+            return None
+        listener = await self._call(self.source.create_listener)
+        await self._call(
+            self.source.register_listener, listener, self.event_types, False
+        )
+        self.listener = PassiveEventListener(
+            self.source.ctx, listener.handle, self.source, self.event_types
+        )
+
+    async def _acknowledge(self) -> None:
+        """Mark last returned event as processed, if waitable."""
+        if (event := self._pending) is None:
+            return None
+        self._pending = None
+        try:
+            if await self._call(event.get_waitable):
+                await self._call(self.source.event_processed, self.listener, event)
+        except Exception as e:
+            logger.debug(f"Could not mark event of event stream as processed: {e}")
+
+    async def close(self) -> None:
+        """Acknowledge last event, unregister listener and discard buffer."""
+        self.closed = True
+        self._buffer.clear()
+        if (listener := self.listener) is None:
+            return None
+        await self._acknowledge()
+        self.listener = None
+        try:
+            await self._call(self.source.unregister_listener, listener)
+        except Exception as e:
+            logger.debug(f"Could not unregister listener of event stream: {e}")
+
+    async def __aenter__(self) -> "EventStream":
+        """Open stream for context manager."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Close stream on leaving context manager."""
+        await self.close()
+
+    def __aiter__(self) -> "EventStream":
+        """Return stream as asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> Event:
+        """Return next event, fetching a batch of events if buffer is empty."""
+        if self.closed:
+            raise StopAsyncIteration
+        await self._acknowledge()
+        if not self._buffer:
+            await self.open()
+            async with asyncio.timeout(self.timeout):
+                while not self._buffer:
+                    await self._fill()
+        event = self._buffer.popleft()
+        if self.listener.may_receive_waitable:
+            self._pending = event
+        return event
+
+    async def _fill(self) -> None:
+        """Fetch events already queued, waiting for the first event only."""
+        timeout_ms = self.timeout_ms
+        while len(self._buffer) < self.buffer_size:
+            event = await self._call(self.listener.get_event, timeout_ms)
+            if not event:
+                break
+            self._buffer.append(event)
+            timeout_ms = 0
+
+
 @dataclass
 class EventSourceGroup:
     """Handle group of objects for an event source."""
@@ -176,3 +563,261 @@ class EventSourceGroup:
         if self.loop:
             self.loop.stop()
         self.source.unregister_listener(self.listener)
+
+
+class Subscription:
+    """
+    Class to store a subscription to events, matched by type and predicates.
+
+    Predicates are compared to attributes of the event model, which are
+    only fetched for events of matching type and machine ID.
+    If once is True, the subscription is cancelled after the first match,
+    which can be awaited using result.
+    """
+
+    MISSING = object()
+
+    def __init__(
+        self,
+        registry: "SubscriptionRegistry",
+        event_types: frozenset[VBoxEventType],
+        callback: Optional[Callable[[Event], None]] = None,
+        machine_id: Optional[str] = None,
+        once: bool = False,
+        predicates: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Initialise subscription of registry."""
+        self.registry = registry
+        self.event_types = event_types
+        self.callback = callback
+        self.machine_id = machine_id
+        self.once = once
+        self.predicates = predicates or {}
+        self.future: Future[Event] = Future()
+
+    @staticmethod
+    def match_predicates(
+        model: BaseModel,
+        predicates: dict[str, Any],
+        values: Optional[dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Return whether attributes of model match all predicates.
+
+        Fetched attributes are stored in values, so that they are shared
+        between subscriptions matching the same event.
+        """
+        values = {} if values is None else values
+        for key, value in predicates.items():
+            if key not in values:
+                try:
+                    values[key] = getattr(model, key)
+                except AttributeError:
+                    values[key] = Subscription.MISSING
+            if values[key] != value:
+                return False
+        return True
+
+    def notify(self, event: Event) -> None:
+        """Handle matched event, calling callback and setting result."""
+        if self.once:
+            if self.future.done():
+                return None
+            self.cancel()
+            self.future.set_result(event)
+        if self.callback:
+            self.callback(event)
+
+    def result(self, timeout: Optional[float] = None) -> Event:
+        """Block until an event is matched, raising TimeoutError after timeout."""
+        return self.future.result(timeout)
+
+    def cancel(self) -> None:
+        """Remove subscription from registry."""
+        self.registry.unsubscribe(self)
+
+
+@dataclass
+class SubscriptionGroup:
+    """Handle listener and subscriptions of a set of event types."""
+
+    listener: PassiveEventListener
+    loop: EventListenerLoop
+    subscriptions: dict[tuple[Optional[str], Optional[str]], list[Subscription]]
+    machine_types: set[VBoxEventType]
+
+
+class SubscriptionRegistry:
+    """
+    Class to dispatch events of a source to many subscriptions.
+
+    One passive listener and loop is registered per set of event types,
+    shared by all subscriptions to that set. Subscriptions are indexed by
+    event type and machine ID, so the machine ID of an event is only
+    fetched if a subscription of its type requires it, and predicates are
+    only compared for subscriptions matching both.
+    """
+
+    WILDCARD_EVENT_TYPES = {
+        VBoxEventType.ANY,
+        VBoxEventType.VETOABLE,
+        VBoxEventType.MACHINE_EVENT,
+        VBoxEventType.SNAPSHOT_EVENT,
+        VBoxEventType.INPUT_EVENT,
+    }
+
+    def __init__(self, source: EventSource, timeout_ms: int = 1000) -> None:
+        """Initialise registry without any listeners."""
+        self.source = source
+        self.timeout_ms = timeout_ms
+        self._groups: dict[frozenset[VBoxEventType], SubscriptionGroup] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Return number of subscriptions."""
+        with self._lock:
+            return sum(
+                len(subscriptions)
+                for group in self._groups.values()
+                for subscriptions in group.subscriptions.values()
+            )
+
+    def _get_keys(
+        self, subscription: Subscription
+    ) -> list[tuple[Optional[str], Optional[str]]]:
+        """Return index keys of subscription, by event type and machine ID."""
+        if subscription.event_types & self.WILDCARD_EVENT_TYPES:
+            return [(None, subscription.machine_id)]
+        return [
+            (event_type, subscription.machine_id)
+            for event_type in subscription.event_types
+        ]
+
+    def _create_group(self, event_types: frozenset[VBoxEventType]) -> SubscriptionGroup:
+        """Register listener for event types and start its loop."""
+        listener = PassiveEventListener.from_source(self.source, list(event_types))
+        loop = EventListenerLoop(
+            listener,
+            callback=lambda event: self.dispatch(event_types, event),
+            timeout_ms=self.timeout_ms,
+            error_callback=lambda error: self.handle_error(event_types, error),
+        )
+        group = SubscriptionGroup(listener, loop, {}, set())
+        loop.start()
+        return group
+
+    def subscribe(
+        self,
+        event_types: Iterable[VBoxEventType],
+        callback: Optional[Callable[[Event], None]] = None,
+        machine_id: Optional[str] = None,
+        once: bool = False,
+        **predicates,
+    ) -> Subscription:
+        """Add subscription, registering a listener for its types if required."""
+        event_types = frozenset(VBoxEventType(event_type) for event_type in event_types)
+        subscription = Subscription(
+            self, event_types, callback, machine_id, once, predicates
+        )
+        with self._lock:
+            if (group := self._groups.get(event_types)) is None:
+                group = self._groups[event_types] = self._create_group(event_types)
+            for key in self._get_keys(subscription):
+                group.subscriptions.setdefault(key, []).append(subscription)
+            if machine_id is not None:
+                group.machine_types.update(
+                    key[0] for key in self._get_keys(subscription)
+                )
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove subscription, unregistering listener of its types if unused."""
+        with self._lock:
+            if (group := self._groups.get(subscription.event_types)) is None:
+                return None
+            for key in self._get_keys(subscription):
+                subscriptions = group.subscriptions.get(key, [])
+                if subscription in subscriptions:
+                    subscriptions.remove(subscription)
+                if not subscriptions:
+                    group.subscriptions.pop(key, None)
+            group.machine_types = {
+                event_type
+                for event_type, machine_id in group.subscriptions
+                if machine_id is not None
+            }
+            if group.subscriptions:
+                return None
+            self._groups.pop(subscription.event_types)
+        group.loop.stop()
+        try:
+            self.source.unregister_listener(group.listener)
+        except Exception as e:
+            logger.debug(f"Could not unregister listener of subscriptions: {e}")
+
+    def close(self) -> None:
+        """Cancel all subscriptions and unregister their listeners."""
+        with self._lock:
+            subscriptions = {
+                subscription
+                for group in self._groups.values()
+                for subscriptions in group.subscriptions.values()
+                for subscription in subscriptions
+            }
+        for subscription in subscriptions:
+            subscription.cancel()
+
+    def _get_machine_id(self, model: BaseModel) -> Optional[str]:
+        """Return machine ID of event model, if it is a machine event."""
+        try:
+            return model.get_machine_id()
+        except AttributeError:
+            return None
+
+    def dispatch(self, event_types: frozenset[VBoxEventType], event: Event) -> None:
+        """Notify subscriptions to event types matching received event."""
+        event_type = event.get_type()
+        model = event.get_model(event_type)
+        with self._lock:
+            if (group := self._groups.get(event_types)) is None:
+                return None
+            requires_machine_id = bool({event_type, None} & group.machine_types)
+        # Fetch machine ID without holding lock, as it requires a request
+        machine_id = self._get_machine_id(model) if requires_machine_id else None
+        keys = [(event_type, None), (None, None)]
+        if machine_id is not None:
+            keys += [(event_type, machine_id), (None, machine_id)]
+        with self._lock:
+            # Subscriptions may be indexed by several keys matching the event
+            candidates = dict.fromkeys(
+                subscription
+                for key in keys
+                for subscription in group.subscriptions.get(key, [])
+            )
+        values = {}
+        for subscription in candidates:
+            if Subscription.match_predicates(model, subscription.predicates, values):
+                try:
+                    subscription.notify(event)
+                except Exception as e:
+                    logger.exception(f"Failed to notify subscription: {e}")
+
+    def handle_error(
+        self, event_types: frozenset[VBoxEventType], error: Exception
+    ) -> None:
+        """Register listener for event types again after an error."""
+        logger.warning(f"Listener of subscriptions failed, registering again: {error}")
+        with self._lock:
+            if (group := self._groups.get(event_types)) is None:
+                return None
+        try:
+            self.source.unregister_listener(group.listener)
+        except Exception as e:
+            logger.debug(f"Could not unregister failed listener of subscriptions: {e}")
+        try:
+            listener = PassiveEventListener.from_source(self.source, list(event_types))
+        except Exception as e:
+            logger.error(f"Could not register listener of subscriptions: {e}")
+            group.loop.wait(self.timeout_ms / 1000)
+            return None
+        group.listener = group.loop.listener = listener
@@ -2,6 +2,7 @@ import base64
 import functools
 import io
 import logging
+import os
 import time
 from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
@@ -9,7 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import IntEnum
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, BinaryIO, Callable, Optional
 
 from PIL import Image
 
@@ -28,7 +29,12 @@ from vbox_api.models.medium import Medium
 from vbox_api.models.network import NetworkAdapter
 from vbox_api.models.progress import Progress
 from vbox_api.models.session import Session
-from vbox_api.utils import image_to_data_uri, split_pascal_case, text_to_image
+from vbox_api.utils import (
+    image_to_data_uri,
+    iter_lines_reversed,
+    split_pascal_case,
+    text_to_image,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +58,20 @@ class MachineHealth(IntEnum):
     WARNING = 2
     ERROR = 3
 
+    @classmethod
+    def from_state(cls, state: Optional[str]) -> "MachineHealth":
+        """Return health for specified machine state."""
+        match state:
+            case MachineState.POWERED_OFF | MachineState.SAVED:
+                health = cls.POWERED_OFF
+            case MachineState.RUNNING:
+                health = cls.RUNNING
+            case MachineState.ABORTED:
+                health = cls.ERROR
+            case _:
+                health = cls.WARNING
+        return health
+
 
 @dataclass
 class GuestProperty:
@@ -63,9 +83,88 @@ class GuestProperty:
     flags: Optional[str]
 
 
+class RemoteLog(io.RawIOBase):
+    """
+    Binary file of machine log, read from the web service using readLog.
+
+    Used when the log folder is not accessible locally. The size of the log
+    is not exposed by the API, so it is found by probing offsets.
+    """
+
+    def __init__(self, machine: "Machine", index: int = 0) -> None:
+        """Initialise file of log with index at start."""
+        super().__init__()
+        self.machine = machine
+        self.index = index
+        self._position = 0
+        self._size: Optional[int] = None
+
+    def readable(self) -> bool:
+        """Return whether file is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return whether file supports random access."""
+        return True
+
+    def tell(self) -> int:
+        """Return current position in file."""
+        return self._position
+
+    def _read_at(self, offset: int, size: int) -> bytes:
+        """Return up to size bytes of log from offset."""
+        return self.machine.read_log(self.index, offset, size) or b""
+
+    def get_size(self) -> int:
+        """Return size of log, found by exponential then binary search."""
+        if self._size is None:
+            low, high = 0, 65536
+            while self._read_at(high - 1, 1):
+                low, high = high, high * 2
+            # Size is the smallest offset at which no data is returned
+            while low < high:
+                middle = (low + high) // 2
+                if self._read_at(middle, 1):
+                    low = middle + 1
+                else:
+                    high = middle
+            self._size = low
+        return self._size
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Change position in file, relative to whence."""
+        match whence:
+            case os.SEEK_SET:
+                position = offset
+            case os.SEEK_CUR:
+                position = self._position + offset
+            case os.SEEK_END:
+                position = self.get_size() + offset
+            case _:
+                raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """Read bytes into buffer from current position."""
+        data = self._read_at(self._position, len(buffer))
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
 class Machine(BaseModel, metaclass=ModelRegister):
     """Class to handle machine attributes and methods."""
 
+    LOG_CHUNK_SIZE = 65536
+    MAX_LOG_INDEX = 9
+    # Snapshots of machines in other states are taken by the locking session
+    ONLINE_SNAPSHOT_STATES = frozenset(
+        {MachineState.RUNNING, MachineState.PAUSED, MachineState.STUCK}
+    )
+
     def __init__(
         self,
         ctx: "api.Context",
@@ -85,7 +184,6 @@ class Machine(BaseModel, metaclass=ModelRegister):
         progress = self.launch_vm_process(self.session.handle, front_end)
         return progress
 
-    @requires_session
     def stop(self, save_state: bool = False) -> Progress:
         """
         Acquire lock and stop virtual machine.
@@ -93,24 +191,22 @@ class Machine(BaseModel, metaclass=ModelRegister):
         If save_state is True, save machine state and power down.
         """
         logger.info(f"Stopping machine '{self.name}'")
-        with self.with_lock():
+        with self.with_lock() as locked_machine:
             if save_state:
-                progress = self.session.machine.save_state()
+                progress = locked_machine.save_state()
             else:
-                progress = self.session.console.power_down()
+                progress = locked_machine.session.console.power_down()
             return progress
 
-    @requires_session
     def discard_state(self, remove_file: bool = True) -> None:
         """Acquire lock and discard saved state of machine."""
-        with self.with_lock():
-            self.session.machine.discard_saved_state(remove_file)
+        with self.with_lock() as locked_machine:
+            locked_machine.discard_saved_state(remove_file)
 
-    @requires_session
     def reset(self) -> None:
         """Acquire lock and forcefully reset machine."""
-        with self.with_lock():
-            self.session.console.reset()
+        with self.with_lock() as locked_machine:
+            locked_machine.session.console.reset()
 
     @requires_session
     def restart(self, front_end: MachineFrontend = MachineFrontend.GUI) -> Progress:
@@ -119,19 +215,37 @@ class Machine(BaseModel, metaclass=ModelRegister):
         progress.wait_for_completion(-1)
         return self.start(front_end)
 
-    @requires_session
     def pause(self) -> None:
         """Pause machine execution state."""
         logger.info(f"Pausing machine '{self.name}'")
-        with self.with_lock():
-            self.session.console.pause()
+        with self.with_lock() as locked_machine:
+            locked_machine.session.console.pause()
 
-    @requires_session
     def resume(self) -> None:
         """Resume machine execution state."""
         logger.info(f"Resuming machine '{self.name}'")
-        with self.with_lock():
-            self.session.console.resume()
+        with self.with_lock() as locked_machine:
+            locked_machine.session.console.resume()
+
+    def snapshot(
+        self, name: str, description: str = "", pause: bool = False
+    ) -> Progress:
+        """
+        Acquire lock and take snapshot of machine with specified name.
+
+        If pause is True, a running machine is paused while taking the snapshot.
+        If the machine is not running, the snapshot is taken by the session
+        locking the machine, so the lock is held until it completes, as
+        unlocking the session would abort it.
+        """
+        logger.info(f"Taking snapshot '{name}' of machine '{self.name}'")
+        with self.with_lock() as locked_machine:
+            online = locked_machine.state in self.ONLINE_SNAPSHOT_STATES
+            result = locked_machine.take_snapshot(name, description, pause)
+            progress = self._get_model_from_value(result["returnval"])
+            if not online:
+                progress.wait_for_completion(-1)
+            return progress
 
     @requires_session
     def fix_state(self) -> Progress:
@@ -147,9 +261,10 @@ class Machine(BaseModel, metaclass=ModelRegister):
     def lock(self, lock_type: LockType = LockType.SHARED) -> "Machine":
         """Lock machine and return mutable machine instance."""
         if self.session.is_locked:
-            return self.session.machine
-        self.lock_machine(self.session.handle, lock_type)
-        locked_machine = self.session.get_machine()
+            locked_machine = self.session.machine
+        else:
+            self.lock_machine(self.session.handle, lock_type)
+            locked_machine = self.session.get_machine()
         locked_machine.session = self.session
         return locked_machine
 
@@ -161,7 +276,6 @@ class Machine(BaseModel, metaclass=ModelRegister):
         self.session.unlock_machine()
 
     @contextmanager
-    @requires_session
     def with_lock(
         self,
         lock_type: LockType = LockType.SHARED,
@@ -172,17 +286,36 @@ class Machine(BaseModel, metaclass=ModelRegister):
         Lock machine in a context manager and conditionally unlock on exit.
 
         If save_settings is True, save_settings will be called before unlocking.
-        If the machine is already locked, it will not be automatically unlocked,
-        unless force_unlock is True.
+        If the machine is already locked by its session, it will not be
+        automatically unlocked, unless force_unlock is True.
+        Otherwise, a session is checked out of the session pool of the context
+        to lock the machine, and is unlocked and checked in on exit.
         """
-        unlock_on_exit = (not self.session.is_locked) or force_unlock
+        if self.session.handle is not None and self.session.is_locked:
+            locked_machine = self.lock(lock_type)
+            try:
+                yield locked_machine
+            finally:
+                if save_settings:
+                    locked_machine.save_settings()
+                if force_unlock:
+                    self.unlock()
+            return None
+        session_pool = self.ctx.session_pool
+        session = session_pool.checkout()
+        locked = False
         try:
-            yield self.lock(lock_type)
+            self.lock_machine(session.handle, lock_type)
+            locked = True
+            locked_machine = session.get_machine()
+            locked_machine.session = session
+            try:
+                yield locked_machine
+            finally:
+                if save_settings:
+                    locked_machine.save_settings()
         finally:
-            if save_settings:
-                self.session.machine.save_settings()
-            if unlock_on_exit:
-                self.unlock()
+            session_pool.checkin(session, locked=locked)
 
     @contextmanager
     def start_stop(self, delete: bool = False) -> Iterator["Machine"]:
@@ -219,15 +352,34 @@ class Machine(BaseModel, metaclass=ModelRegister):
         options: list[CloneOptions] = [],
     ) -> "Machine":
         """Clone machine to new machine with specified name."""
+        cloned_machine, progress = self.start_clone(name, groups, mode, options)
+        progress.wait_for_completion(-1)
+        self.finish_clone(cloned_machine)
+        return cloned_machine
+
+    def start_clone(
+        self,
+        name: str,
+        groups: list[str] = ["/"],
+        mode: CloneMode = CloneMode.MACHINE_STATE,
+        options: list[CloneOptions] = [],
+    ) -> tuple["Machine", Progress]:
+        """
+        Start cloning machine to new machine with specified name.
+
+        Return the unregistered machine and progress of cloning, without
+        waiting. Once completed, pass the machine to finish_clone.
+        """
         logger.info(f"Cloning machine '{self.name}' to '{name}'")
         cloned_machine = self.ctx.api.create_machine_with_defaults(
             name, groups, apply_defaults=False, register_machine=False
         )
-        progress = self.clone_to(cloned_machine, mode, options)
-        progress.wait_for_completion(-1)
+        return cloned_machine, self.clone_to(cloned_machine, mode, options)
+
+    def finish_clone(self, cloned_machine: "Machine") -> None:
+        """Save settings of cloned machine and register it."""
         cloned_machine.save_settings()
         self.ctx.api.register_machine(cloned_machine)
-        return cloned_machine
 
     @requires_session
     def teleport_to(
@@ -353,29 +505,24 @@ class Machine(BaseModel, metaclass=ModelRegister):
         return network_adapters
 
     def get_health(self) -> MachineHealth:
-        """Return tuple for health of machine in format (state, status_code)."""
-        match self.state:
-            case MachineState.POWERED_OFF | MachineState.SAVED:
-                health = MachineHealth.POWERED_OFF
-            case MachineState.RUNNING:
-                health = MachineHealth.RUNNING
-            case MachineState.ABORTED:
-                health = MachineHealth.ERROR
-            case _:
-                health = MachineHealth.WARNING
-        return health
+        """
+        Return tuple for health of machine in format (state, status_code).
+
+        If the context has a synchronised state cache, state is read from it.
+        """
+        if self.ctx.state_cache is not None:
+            if (status := self.ctx.state_cache.get_for_machine(self)) is not None:
+                return status.health
+        return MachineHealth.from_state(self.state)
 
-    @requires_session
     def get_guest_additions_status(self) -> AdditionsRunLevelType:
         """Return run level of guest additions or None."""
-        with self.with_lock():
-            if not self.session.console:
+        with self.with_lock() as locked_machine:
+            if not (console := locked_machine.session.console):
                 raise TypeError(
                     f"Machine has no available console interface (state is {self.state})"
                 )
-            status = AdditionsRunLevelType(
-                self.session.console.guest.additions_run_level
-            )
+            status = AdditionsRunLevelType(console.guest.additions_run_level)
         return status
 
     def enumerate_guest_properties_as_dataclass(
@@ -415,9 +562,21 @@ class Machine(BaseModel, metaclass=ModelRegister):
             nvram.uefi_variable_store.enroll_default_ms_signatures()
             nvram.uefi_variable_store.enroll_oracle_platform_key()
 
+    def is_log_folder_local(self) -> bool:
+        """Return whether log folder is accessible from this host."""
+        return Path(self.log_folder).is_dir()
+
     def get_log_files(self) -> list[Path]:
         """Return list of paths to log files."""
-        return [log for log in Path(self.log_folder).glob("VBox.log*")]
+        if self.is_log_folder_local():
+            return [log for log in Path(self.log_folder).glob("VBox.log*")]
+        # Filenames of logs which do not exist are returned as empty strings
+        logs = []
+        for index in range(self.MAX_LOG_INDEX + 1):
+            if not (filename := self.query_log_filename(index)):
+                break
+            logs.append(Path(filename))
+        return logs
 
     def get_log_indexes(self) -> list[int]:
         """Return list of indexes for log files."""
@@ -433,47 +592,152 @@ class Machine(BaseModel, metaclass=ModelRegister):
         with open(path, "r") as fd:
             return fd.read()
 
+    def open_log(self, index: int = 0) -> BinaryIO:
+        """
+        Return binary file of log with specified index.
+
+        If the log folder is not accessible locally, the log is read from
+        the web service in chunks of LOG_CHUNK_SIZE bytes.
+        """
+        path = Path(self.query_log_filename(index))
+        if path.is_file():
+            return open(path, "rb")
+        return io.BufferedReader(RemoteLog(self, index), self.LOG_CHUNK_SIZE)
+
+    def read_log_range(
+        self, index: int = 0, offset: int = 0, length: Optional[int] = None
+    ) -> bytes:
+        """Return up to length bytes of log from offset, else LOG_CHUNK_SIZE."""
+        with self.open_log(index) as fd:
+            fd.seek(offset)
+            return fd.read(self.LOG_CHUNK_SIZE if length is None else length)
+
+    def iter_log_chunks(
+        self, index: int = 0, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Yield chunks of log between start and stop offsets."""
+        with self.open_log(index) as fd:
+            fd.seek(start)
+            position = start
+            while stop is None or position < stop:
+                size = self.LOG_CHUNK_SIZE
+                if stop is not None:
+                    size = min(size, stop - position)
+                if not (chunk := fd.read(size)):
+                    break
+                position += len(chunk)
+                yield chunk
+
+    def iter_log_lines(self, index: int = 0, offset: int = 0) -> Iterator[str]:
+        """Yield lines of log from offset, without reading it into memory."""
+        with self.open_log(index) as fd:
+            fd.seek(offset)
+            for line in fd:
+                yield line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+    def iter_log_lines_reversed(
+        self, index: int = 0, before: Optional[int] = None
+    ) -> Iterator[tuple[int, str]]:
+        """Yield offset and content of lines of log before offset, last first."""
+        with self.open_log(index) as fd:
+            for offset, line in iter_lines_reversed(fd, before, self.LOG_CHUNK_SIZE):
+                yield offset, line.decode("utf-8", errors="replace").rstrip("\r")
+
+    def tail(self, index: int = 0, count: int = 100) -> list[str]:
+        """Return last count lines of log."""
+        lines = []
+        for position, (_, line) in enumerate(self.iter_log_lines_reversed(index)):
+            if len(lines) == count:
+                break
+            # Log ends with a newline, so ignore empty last line
+            if position or line:
+                lines.append(line)
+        return lines[::-1]
+
+    def get_log_size(self, index: int = 0) -> int:
+        """Return size of log with specified index in bytes."""
+        with self.open_log(index) as fd:
+            return fd.seek(0, os.SEEK_END)
+
     def get_state_name(self) -> str:
         """Return formatted machine state."""
         return split_pascal_case(self.state)
 
-    def get_thumbnail(self, data_uri: bool = False) -> Image.Image | str:
+    def get_thumbnail(
+        self,
+        data_uri: bool = False,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> Image.Image | str:
         """
         Return thumbnail for instance of machine.
 
+        If width and height are specified, the thumbnail is downscaled to fit
+        within them, preserving its aspect ratio.
         If data_uri is True, return base64-encoded data URI.
         """
-        image = self.get_running_screenshot() or self.get_saved_screenshot()
+        image = self.get_running_screenshot(
+            width=width, height=height
+        ) or self.get_saved_screenshot(width=width, height=height)
         if not image:
             image = text_to_image(self.name)
+            if width and height:
+                image.thumbnail((width, height))
         if data_uri:
             image = image_to_data_uri(image)
         return image
 
-    @requires_session
     def get_running_screenshot(
-        self, screen_id: int = 0, bitmap_format: str = "PNG"
+        self,
+        screen_id: int = 0,
+        bitmap_format: str = "PNG",
+        width: Optional[int] = None,
+        height: Optional[int] = None,
     ) -> Optional[Image.Image]:
-        """Return screenshot of running state for screen_id if available."""
+        """
+        Return screenshot of running state for screen_id if available.
+
+        If width and height are specified, the screenshot is downscaled by
+        the web service to fit within them, reducing the size transferred.
+        """
         try:
-            with self.with_lock():
-                info = self.session.console.display.get_screen_resolution(screen_id)
-                image_b64 = self.session.console.display.take_screen_shot_to_array(
-                    screen_id, info["width"], info["height"], bitmap_format
+            with self.with_lock() as locked_machine:
+                display = locked_machine.session.console.display
+                info = display.get_screen_resolution(screen_id)
+                scale = 1.0
+                if width and height:
+                    scale = min(width / info["width"], height / info["height"], 1.0)
+                image_b64 = display.take_screen_shot_to_array(
+                    screen_id,
+                    max(round(info["width"] * scale), 1),
+                    max(round(info["height"] * scale), 1),
+                    bitmap_format,
                 )
                 image = Image.open(io.BytesIO(base64.b64decode(image_b64)))
         except Exception:
             return None
         return image
 
-    def get_saved_screenshot(self, screen_id: int = 0) -> Optional[Image.Image]:
-        """Return screenshot of saved state for screen_id if available."""
+    def get_saved_screenshot(
+        self,
+        screen_id: int = 0,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> Optional[Image.Image]:
+        """
+        Return screenshot of saved state for screen_id if available.
+
+        If width and height are specified, the screenshot is downscaled to
+        fit within them.
+        """
         try:
             info = self.query_saved_screenshot_info(screen_id)
             image_dict = self.read_saved_screenshot_to_array(
                 screen_id, info["returnval"][0]
             )
             image = Image.open(io.BytesIO(base64.b64decode(image_dict["returnval"])))
+            if width and height:
+                image.thumbnail((width, height))
         except Exception:
             return None
         return image
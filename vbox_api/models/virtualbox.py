@@ -1,16 +1,196 @@
 import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
+from weakref import WeakKeyDictionary
 
-from vbox_api.constants import AccessMode, MediumDeviceType
+from vbox_api.constants import AccessMode, MachineFrontend, MediumDeviceType
+from vbox_api.interface.base import ProxyInterface
 from vbox_api.models.base import BaseModel, ModelRegister
-from vbox_api.models.machine import Machine
+from vbox_api.models.machine import Machine, MachineHealth
 from vbox_api.models.medium import Medium
 from vbox_api.models.platform import PlatformProperties
+from vbox_api.models.progress import Progress
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class FleetStatus:
+    """
+    Dataclass to store status of all machines in columns.
+
+    Each column is a list of property values, in the same order as machines.
+    Values which could not be fetched are None.
+    """
+
+    machines: list[Machine]
+    columns: dict[str, list[Any]]
+    timestamp: float = field(default_factory=time.monotonic)
+
+    def __len__(self) -> int:
+        """Return number of machines."""
+        return len(self.machines)
+
+    def __getitem__(self, name: str) -> list[Any]:
+        """Return column of values for property name."""
+        return self.columns[name]
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        """Yield dict of values for each machine, including the machine itself."""
+        for index, machine in enumerate(self.machines):
+            row = {name: column[index] for name, column in self.columns.items()}
+            row["machine"] = machine
+            yield row
+
+    def count_by(self, name: str) -> dict[Any, int]:
+        """Return count of machines for each value of property name."""
+        counts = Counter(self.columns[name])
+        try:
+            return dict(sorted(counts.items()))
+        except TypeError:
+            # Values cannot be ordered, such as when some are None
+            return dict(counts)
+
+
+@dataclass
+class FleetResult:
+    """
+    Dataclass to store result of an operation on a single machine.
+
+    Times are monotonic, from when the operation was started, launched
+    on the web service and finished, or None if not yet reached.
+    """
+
+    machine: Machine
+    progress: Optional[Progress] = field(default=None, repr=False)
+    error: Optional[str] = None
+    started: Optional[float] = None
+    launched: Optional[float] = None
+    finished: Optional[float] = None
+
+    @property
+    def completed(self) -> bool:
+        """Return whether operation has finished, successfully or not."""
+        return self.finished is not None
+
+    @property
+    def succeeded(self) -> bool:
+        """Return whether operation finished successfully."""
+        return self.completed and self.error is None
+
+    @property
+    def launch_time(self) -> Optional[float]:
+        """Return seconds taken to launch operation, if launched."""
+        if self.started is None or self.launched is None:
+            return None
+        return self.launched - self.started
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Return seconds taken to finish operation, if finished."""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+class FleetOperation:
+    """
+    Run an operation on many machines concurrently.
+
+    The action is called for each machine by a pool of concurrency threads,
+    opening the session of each machine in parallel. Returned progress
+    objects are then polled together, rather than blocking a thread per
+    machine, until all have completed or the timeout elapses.
+    """
+
+    def __init__(
+        self,
+        machines: Iterable[Machine],
+        action: Callable[[Machine], Optional[Progress]],
+        description: str = "",
+        concurrency: int = 8,
+        poll_interval: float = 0.5,
+    ) -> None:
+        """Initialise operation of action for machines."""
+        self.machines = list(machines)
+        self.action = action
+        self.description = description
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+
+    def _launch(self, machine: Machine) -> FleetResult:
+        """Call action for machine and return result, completed if no progress."""
+        result = FleetResult(machine, started=time.monotonic())
+        try:
+            result.progress = self.action(machine)
+        except Exception as e:
+            logger.error(f"Could not launch '{self.description}' of machine: {e}")
+            result.error = str(e)
+        result.launched = time.monotonic()
+        if result.progress is None:
+            result.finished = result.launched
+        return result
+
+    def _poll(self, result: FleetResult) -> None:
+        """Fetch completion of progress of result, storing any error."""
+        progress = result.progress
+        try:
+            if not progress.get_completed():
+                return None
+            if result_code := progress.get_result_code():
+                try:
+                    result.error = progress.get_error_info().get_text()
+                except Exception:
+                    result.error = f"Operation failed with result code {result_code}"
+        except Exception as e:
+            result.error = str(e)
+        result.finished = time.monotonic()
+
+    def launch(self) -> list[FleetResult]:
+        """Call action for all machines concurrently, without waiting."""
+        logger.info(f"Launching '{self.description}' of {len(self.machines)} machines")
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return list(executor.map(self._launch, self.machines))
+
+    def wait(
+        self, results: list[FleetResult], timeout: Optional[float] = None
+    ) -> list[FleetResult]:
+        """
+        Poll progress of results until all have completed and return them.
+
+        If timeout elapses, pending results are marked as failed.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while pending := [result for result in results if not result.completed]:
+                list(executor.map(self._poll, pending))
+                if all(result.completed for result in pending):
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    for result in pending:
+                        if not result.completed:
+                            result.error = "Timed out waiting for operation"
+                            result.finished = time.monotonic()
+                    break
+                time.sleep(self.poll_interval)
+        failed = sum(1 for result in results if not result.succeeded)
+        logger.info(
+            f"Finished '{self.description}' of {len(results)} machines"
+            f" with {failed} failures"
+        )
+        return results
+
+    def run(self, timeout: Optional[float] = None) -> list[FleetResult]:
+        """Launch operation for all machines and wait until completed."""
+        return self.wait(self.launch(), timeout)
+
+
 class VirtualBox(BaseModel, metaclass=ModelRegister):
     """
     Class to handle VirtualBox attributes and methods.
@@ -18,6 +198,26 @@ class VirtualBox(BaseModel, metaclass=ModelRegister):
     This model is the main entry-point of the API.
     """
 
+    FLEET_STATUS_FIELDS = (
+        "name",
+        "id",
+        "state",
+        "health",
+        "groups",
+        "last_state_change",
+    )
+
+    # Names of finder methods by model name, per proxy interface and model class
+    _finder_tables: WeakKeyDictionary[ProxyInterface, dict[type, dict[str, str]]] = (
+        WeakKeyDictionary()
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise instance of model with empty cache of fleet statuses."""
+        super().__init__(*args, **kwargs)
+        self._fleet_status_lock = threading.Lock()
+        self._fleet_statuses: dict[tuple[str, ...], FleetStatus] = {}
+
     def login(self, username: str, password: str, force: bool = False) -> bool:
         """
         Login with specified username and password.
@@ -30,33 +230,116 @@ class VirtualBox(BaseModel, metaclass=ModelRegister):
             self.handle = self.ctx.get_handle(
                 self.ctx.interface.WebsessionManager.logon(username, password)
             )
-            return True
+            self.ctx.interface.set_api_version(self.api_version)
         except Exception:
             return False
+        self._update_proxy_interface()
+        return True
+
+    def _update_proxy_interface(self) -> None:
+        """Use proxy registered again if interface reconnected for API version."""
+        proxy_interface = self.ctx.interface.get_interface(self._interface_name)
+        if proxy_interface is not self._proxy_interface:
+            self._unbind_interface_methods()
+            self._proxy_interface = proxy_interface
 
     def logout(self) -> None:
         """Logout current session."""
         self.ctx.interface.WebsessionManager.logoff(self.handle)
+        self.ctx.interface_names.clear()
+        # Sessions and other handles are released by logging off
+        self.ctx.session_pool.clear(release=False)
+        self.ctx.reference_tracker.clear()
+        self.ctx.reference_tracker.stop()
         self.handle = None
 
+    def _get_finder_table(self) -> dict[str, str]:
+        """
+        Return names of finder methods by normalised model name.
+
+        The table is computed once per model class and proxy interface.
+        """
+        tables = self._finder_tables.setdefault(self._proxy_interface, {})
+        if (table := tables.get(self.__class__)) is None:
+            table = {}
+            for method_name in self._get_method_names():
+                if not method_name.startswith("find"):
+                    continue
+                model_name = (
+                    method_name.split("_by_")[0].replace("_", "").removeprefix("find")
+                )
+                table.setdefault(model_name.casefold(), method_name)
+            tables[self.__class__] = table
+        return table
+
     def find_model(self, model_name: str, name_or_id: str) -> Optional[BaseModel]:
         """Call appropriate method to find model_name from name_or_id."""
         model_name = model_name.replace("_", "")
-        for method_name, method in self._methods.items():
-            method_name = (
-                method_name.split("_by_")[0].replace("_", "").removeprefix("find")
-            )
-            if method_name.casefold() == model_name.casefold():
-                break
-        else:
-            raise ValueError(
-                f"Model name '{model_name}' has no finder method"
-            ) from None
+        method_name = self._get_finder_table().get(model_name.casefold())
+        if method_name is None:
+            raise ValueError(f"Model name '{model_name}' has no finder method")
         try:
-            return method(name_or_id)
+            return getattr(self, method_name)(name_or_id)
         except Exception:
             return None
 
+    def get_fleet_status(
+        self,
+        fields: Iterable[str] = FLEET_STATUS_FIELDS,
+        max_age: float = 2.0,
+        max_workers: int = 16,
+    ) -> FleetStatus:
+        """
+        Return status of all machines, with a column for each field.
+
+        Properties of all machines are fetched concurrently by a pool of
+        max_workers threads. The health field is derived from state.
+        Statuses are cached for max_age seconds for the same fields.
+        If the context has a synchronised state cache which mirrors all
+        fields, statuses are read from it instead.
+        """
+        fields = tuple(fields)
+        state_cache = self.ctx.state_cache
+        if (
+            state_cache is not None
+            and state_cache.synced
+            and set(fields) <= {*state_cache.FIELDS, "health"}
+        ):
+            return state_cache.get_fleet_status(fields)
+        with self._fleet_status_lock:
+            status = self._fleet_statuses.get(fields)
+            if status is not None and time.monotonic() - status.timestamp <= max_age:
+                return status
+            status = self._create_fleet_status(fields, max_workers)
+            self._fleet_statuses[fields] = status
+        return status
+
+    def _create_fleet_status(
+        self, fields: tuple[str, ...], max_workers: int
+    ) -> FleetStatus:
+        """Fetch properties of all machines concurrently into columns."""
+        machines = self.machines
+        names = list(dict.fromkeys(field for field in fields if field != "health"))
+        if "health" in fields and "state" not in names:
+            names.append("state")
+        getters = [
+            (name, getattr(machine, machine._get_method_names_with_prefix("get")[name]))
+            for machine in machines
+            for name in names
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda item: self._call_getter(*item), getters))
+        columns: dict[str, list[Any]] = {name: [] for name in names}
+        for (name, _), (success, value) in zip(getters, results):
+            columns[name].append(value if success else None)
+        if "health" in fields:
+            columns["health"] = [
+                MachineHealth.from_state(state) for state in columns["state"]
+            ]
+        return FleetStatus(
+            machines, {name: columns[name] for name in fields}, time.monotonic()
+        )
+
     def get_guest_os_type_ids(self) -> set[str]:
         """Return set of guest OS type IDs."""
         return {os_type.id for os_type in self.guest_os_types}
@@ -115,7 +398,14 @@ class VirtualBox(BaseModel, metaclass=ModelRegister):
         return list(set(mediums))
 
     def find_medium(self, name_or_id: str) -> Optional[Medium]:
-        """Return a Medium object matching the specified name or ID, or None."""
+        """
+        Return a Medium object matching the specified name or ID, or None.
+
+        If the context has a medium index, it is searched instead, also
+        matching the location of mediums.
+        """
+        if self.ctx.medium_index is not None:
+            return self.ctx.medium_index.get(name_or_id)
         for medium in self.get_mediums(include_children=True):
             if name_or_id in (medium.name, medium.id):
                 return medium
@@ -155,3 +445,73 @@ class VirtualBox(BaseModel, metaclass=ModelRegister):
     def get_platform_properties_for_system_architecture(self) -> PlatformProperties:
         """Return platform properties for current system architecture."""
         return self.get_platform_properties(self.host.architecture)
+
+    def run_fleet_operation(
+        self,
+        machines: Iterable[Machine],
+        action: Callable[[Machine], Optional[Progress]],
+        description: str = "",
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+        wait: bool = True,
+    ) -> list[FleetResult]:
+        """
+        Call action for machines concurrently and return result of each machine.
+
+        If wait is False, return once all operations have been launched,
+        with the progress of each pending operation.
+        """
+        operation = FleetOperation(machines, action, description, concurrency)
+        return operation.run(timeout) if wait else operation.launch()
+
+    def start_machines(
+        self,
+        machines: Iterable[Machine],
+        front_end: MachineFrontend = MachineFrontend.GUI,
+        **kwargs,
+    ) -> list[FleetResult]:
+        """Start machines concurrently with specified front_end."""
+        return self.run_fleet_operation(
+            machines, lambda machine: machine.start(front_end), "start", **kwargs
+        )
+
+    def stop_machines(
+        self, machines: Iterable[Machine], save_state: bool = False, **kwargs
+    ) -> list[FleetResult]:
+        """Stop machines concurrently, optionally saving their state."""
+        return self.run_fleet_operation(
+            machines, lambda machine: machine.stop(save_state), "stop", **kwargs
+        )
+
+    def pause_machines(
+        self, machines: Iterable[Machine], **kwargs
+    ) -> list[FleetResult]:
+        """Pause execution of machines concurrently."""
+        return self.run_fleet_operation(machines, Machine.pause, "pause", **kwargs)
+
+    def resume_machines(
+        self, machines: Iterable[Machine], **kwargs
+    ) -> list[FleetResult]:
+        """Resume execution of machines concurrently."""
+        return self.run_fleet_operation(machines, Machine.resume, "resume", **kwargs)
+
+    def snapshot_machines(
+        self,
+        machines: Iterable[Machine],
+        name: str,
+        description: str = "",
+        pause: bool = False,
+        **kwargs,
+    ) -> list[FleetResult]:
+        """
+        Take snapshots of machines concurrently with specified name.
+
+        Snapshots of machines which are not running are launched once they
+        complete, as their sessions must remain locked until then.
+        """
+        return self.run_fleet_operation(
+            machines,
+            lambda machine: machine.snapshot(name, description, pause),
+            "snapshot",
+            **kwargs,
+        )
@@ -1,12 +1,14 @@
 """Collection of miscellaneous functions to use within project."""
 
 import base64
+import os
 import re
 import socket
+from collections.abc import Iterator
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -97,7 +99,45 @@ def split_pascal_case(text: str, separator: str = " ") -> str:
     )
 
 
+ANSI_PATTERN = re.compile(r"(?:\x1B[@-_]|[\x80-\x9F])[0-?]*[ -/]*[@-~]")
+
+
 def strip_ansi(text: str) -> str:
     """Strip ANSI escape codes from text."""
-    pattern = re.compile(r"(?:\x1B[@-_]|[\x80-\x9F])[0-?]*[ -/]*[@-~]")
-    return pattern.sub("", text)
+    return ANSI_PATTERN.sub("", text)
+
+
+def iter_lines_reversed(
+    fd: BinaryIO, end: Optional[int] = None, block_size: int = 65536
+) -> Iterator[tuple[int, bytes]]:
+    """
+    Yield offset and content of lines of file before end, from last to first.
+
+    The file is read backwards in blocks of block_size bytes, so memory use
+    is independent of the size of the file. The offset of a yielded line
+    can be passed as end to continue with the lines before it.
+    """
+    size = fd.seek(0, os.SEEK_END)
+    if end is None or end > size:
+        position = size
+    elif end > 0:
+        # Exclude newline terminating the line before end
+        position = end - 1
+    else:
+        return None
+    buffer_end = position
+    buffer = b""
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        fd.seek(position)
+        buffer = fd.read(read_size) + buffer
+        lines = buffer.split(b"\n")
+        # First line may continue in previous block
+        buffer = lines.pop(0)
+        for line in reversed(lines):
+            start = buffer_end - len(line)
+            yield start, line
+            buffer_end = start - 1
+    if size:
+        yield 0, buffer